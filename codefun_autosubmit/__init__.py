@@ -11,6 +11,7 @@ __email__ = "nktrungkien@protonmail.com"
 
 from .core.browser import setup_driver, login_to_codefun
 from .core.submission import SubmissionManager, Query
+from .core.http import CodefunClient
 from .core.utils import get_extension, get_language, get_accepted_problems
 from .scripts.auto_submit import main as auto_submit_main
 from .scripts.batch_submit import main as batch_submit_main
@@ -21,6 +22,7 @@ __all__ = [
     "login_to_codefun", 
     "SubmissionManager",
     "Query",
+    "CodefunClient",
     "get_extension",
     "get_language",
     "get_accepted_problems",
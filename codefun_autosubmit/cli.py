@@ -6,6 +6,11 @@ from .core.utils import load_config
 from .scripts.auto_submit import main as auto_submit
 from .scripts.batch_submit import main as batch_submit
 from .scripts.fetch_ac import main as fetch_ac
+from .scripts.export import main as export
+from .scripts.daemon import main as daemon
+from .scripts.burst import main as burst
+from .scripts.watch import main as watch
+from .scripts.status import main as status
 
 
 def main():
@@ -28,6 +33,17 @@ def main():
         '--input-folder',
         help='Folder containing files to submit (overrides PATH_TO_FOLDER env var)'
     )
+    auto_parser.add_argument(
+        '--backend',
+        choices=['selenium', 'http'],
+        default='selenium',
+        help='Submission backend: drive Chrome or post over HTTP (default: selenium)'
+    )
+    auto_parser.add_argument(
+        '--prejudge',
+        action='store_true',
+        help='Compile and run files against local samples first; failing files need confirmation'
+    )
     
     # Batch submit command
     batch_parser = subparsers.add_parser('batch', help='Submit all files in folder')
@@ -40,6 +56,32 @@ def main():
         action='store_true',
         help='Skip all submitted problems (not only AC problems)'
     )
+    batch_parser.add_argument(
+        '--backend',
+        choices=['selenium', 'http'],
+        default='selenium',
+        help='Submission backend: drive Chrome or post over HTTP (default: selenium)'
+    )
+    batch_parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Continue the persistent queue from the last run without rescanning the folder'
+    )
+    batch_parser.add_argument(
+        '--enqueue-only',
+        action='store_true',
+        help='Add files to the persistent queue without submitting them'
+    )
+    batch_parser.add_argument(
+        '--offline',
+        action='store_true',
+        help='Decide what to skip from the local history without asking Codefun'
+    )
+    batch_parser.add_argument(
+        '--prejudge',
+        action='store_true',
+        help='Compile and run files against local samples first; failing files need confirmation'
+    )
     
     # Fetch AC command
     fetch_parser = subparsers.add_parser('fetch', help='Fetch accepted submissions')
@@ -47,6 +89,142 @@ def main():
         '--crawl-folder',
         help='Folder to save crawled submissions (overrides CRAWL_FOLDER env var)'
     )
+    fetch_parser.add_argument(
+        '--workers',
+        type=int,
+        help='Browsers (selenium) or concurrent requests (http) fetching in parallel (default: 1 / 8)'
+    )
+    fetch_parser.add_argument(
+        '--backend',
+        choices=['selenium', 'http'],
+        default='selenium',
+        help='Scrape submission pages in Chrome or download sources over HTTP (default: selenium)'
+    )
+    fetch_parser.add_argument(
+        '--full',
+        action='store_true',
+        help='Fetch every accepted submission again, ignoring the crawl folder manifest'
+    )
+    fetch_parser.add_argument(
+        '--all-languages',
+        action='store_true',
+        help='Save accepted submissions in every language, each under its own extension'
+    )
+    fetch_parser.add_argument(
+        '--archive',
+        nargs='?',
+        const='',
+        metavar='FILE',
+        help='Store sources in one archive file instead of one file per problem '
+             '(default FILE: codefun-sources.db in the crawl folder)'
+    )
+    
+    # Export command
+    export_parser = subparsers.add_parser('export', help='Expand a fetch archive into plain files')
+    export_parser.add_argument(
+        'problems',
+        nargs='*',
+        help='Problem codes to export (default: all)'
+    )
+    export_parser.add_argument(
+        '--archive',
+        metavar='FILE',
+        help='Archive to export (default: codefun-sources.db in the crawl folder)'
+    )
+    export_parser.add_argument(
+        '--output-folder',
+        help='Folder to write files to (overrides CRAWL_FOLDER env var)'
+    )
+    
+    # Daemon command
+    daemon_parser = subparsers.add_parser('daemon', help='Keep logged-in browsers warm for other commands')
+    daemon_parser.add_argument(
+        '--drivers',
+        type=int,
+        default=1,
+        help='Number of warm browsers to keep (default: 1)'
+    )
+    daemon_parser.add_argument(
+        '--port',
+        type=int,
+        default=8765,
+        help='Localhost port to listen on (default: 8765)'
+    )
+    daemon_parser.add_argument(
+        '--stop',
+        action='store_true',
+        help='Stop the running daemon'
+    )
+    
+    # Burst command
+    burst_parser = subparsers.add_parser('burst', help='Prepare submissions and fire them at a set time')
+    burst_parser.add_argument(
+        '--at',
+        required=True,
+        help='Start time, HH:MM[:SS] or ISO datetime'
+    )
+    burst_parser.add_argument(
+        '--tasks',
+        nargs='+',
+        required=True,
+        help='List of problem IDs to submit'
+    )
+    burst_parser.add_argument(
+        '--input-folder',
+        help='Folder containing files to submit (overrides PATH_TO_FOLDER env var)'
+    )
+    burst_parser.add_argument(
+        '--backend',
+        choices=['selenium', 'http'],
+        default='selenium',
+        help='Submission backend: drive Chrome or post over HTTP (default: selenium)'
+    )
+    
+    # Watch command
+    watch_parser = subparsers.add_parser('watch', help='Submit solutions whenever they are saved')
+    watch_parser.add_argument(
+        '--input-folder',
+        help='Folder to watch (overrides PATH_TO_FOLDER env var)'
+    )
+    watch_parser.add_argument(
+        '--backend',
+        choices=['selenium', 'http'],
+        default='selenium',
+        help='Submission backend: drive Chrome or post over HTTP (default: selenium)'
+    )
+    watch_parser.add_argument(
+        '--debounce',
+        type=float,
+        help='Seconds a file must stay unchanged before it is submitted (default: 1.5)'
+    )
+    
+    # Status command
+    status_parser = subparsers.add_parser('status', help='Show progress from the local history (offline)')
+    status_parser.add_argument(
+        '--sync',
+        action='store_true',
+        help='Refresh stats from Codefun first'
+    )
+    status_parser.add_argument(
+        '--unsolved',
+        action='store_true',
+        help='List attempted problems without AC'
+    )
+    status_parser.add_argument(
+        '--partial',
+        action='store_true',
+        help='List problems with a partial score'
+    )
+    status_parser.add_argument(
+        '--problem',
+        help='Show every known submission of a problem code, e.g. P01234'
+    )
+    status_parser.add_argument(
+        '--recent',
+        type=int,
+        default=10,
+        help='Number of recent verdicts to show (default: 10)'
+    )
     
     # Setup command
     setup_parser = subparsers.add_parser('setup', help='Setup configuration')
@@ -60,15 +238,32 @@ def main():
     load_config()
     
     if args.command == 'auto':
-        # Override tasks if provided
-        if args.tasks != ['001']:
-            from .scripts.auto_submit import tasks
-            tasks[:] = args.tasks
-        auto_submit(input_folder=args.input_folder)
+        auto_submit(input_folder=args.input_folder, backend=args.backend, tasks=args.tasks,
+                    prejudge=args.prejudge)
     elif args.command == 'batch':
-        batch_submit(input_folder=args.input_folder, skip_submitted=args.skip_submitted)
+        batch_submit(
+            input_folder=args.input_folder,
+            skip_submitted=args.skip_submitted,
+            backend=args.backend,
+            resume=args.resume,
+            enqueue_only=args.enqueue_only,
+            prejudge=args.prejudge,
+            offline=args.offline,
+        )
     elif args.command == 'fetch':
-        fetch_ac(crawl_folder=args.crawl_folder)
+        fetch_ac(crawl_folder=args.crawl_folder, workers=args.workers, backend=args.backend,
+                 full=args.full, all_languages=args.all_languages, archive=args.archive)
+    elif args.command == 'export':
+        export(archive=args.archive, output_folder=args.output_folder, problems=args.problems or None)
+    elif args.command == 'daemon':
+        daemon(drivers=args.drivers, port=args.port, stop=args.stop)
+    elif args.command == 'burst':
+        burst(args.at, args.tasks, input_folder=args.input_folder, backend=args.backend)
+    elif args.command == 'watch':
+        watch(input_folder=args.input_folder, backend=args.backend, debounce=args.debounce)
+    elif args.command == 'status':
+        status(sync=args.sync, unsolved=args.unsolved, partial=args.partial, problem=args.problem,
+               recent=args.recent)
     elif args.command == 'setup':
         setup_configuration()
 
@@ -122,6 +317,10 @@ def setup_configuration():
         chromedriverpath = input(
             "What is the path to your chromedriver.exe file?\n")
     
+    fast_profile = input(
+        "Use the fast browser profile? (headless, images/fonts/CSS blocked) (y/n, default: n)\n").lower()
+    driver_profile = "fast" if fast_profile in ["y", "yes"] else "full"
+    
     env_path = get_config_path()
     with open(env_path, "w") as f:
         f.write(f"CF_USERNAME = {username}\n")
@@ -132,6 +331,7 @@ def setup_configuration():
         f.write(f"SUBMIT_WAIT_TIME = {wait_time}\n")
         f.write(f"SUBMIT_RANDOM_RANGE = {random_range}\n")
         f.write(f"CHROME_PATH = {chromedriverpath}\n")
+        f.write(f"DRIVER_PROFILE = {driver_profile}\n")
     
     print(f"Configuration saved to: {env_path}")
     print("Success")
@@ -2,7 +2,11 @@
 
 from .browser import setup_driver, login_to_codefun, load_page
 from .submission import SubmissionManager, Query
+from .http import CodefunClient
+from .daemon import open_manager
+from .pipeline import AsyncSubmissionManager, SubmissionPipeline
 from .utils import get_extension, get_language, get_accepted_problems, get_loop_list
+from .workspace import WorkspaceIndex
 
 __all__ = [
     "setup_driver",
@@ -10,8 +14,13 @@ __all__ = [
     "load_page", 
     "SubmissionManager",
     "Query",
+    "CodefunClient",
+    "open_manager",
+    "AsyncSubmissionManager",
+    "SubmissionPipeline",
     "get_extension",
     "get_language",
     "get_accepted_problems",
     "get_loop_list",
+    "WorkspaceIndex",
 ]
\ No newline at end of file
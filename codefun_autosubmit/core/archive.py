@@ -0,0 +1,119 @@
+"""Single-file SQLite archive of fetched sources."""
+
+import os
+import sqlite3
+import threading
+import time
+from .source_hashes import code_digest
+from .utils import get_extension
+
+
+ARCHIVE_NAME = "codefun-sources.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    problem_code TEXT PRIMARY KEY,
+    submission_id INTEGER NOT NULL,
+    language TEXT NOT NULL,
+    extension TEXT NOT NULL,
+    code TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+"""
+
+
+def get_archive_path(crawl_folder):
+    """Default archive path inside a crawl folder."""
+    return os.path.join(crawl_folder, ARCHIVE_NAME)
+
+
+class SourceArchive:
+    """Keep one accepted source per problem in a single indexed file.
+
+    Each fetched source is committed as it arrives, so an interrupted fetch
+    keeps everything saved so far, and the stored submission IDs tell which
+    problems a later fetch still has to download.
+    """
+
+    def __init__(self, path):
+        """Open (creating if needed) an archive file."""
+        self.path = path
+        self.db = sqlite3.connect(str(path), timeout=30, isolation_level=None,
+                                  check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self.lock = threading.Lock()
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        """Close the archive."""
+        with self.lock:
+            self.db.close()
+
+    def put(self, submission_id, problem_code, language, code):
+        """Store the source of a problem's accepted submission.
+
+        A problem's row is only replaced by a different submission.
+
+        Returns the member name, {problem_code}.{ext}.
+        """
+        extension = get_extension(language)
+        with self.lock:
+            self.db.execute(
+                "INSERT INTO sources (problem_code, submission_id, language, extension, code, "
+                "sha256, fetched_at) VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (problem_code) DO UPDATE SET submission_id = excluded.submission_id, "
+                "language = excluded.language, extension = excluded.extension, code = excluded.code, "
+                "sha256 = excluded.sha256, fetched_at = excluded.fetched_at "
+                "WHERE sources.submission_id != excluded.submission_id",
+                (problem_code, submission_id, language, extension, code, code_digest(code), time.time()),
+            )
+        return f"{problem_code}.{extension}"
+
+    def put_file(self, submission_id, problem_code, language, path):
+        """Store a source file, then remove it."""
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            name = self.put(submission_id, problem_code, language, f.read())
+        os.remove(path)
+        return name
+
+    def get(self, problem_code):
+        """Row of a problem (submission_id, language, extension, code, ...), or None."""
+        with self.lock:
+            row = self.db.execute("SELECT * FROM sources WHERE problem_code = ?",
+                                  (problem_code,)).fetchone()
+        return dict(row) if row else None
+
+    def pending(self, submissions):
+        """[submission_id, problem_code] pairs not yet in the archive."""
+        with self.lock:
+            stored = dict(self.db.execute("SELECT problem_code, submission_id FROM sources").fetchall())
+        return [pair for pair in submissions if stored.get(pair[1]) != pair[0]]
+
+    def problems(self):
+        """Problem codes in the archive."""
+        with self.lock:
+            return [row[0] for row in self.db.execute(
+                "SELECT problem_code FROM sources ORDER BY problem_code").fetchall()]
+
+    def export(self, folder, problem_codes=None):
+        """Write sources as plain {problem_code}.{ext} files.
+
+        Args:
+            folder: Output folder (created if needed)
+            problem_codes: Only export these problems (all if None)
+
+        Returns the number of files written.
+        """
+        os.makedirs(folder, exist_ok=True)
+        written = 0
+        for problem_code in problem_codes if problem_codes is not None else self.problems():
+            row = self.get(problem_code)
+            if row is None:
+                continue
+            with open(os.path.join(folder, f"{problem_code}.{row['extension']}"), "w",
+                      encoding="utf-8") as f:
+                f.write(row["code"])
+            written += 1
+        return written
@@ -1,29 +1,102 @@
 """Core browser automation functionality."""
 
 import os
+import warnings
 from selenium import webdriver
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.chrome.service import Service
 from os import getenv
-from .utils import load_config
+from .session import SessionStore, restore_browser_session, save_browser_session
+from .utils import get_base_url, get_config_dir, load_config
+from .waits import wait_for, wait_for_any
 
 
-def setup_driver():
-    """Setup and return Chrome WebDriver instance."""
+# Assets the automation never looks at
+BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.css",
+    "*google-analytics.com*", "*googletagmanager.com*",
+]
+
+DRIVER_PROFILES = {
+    "full": {
+        "headless": False,
+        "page_load_strategy": "normal",
+        "block_resources": False,
+    },
+    "fast": {
+        "headless": True,
+        "page_load_strategy": "eager",
+        "block_resources": True,
+    },
+}
+
+
+def get_profile_dir(slot=0):
+    """Get the Chrome profile directory from CHROME_PROFILE_DIR, if enabled.
+
+    "default" selects a profile folder inside the config folder; any other
+    non-empty value is used as the profile path itself. Chrome locks a
+    profile while it runs, so browsers after the first one (slot 1, 2, ...)
+    each get a sibling folder with the slot number appended.
+    """
     load_config()
-    chrome_path = getenv("CHROME_PATH", "chromedriver.exe")
+    profile_dir = getenv("CHROME_PROFILE_DIR", "")
+    if not profile_dir:
+        return None
+    if profile_dir.lower() == "default":
+        profile_dir = str(get_config_dir() / "chrome-profile")
+    return f"{profile_dir}-{slot + 1}" if slot else profile_dir
+
+
+def setup_driver(restore_session=True, profile=None, slot=0):
+    """Setup and return Chrome WebDriver instance.
+
+    Args:
+        restore_session: Restore the login saved by a previous run, if any
+        profile: "fast" (headless, eager load, assets blocked) or "full"
+            (visible browser); defaults to the DRIVER_PROFILE env var
+        slot: Which of several browsers running at once this is, so each
+            gets its own CHROME_PROFILE_DIR folder
+    """
+    load_config()
+    chrome_path = getenv("CHROME_PATH", "")
+    profile_dir = get_profile_dir(slot)
+    profile = profile or getenv("DRIVER_PROFILE", "full")
+    if profile not in DRIVER_PROFILES:
+        raise Exception(f"Unknown driver profile: {profile}")
+    settings = DRIVER_PROFILES[profile]
     
     options = webdriver.ChromeOptions()
     # Ignore Bluetooth error messages
     options.add_experimental_option('excludeSwitches', ['enable-logging'])
+    options.page_load_strategy = settings["page_load_strategy"]
+    if settings["headless"]:
+        options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-extensions")
+        options.add_argument("--window-size=1280,1024")
+    if profile_dir:
+        options.add_argument(f"--user-data-dir={profile_dir}")
     
     # Selenium 4+ uses Selenium Manager automatically
     # Only use executable_path if explicitly provided and not "NA"
     if chrome_path and chrome_path.lower() != "na":
-        driver = webdriver.Chrome(options=options)
+        driver = webdriver.Chrome(service=Service(executable_path=chrome_path), options=options)
     else:
         driver = webdriver.Chrome(options=options)
+
+    if settings["block_resources"]:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+
+    # A persistent profile keeps its own cookies, no need to restore them
+    if restore_session and not profile_dir:
+        restore_browser_session(driver, get_base_url())
     
     return driver
 
@@ -35,10 +108,8 @@ def login_to_codefun(driver):
     password = getenv("CF_PASSWORD")
 
     try:
-        form_user = driver.find_element(By.XPATH, "//input[@placeholder = 'Username']")
-        form_pass = driver.find_element(By.XPATH, "//input[@placeholder = 'Password']")
-        form_login = driver.find_element(By.XPATH, "//button[@type = 'submit']")
-    except:
+        form_user, form_pass, form_login = wait_for(driver, "login_form")
+    except TimeoutException:
         return "Error"
 
     form_user.send_keys(username)
@@ -48,7 +119,74 @@ def login_to_codefun(driver):
     return "Success"
 
 
-def load_page(driver, url, wait_time):
-    """Load a page and wait for specified time."""
+def ensure_login(driver, ready=None, store=None):
+    """Login only if the session is missing or has expired.
+
+    Args:
+        driver: Selenium WebDriver on a freshly loaded page
+        ready: Name of the wait condition that marks the page as usable;
+            returns as soon as either it or the login form shows up. Without
+            it, the page counts as logged in once the login form has not
+            shown up within its timeout
+        store: SessionStore to save the session to after a fresh login
+    """
+    if ready:
+        try:
+            state, _ = wait_for_any(driver, [ready, "login_form"])
+        except TimeoutException:
+            return "Error"
+        if state == ready:
+            return "Success"
+    else:
+        # The form may render after the page loads, so its absence only
+        # counts once it has had its full timeout to show up
+        try:
+            wait_for(driver, "login_form")
+        except TimeoutException:
+            return "Success"
+
+    if login_to_codefun(driver) != "Success":
+        return "Error"
+
+    try:
+        wait_for(driver, "logged_in")
+    except TimeoutException:
+        return "Error"
+
+    # After a fresh login the session is saved so the next run starts authenticated
+    save_browser_session(driver, store or SessionStore("browser"))
+    return "Success"
+
+
+def set_field_value(driver, element, value):
+    """Fill an input or textarea directly, without going through the clipboard.
+
+    The native value setter is used so frameworks that track the field
+    (React) see the change, then input/change events are fired.
+    """
+    driver.execute_script(
+        "var el = arguments[0];"
+        "var proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;"
+        "Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, arguments[1]);"
+        "el.dispatchEvent(new Event('input', {bubbles: true}));"
+        "el.dispatchEvent(new Event('change', {bubbles: true}));",
+        element,
+        value,
+    )
+
+
+def load_page(driver, url, ready=None, timeout=None):
+    """Load a page, optionally waiting for a named readiness condition.
+
+    Returns the condition's result (e.g. the located elements), or None.
+    A number instead of a condition name is the implicit wait in seconds of
+    the old load_page(driver, url, wait_time), which is deprecated.
+    """
     driver.get(url)
-    driver.implicitly_wait(wait_time)
\ No newline at end of file
+    if isinstance(ready, (int, float)):
+        warnings.warn("load_page(driver, url, wait_time) is deprecated, pass a condition name "
+                      "as ready instead", DeprecationWarning, stacklevel=2)
+        driver.implicitly_wait(ready)
+        return None
+    if ready:
+        return wait_for(driver, ready, timeout)
@@ -0,0 +1,118 @@
+"""Prepare submissions ahead of time and fire them all at a given instant."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from .submission import Query
+
+
+def parse_start_time(text, now=None):
+    """Parse HH:MM[:SS] (next occurrence) or an ISO datetime into a datetime."""
+    now = now or datetime.now()
+    for fmt in ("%H:%M:%S", "%H:%M"):
+        try:
+            clock = datetime.strptime(text, fmt).time()
+        except ValueError:
+            continue
+        start = datetime.combine(now.date(), clock)
+        if start < now:
+            start += timedelta(days=1)
+        return start
+
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        raise Exception(f"Invalid start time: {text}")
+
+
+def wait_until(start):
+    """Sleep until start, spinning for the last few milliseconds for precision."""
+    while True:
+        remaining = (start - datetime.now()).total_seconds()
+        if remaining <= 0:
+            return
+        if remaining > 0.05:
+            time.sleep(min(remaining - 0.05, 1))
+
+
+class BurstSubmitter:
+    """Fill every submission in advance so T0 only costs the final click or POST."""
+
+    def __init__(self, manager):
+        """Initialize with a SubmissionManager (selenium or http backend)."""
+        self.manager = manager
+        self.prepared = []
+
+    def prepare(self, jobs):
+        """Prepare (abspath, lang, problem_code) jobs.
+
+        The selenium backend opens one logged-in tab per job with the form
+        filled; the http backend logs in and reads every source.
+
+        Returns (problem_code, exception) for each job that could not be
+        prepared; the others are still fired.
+        """
+        failed = []
+        for abspath, lang, problem_code in jobs:
+            try:
+                if self.manager.backend == "http":
+                    with open(abspath, "r") as txt:
+                        self.prepared.append((problem_code, lang, txt.read()))
+                    continue
+
+                driver = self.manager.driver
+                # A tab whose form failed to fill is reused by the next job
+                if self.prepared and self.prepared[-1][1] == driver.current_window_handle:
+                    driver.switch_to.new_window("tab")
+                query = Query(driver, abspath, lang, problem_code, submit=False)
+                self.prepared.append((problem_code, driver.current_window_handle, query))
+            except Exception as e:
+                failed.append((problem_code, e))
+
+        if self.manager.backend == "http":
+            self.manager.client.ensure_login()
+        return failed
+
+    def fire(self):
+        """Submit everything prepared. Returns (problem_code, seconds, result) rows.
+
+        result is the submission ID, None if the judge's answer could not be
+        read, or the exception raised (e.g. RateLimitedError). The selenium
+        backend clicks every tab first, timing each click, and only then
+        collects the results, so reading one does not delay the next send.
+        """
+        if self.manager.backend == "http":
+            def post(job):
+                problem_code, lang, code = job
+                start = time.perf_counter()
+                try:
+                    result = self.manager.client.submit(problem_code, lang, code)
+                except Exception as e:
+                    result = e
+                return problem_code, time.perf_counter() - start, result
+
+            with ThreadPoolExecutor(max_workers=len(self.prepared) or 1) as executor:
+                return list(executor.map(post, self.prepared))
+
+        clicks = []
+        for problem_code, handle, query in self.prepared:
+            start = time.perf_counter()
+            try:
+                self.manager.driver.switch_to.window(handle)
+                query.fire()
+                error = None
+            except Exception as e:
+                error = e
+            clicks.append((problem_code, time.perf_counter() - start, error))
+
+        results = []
+        for (problem_code, seconds, error), (_, handle, query) in zip(clicks, self.prepared):
+            result = error
+            if error is None:
+                try:
+                    self.manager.driver.switch_to.window(handle)
+                    result = query.check_result()
+                except Exception as e:
+                    result = e
+            results.append((problem_code, seconds, result))
+        return results
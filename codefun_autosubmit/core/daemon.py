@@ -0,0 +1,239 @@
+"""Warm-browser daemon serving submit/fetch jobs over localhost HTTP."""
+
+import json
+import os
+import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import requests
+from .errors import ERROR_KINDS, SubmitUncertainError, classify, request_not_sent
+from .resilience import ResilientManager
+from .submission import SubmissionManager
+from .utils import get_config_dir
+
+
+DEFAULT_PORT = 8765
+
+
+def get_daemon_info_path():
+    """Get path of the file advertising a running daemon."""
+    return get_config_dir() / "daemon.json"
+
+
+class DaemonServer:
+    """Keep a pool of logged-in drivers warm and run jobs on them."""
+
+    def __init__(self, pool, port=DEFAULT_PORT):
+        """Initialize server with a ready-to-use DriverPool."""
+        self.pool = pool
+        self.token = secrets.token_hex(16)
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+
+    @property
+    def port(self):
+        """Port the server is bound to."""
+        return self.server.server_address[1]
+
+    def run_job(self, action, params):
+        """Run one job on the next idle driver."""
+        if action == "submit":
+            return self.pool.submit(params["abspath"], params["lang"], params["problem_code"])
+        if action == "retrieve":
+            return self.pool.retrieve_submission(
+                params["submission_id"], params["problem_code"], params["language"],
+                crawl_folder=params.get("crawl_folder"),
+            )
+        raise Exception(f"Unknown action: {action}")
+
+    def serve_forever(self):
+        """Advertise the daemon and serve until shutdown() is called."""
+        path = get_daemon_info_path()
+        try:
+            # A file left by a crashed daemon could be readable by others
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        # Only the current user may read the token
+        with os.fdopen(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as f:
+            json.dump({"port": self.port, "token": self.token, "pid": os.getpid()}, f)
+        try:
+            self.server.serve_forever()
+        finally:
+            try:
+                get_daemon_info_path().unlink()
+            except FileNotFoundError:
+                pass
+
+    def shutdown(self):
+        """Make serve_forever() return. Must not be called from the serving thread."""
+        self.server.shutdown()
+
+    def close(self):
+        """Close the socket and quit every driver."""
+        self.server.server_close()
+        self.pool.close()
+
+    def _handler(self):
+        daemon = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status, payload):
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                if self.headers.get("Authorization") != f"Bearer {daemon.token}":
+                    return self._reply(401, {"error": "Unauthorized"})
+
+                length = int(self.headers.get("Content-Length", 0))
+                params = json.loads(self.rfile.read(length) or b"{}")
+                action = self.path.strip("/")
+
+                if action == "ping":
+                    return self._reply(200, {"data": "pong"})
+                if action == "stop":
+                    threading.Thread(target=daemon.shutdown, daemon=True).start()
+                    return self._reply(200, {"data": "stopping"})
+                try:
+                    return self._reply(200, {"data": daemon.run_job(action, params)})
+                except Exception as e:
+                    return self._reply(500, {"error": str(e), "kind": classify(e)})
+
+        return Handler
+
+
+class DaemonClient:
+    """Send jobs to a running daemon."""
+
+    def __init__(self, port, token, timeout=600):
+        """Initialize client for the daemon on the given port."""
+        self.base_url = f"http://127.0.0.1:{port}"
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers["Authorization"] = f"Bearer {token}"
+
+    @classmethod
+    def connect(cls):
+        """Return a client for the running daemon, or None if none is running."""
+        try:
+            with open(get_daemon_info_path(), "r") as f:
+                info = json.load(f)
+            client = cls(info["port"], info["token"])
+            client.call("ping", timeout=1)
+            return client
+        except Exception:
+            return None
+
+    def call(self, action, timeout=None, **params):
+        """Run an action on the daemon and return its result."""
+        response = self.session.post(f"{self.base_url}/{action}", json=params,
+                                     timeout=timeout or self.timeout)
+        payload = response.json()
+        if response.status_code != 200:
+            error = ERROR_KINDS.get(payload.get("kind"), Exception)
+            raise error(payload.get("error", f"Daemon error ({response.status_code})"))
+        return payload["data"]
+
+    def close(self):
+        """Close the connection to the daemon."""
+        self.session.close()
+
+
+class RemoteSubmissionManager(SubmissionManager):
+    """SubmissionManager whose browser work runs inside the daemon."""
+
+    def __init__(self, daemon_client):
+        """Initialize remote manager."""
+        self.driver = None
+        self.backend = "daemon"
+        self.client = None
+        self.daemon = daemon_client
+
+    def submit(self, abspath, lang, problem_code):
+        """Submit a file using a warm driver in the daemon."""
+        try:
+            return self.daemon.call("submit", abspath=os.path.abspath(abspath), lang=lang,
+                                    problem_code=problem_code)
+        except requests.RequestException as e:
+            if request_not_sent(e):
+                raise
+            raise SubmitUncertainError(f"Lost the daemon while it was submitting: {e}") from e
+
+    def warm_up(self):
+        """The daemon's drivers are logged in already."""
+        return True
+
+    def retrieve_submission(self, submission_id, problem_code, language, crawl_folder=None):
+        """Retrieve submitted code using a warm driver in the daemon."""
+        if crawl_folder:
+            crawl_folder = os.path.abspath(crawl_folder)
+        return self.daemon.call("retrieve", submission_id=submission_id, problem_code=problem_code,
+                                language=language, crawl_folder=crawl_folder)
+
+    def close(self):
+        """Disconnect, leaving the daemon's drivers running."""
+        self.daemon.close()
+
+
+def open_manager(backend="selenium"):
+    """Get a SubmissionManager, using the daemon's warm drivers when it is running.
+
+    Falls back to an in-process manager, wrapped with retries, when no
+    daemon answers. The daemon retries on its side.
+    """
+    if backend == "selenium":
+        daemon_client = DaemonClient.connect()
+        if daemon_client:
+            print("Using warm browser from codefun daemon")
+            return RemoteSubmissionManager(daemon_client)
+
+        from .browser import setup_driver
+        return ResilientManager(SubmissionManager(backend=backend, driver_factory=setup_driver))
+
+    return ResilientManager(SubmissionManager(backend=backend))
+
+
+def open_warm_manager(backend="selenium"):
+    """open_manager, then log in so the first submission does not have to."""
+    manager = open_manager(backend)
+    try:
+        ready = manager.warm_up()
+    except Exception as e:
+        ready = False
+        print(f"Could not log in ahead of time ({e})")
+    if not ready:
+        print("Login will be retried with the first submission")
+    return manager
+
+
+def start_manager(backend="selenium"):
+    """Run open_warm_manager in the background and return its Future.
+
+    Lets callers overlap browser startup and login with other work.
+    """
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(open_warm_manager, backend)
+    executor.shutdown(wait=False)
+    return future
+
+
+def discard_manager(future):
+    """Close a manager from start_manager that will not be used.
+
+    Waits for startup to finish if it is already running, so no browser
+    is left behind.
+    """
+    if future.cancel():
+        return
+    try:
+        future.result().close()
+    except Exception:
+        pass
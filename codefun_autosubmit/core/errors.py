@@ -0,0 +1,103 @@
+"""Exception types used to classify submission failures."""
+
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    InvalidSessionIdException,
+    NoSuchElementException,
+    NoSuchWindowException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+
+
+class SubmissionError(Exception):
+    """Base class for classified submission failures."""
+
+    kind = None
+
+
+class TransientDomError(SubmissionError):
+    """Page was not ready or changed under us; retrying usually works."""
+
+    kind = "transient"
+
+
+class SessionExpiredError(SubmissionError):
+    """Login was lost and could not be restored automatically."""
+
+    kind = "session"
+
+
+class DriverDeadError(SubmissionError):
+    """The WebDriver session or browser process is gone."""
+
+    kind = "driver"
+
+
+class ServerError(SubmissionError):
+    """Codefun answered with a server error or could not be reached."""
+
+    kind = "server"
+
+
+class RateLimitedError(SubmissionError):
+    """The judge refused the submission because we are going too fast."""
+
+    kind = "rate_limit"
+
+    def __init__(self, message="Rate limited", retry_after=None):
+        """Initialize error with the wait the judge asked for, if any."""
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class SubmitUncertainError(SubmissionError):
+    """A submission failed after it was sent and may have reached the judge.
+
+    Sending it again could submit the same code twice, so it is never retried.
+    """
+
+    kind = "uncertain"
+
+
+ERROR_KINDS = {cls.kind: cls for cls in (TransientDomError, SessionExpiredError,
+                                         DriverDeadError, ServerError, RateLimitedError,
+                                         SubmitUncertainError)}
+
+DEAD_DRIVER_MESSAGES = ("invalid session id", "chrome not reachable", "disconnected",
+                        "no such window", "target window already closed", "session deleted")
+
+
+def request_not_sent(error):
+    """Whether a failed HTTP request certainly never reached the server."""
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    if isinstance(error, requests.ConnectionError):
+        reason = getattr(error.args[0] if error.args else None, "reason", None)
+        return isinstance(reason, NewConnectionError)
+    return False
+
+
+def classify(error):
+    """Return the failure kind of an exception, or None if it is not retryable."""
+    if isinstance(error, SubmissionError):
+        return error.kind
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException)):
+        return "driver"
+    if isinstance(error, (TimeoutException, StaleElementReferenceException,
+                          NoSuchElementException, ElementClickInterceptedException)):
+        return "transient"
+    if isinstance(error, WebDriverException):
+        message = (error.msg or "").lower()
+        if any(text in message for text in DEAD_DRIVER_MESSAGES):
+            return "driver"
+        return "transient"
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return "server"
+    if isinstance(error, (MaxRetryError, ProtocolError, ConnectionError)):
+        # Selenium could not reach a chromedriver that has exited
+        return "driver"
+    return None
@@ -0,0 +1,108 @@
+"""Fetch submission sources over HTTP with bounded concurrency."""
+
+import html
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from os import getenv
+from .errors import RateLimitedError
+from .stats import language_name
+from .utils import get_extension, load_config
+
+
+CODE_BLOCK = re.compile(r"<code[^>]*>(.*?)</code>", re.DOTALL)
+
+
+class HttpFetcher:
+    """Download many submissions through one pooled, authenticated CodefunClient."""
+
+    def __init__(self, client=None, workers=8, crawl_folder=None, retries=3, archive=None):
+        """Initialize fetcher.
+
+        Args:
+            client: CodefunClient (default: a new one with a pool as large as workers)
+            workers: Submissions fetched at the same time
+            crawl_folder: Where sources are saved (default: CRAWL_FOLDER, then PATH_TO_FOLDER)
+            retries: Times a rate-limited request is retried after the wait the server asks for
+            archive: SourceArchive to store sources in instead of separate files
+        """
+        load_config()
+        if client is None:
+            from .http import CodefunClient
+            client = CodefunClient(pool_size=workers)
+        self.client = client
+        self.workers = workers
+        self.retries = retries
+        self.archive = archive
+        self.crawl_folder = crawl_folder or getenv("CRAWL_FOLDER") or getenv("PATH_TO_FOLDER")
+
+    def get_source(self, submission_id):
+        """Get (code, language) of a submission.
+
+        Uses the JSON API, and falls back to the code block of the
+        submission page when the API leaves the code out.
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                data = self.client.get_submission(submission_id)
+                break
+            except RateLimitedError as e:
+                if attempt == self.retries:
+                    raise
+                time.sleep(e.retry_after if e.retry_after is not None else 2 ** attempt)
+        code = data.get("code")
+        if code is None:
+            response = self.client.request("GET", f"/submissions/{submission_id}")
+            match = CODE_BLOCK.search(response.text)
+            if response.status_code != 200 or not match:
+                raise Exception("No code found")
+            code = html.unescape(match.group(1))
+        return code, language_name(data)
+
+    def fetch_one(self, submission_id, problem_code, language=None):
+        """Fetch one submission and save it as {problem_code}.{ext}.
+
+        Returns the saved path (the member name when archiving), or None if
+        it is not in the wanted language.
+        """
+        code, submission_language = self.get_source(submission_id)
+        if language and submission_language != language:
+            return None
+        if self.archive is not None:
+            return self.archive.put(submission_id, problem_code, submission_language, code)
+        path = os.path.join(self.crawl_folder, f"{problem_code}.{get_extension(submission_language)}")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(code)
+        return path
+
+    def fetch(self, submissions, language=None, on_result=None):
+        """Fetch [submission_id, problem_code] pairs, saving each as it arrives.
+
+        Args:
+            submissions: Pairs as returned by get_all_accepted_submissions
+            language: Only save submissions in this language (all if None)
+            on_result: Called with (submission_id, problem_code, saved path or
+                None, exception or None) as each fetch finishes
+
+        Returns the number of sources saved.
+        """
+        self.client.ensure_login()
+        saved = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {executor.submit(self.fetch_one, submission_id, problem_code, language):
+                       (submission_id, problem_code) for submission_id, problem_code in submissions}
+            for future in as_completed(futures):
+                submission_id, problem_code = futures[future]
+                try:
+                    path, error = future.result(), None
+                except Exception as e:
+                    path, error = None, e
+                saved += path is not None
+                if on_result:
+                    on_result(submission_id, problem_code, path, error)
+        return saved
+
+    def close(self):
+        """Close the HTTP client."""
+        self.client.close()
@@ -0,0 +1,180 @@
+"""Local SQLite mirror of problem stats and submission history."""
+
+import sqlite3
+import threading
+import time
+from .utils import get_config_dir
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS problems (
+    problem_code TEXT PRIMARY KEY,
+    score REAL NOT NULL,
+    max_score REAL NOT NULL,
+    submission_id INTEGER,
+    synced_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS submissions (
+    submission_id INTEGER PRIMARY KEY,
+    problem_code TEXT NOT NULL,
+    language TEXT,
+    result TEXT,
+    score REAL,
+    submitted_at REAL,
+    judged_at REAL,
+    origin TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS submissions_problem ON submissions (problem_code, submitted_at);
+CREATE INDEX IF NOT EXISTS submissions_result ON submissions (result);
+CREATE INDEX IF NOT EXISTS submissions_time ON submissions (submitted_at);
+CREATE TABLE IF NOT EXISTS sync_state (
+    name TEXT PRIMARY KEY,
+    value REAL NOT NULL
+);
+"""
+
+# Problems with full score in the stats or an AC verdict in our own log
+ACCEPTED_SQL = """
+SELECT problem_code FROM problems WHERE max_score - score < 0.000000001
+UNION SELECT problem_code FROM submissions WHERE result = 'AC'
+"""
+
+
+class History:
+    """Answer status questions from a local copy of stats and our submissions."""
+
+    def __init__(self, path=None):
+        """Open (creating if needed) the history database in the config folder."""
+        self.path = path or get_config_dir() / "history.db"
+        self.db = sqlite3.connect(str(self.path), timeout=30, isolation_level=None,
+                                  check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self.lock = threading.Lock()
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        """Close the database."""
+        with self.lock:
+            self.db.close()
+
+    def _query(self, sql, args=()):
+        with self.lock:
+            return [dict(row) for row in self.db.execute(sql, args).fetchall()]
+
+    def sync_stats(self, snapshot):
+        """Mirror a StatsSnapshot; only rows whose score changed are written.
+
+        Returns the number of problems added or updated.
+        """
+        now = time.time()
+        rows = [(code, row["score"], row["maxScore"], row.get("submissionId"), now)
+                for code, row in snapshot.by_problem.items()]
+        with self.lock:
+            before = self.db.total_changes
+            self.db.execute("BEGIN")
+            self.db.executemany(
+                "INSERT INTO problems (problem_code, score, max_score, submission_id, synced_at) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT (problem_code) DO UPDATE SET "
+                "score = excluded.score, max_score = excluded.max_score, "
+                "submission_id = excluded.submission_id, synced_at = excluded.synced_at "
+                "WHERE score != excluded.score OR max_score != excluded.max_score "
+                "OR submission_id IS NOT excluded.submission_id",
+                rows,
+            )
+            changed = self.db.total_changes - before
+            self.db.executemany(
+                "INSERT OR IGNORE INTO submissions (submission_id, problem_code, score, origin) "
+                "VALUES (?, ?, ?, 'stats')",
+                [(submission_id, code, score) for code, score, _, submission_id, _ in rows
+                 if submission_id is not None],
+            )
+            self.db.execute(
+                "INSERT INTO sync_state (name, value) VALUES ('stats', ?) "
+                "ON CONFLICT (name) DO UPDATE SET value = excluded.value",
+                (now,),
+            )
+            self.db.execute("COMMIT")
+        return changed
+
+    def sync_queue(self, queue):
+        """Copy submissions from a SubmissionQueue changed since the last sync.
+
+        Returns the number of submissions copied.
+        """
+        with self.lock:
+            row = self.db.execute("SELECT value FROM sync_state WHERE name = 'queue'").fetchone()
+        since = row["value"] if row else 0
+
+        jobs = [job for job in queue.jobs("submitted", "judged")
+                if job["submission_id"] is not None and job["updated_at"] > since]
+        with self.lock:
+            self.db.execute("BEGIN")
+            self.db.executemany(
+                "INSERT INTO submissions (submission_id, problem_code, language, result, score, "
+                "submitted_at, judged_at, origin) VALUES (?, ?, ?, ?, ?, ?, ?, 'local') "
+                "ON CONFLICT (submission_id) DO UPDATE SET language = excluded.language, "
+                "result = excluded.result, score = excluded.score, "
+                "submitted_at = excluded.submitted_at, judged_at = excluded.judged_at, origin = 'local'",
+                [(job["submission_id"], job["problem_code"], job["language"], job["result"],
+                  job["score"], job["created_at"],
+                  job["updated_at"] if job["state"] == "judged" else None) for job in jobs],
+            )
+            if jobs:
+                self.db.execute(
+                    "INSERT INTO sync_state (name, value) VALUES ('queue', ?) "
+                    "ON CONFLICT (name) DO UPDATE SET value = excluded.value",
+                    (max(job["updated_at"] for job in jobs),),
+                )
+            self.db.execute("COMMIT")
+        return len(jobs)
+
+    def synced_at(self):
+        """Time of the last stats sync, or None if there was none."""
+        rows = self._query("SELECT value FROM sync_state WHERE name = 'stats'")
+        return rows[0]["value"] if rows else None
+
+    def accepted(self):
+        """Set of accepted problem codes."""
+        return {row["problem_code"] for row in self._query(ACCEPTED_SQL)}
+
+    def submitted(self):
+        """Set of problem codes with any submission."""
+        return {row["problem_code"] for row in self._query(
+            "SELECT problem_code FROM problems UNION SELECT problem_code FROM submissions")}
+
+    def unsolved(self):
+        """Attempted problems without AC, best score first."""
+        return self._query(
+            f"SELECT problem_code, score, max_score FROM problems "
+            f"WHERE problem_code NOT IN ({ACCEPTED_SQL}) ORDER BY score DESC, problem_code"
+        )
+
+    def partial(self):
+        """Problems with some but not full score, best score first."""
+        return [row for row in self.unsolved() if row["score"] > 0]
+
+    def attempts(self, problem_code):
+        """Known submissions of a problem, newest first."""
+        return self._query(
+            "SELECT * FROM submissions WHERE problem_code = ? "
+            "ORDER BY submitted_at IS NULL, submitted_at DESC, submission_id DESC",
+            (problem_code,),
+        )
+
+    def recent(self, limit=10):
+        """Latest verdicts from our own submissions."""
+        return self._query(
+            "SELECT * FROM submissions WHERE origin = 'local' ORDER BY submitted_at DESC LIMIT ?",
+            (limit,),
+        )
+
+    def summary(self):
+        """Counts of attempted, accepted and partially solved problems."""
+        attempted = self._query("SELECT COUNT(*) AS n FROM problems")[0]["n"]
+        return {
+            "attempted": attempted,
+            "accepted": len(self.accepted()),
+            "partial": len(self.partial()),
+            "synced_at": self.synced_at(),
+        }
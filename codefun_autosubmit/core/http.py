@@ -0,0 +1,132 @@
+"""HTTP-native Codefun client built on a pooled requests session."""
+
+import requests
+from requests.adapters import HTTPAdapter
+from os import getenv
+from .errors import (RateLimitedError, ServerError, SessionExpiredError, SubmitUncertainError,
+                     request_not_sent)
+from .session import SessionStore
+from .utils import get_base_url, load_config
+
+
+class CodefunClient:
+    """Talk to the Codefun API over a single pooled HTTP session."""
+
+    def __init__(self, username=None, password=None, base_url=None, pool_size=10, timeout=15,
+                 store=None):
+        """Initialize client, reading credentials from config when not given.
+
+        A token saved by a previous run is reused until the server rejects it.
+        Pass store=False to disable session persistence.
+        """
+        load_config()
+        self.username = username or getenv("CF_USERNAME")
+        self.password = password or getenv("CF_PASSWORD")
+        self.base_url = (base_url or get_base_url()).rstrip("/")
+        self.timeout = timeout
+        self.token = None
+        self.store = SessionStore("http") if store is None else store
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        if self.store:
+            saved = self.store.load()
+            if saved.get("base_url") == self.base_url and saved.get("username") == self.username:
+                self._set_token(saved.get("token"))
+
+    def url(self, path):
+        """Build absolute URL for an API path."""
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def login(self):
+        """Login and attach the returned token to the session."""
+        response = self.session.post(
+            self.url("/api/auth"),
+            json={"username": self.username, "password": self.password},
+            timeout=self.timeout,
+        )
+        if response.status_code >= 500:
+            raise ServerError(f"Login failed ({response.status_code})")
+        if response.status_code != 200:
+            raise Exception(f"Login failed ({response.status_code})")
+
+        self._set_token(response.json()["data"])
+        if self.store:
+            self.store.save({"base_url": self.base_url, "username": self.username, "token": self.token})
+        return "Success"
+
+    def _set_token(self, token):
+        self.token = token
+        if token:
+            self.session.headers["Authorization"] = f"Bearer {token}"
+        else:
+            self.session.headers.pop("Authorization", None)
+
+    def logout(self):
+        """Forget the current token so the next request logs in again."""
+        self._set_token(None)
+
+    def ensure_login(self):
+        """Login if the session is not authenticated yet."""
+        if self.token is None:
+            self.login()
+
+    def request(self, method, path, **kwargs):
+        """Send an authenticated request, logging in again if the session expired."""
+        self.ensure_login()
+        kwargs.setdefault("timeout", self.timeout)
+        response = self.session.request(method, self.url(path), **kwargs)
+        if response.status_code == 401:
+            self._set_token(None)
+            self.login()
+            response = self.session.request(method, self.url(path), **kwargs)
+            if response.status_code == 401:
+                raise SessionExpiredError("Session rejected right after login")
+        if response.status_code == 429:
+            retry_after = response.headers.get("Retry-After")
+            raise RateLimitedError(
+                "Rate limited (429)",
+                retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None,
+            )
+        if response.status_code >= 500:
+            raise ServerError(f"Server error ({response.status_code})")
+        return response
+
+    def submit(self, problem_code, language, code):
+        """Submit source code and return the new submission ID.
+
+        Raises SubmitUncertainError when the request failed after it may
+        have been received (read timeouts, dropped connections, 5xx).
+        """
+        # Login failures happen before anything is sent
+        self.ensure_login()
+        try:
+            response = self.request(
+                "POST", "/api/submit",
+                json={"problem": problem_code, "language": language, "code": code},
+            )
+        except ServerError as e:
+            raise SubmitUncertainError(f"Submit may have been received: {e}") from e
+        except requests.RequestException as e:
+            if request_not_sent(e):
+                raise
+            raise SubmitUncertainError(f"Submit may have been received: {e}") from e
+        if response.status_code != 200:
+            raise Exception(f"Submit failed ({response.status_code})")
+
+        return response.json()["data"]
+
+    def get_submission(self, submission_id):
+        """Get a submission's details (result, score, language, code, ...)."""
+        response = self.request("GET", f"/api/submissions/{submission_id}")
+        if response.status_code != 200:
+            raise Exception(f"Submission {submission_id} not found ({response.status_code})")
+
+        return response.json()["data"]
+
+    def close(self):
+        """Close pooled connections."""
+        self.session.close()
@@ -0,0 +1,79 @@
+"""Manifest of fetched submissions kept in the crawl folder."""
+
+import json
+import os
+import threading
+import time
+from .source_hashes import source_digest
+
+
+MANIFEST_NAME = ".codefun-manifest.json"
+
+
+class FetchManifest:
+    """Remember which submission each fetched file came from.
+
+    Maps problem code to submission ID, language, content hash and fetch
+    time, so fetch only downloads problems whose accepted submission changed.
+    """
+
+    def __init__(self, folder, save_every=50):
+        """Load the manifest of a crawl folder (empty if there is none).
+
+        Args:
+            folder: Crawl folder
+            save_every: Records between automatic saves
+        """
+        self.folder = folder
+        self.path = os.path.join(folder, MANIFEST_NAME)
+        self.save_every = save_every
+        self.unsaved = 0
+        self.lock = threading.Lock()
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def save(self):
+        """Write the manifest atomically."""
+        with self.lock:
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, indent=1, sort_keys=True)
+            os.replace(temp_path, self.path)
+            self.unsaved = 0
+
+    def is_current(self, submission_id, problem_code, language=None):
+        """Whether a problem's accepted submission was already fetched.
+
+        A submission skipped for being in another language counts as current
+        only while the same language filter is used.
+        """
+        entry = self.entries.get(problem_code)
+        if entry is None or entry["submission_id"] != submission_id:
+            return False
+        if entry["file"] is None:
+            return entry.get("language_filter") == language
+        return os.path.exists(os.path.join(self.folder, entry["file"]))
+
+    def pending(self, submissions, language=None):
+        """[submission_id, problem_code] pairs that still need fetching."""
+        return [pair for pair in submissions if not self.is_current(pair[0], pair[1], language)]
+
+    def record(self, submission_id, problem_code, path, language=None, language_filter=None):
+        """Record a fetch; path is None when the submission was skipped."""
+        entry = {
+            "submission_id": submission_id,
+            "file": os.path.basename(path) if path else None,
+            "language": language,
+            "language_filter": language_filter,
+            "sha256": source_digest(path) if path else None,
+            "fetched_at": time.time(),
+        }
+        with self.lock:
+            self.entries[problem_code] = entry
+            self.unsaved += 1
+            due = self.unsaved >= self.save_every
+        if due:
+            self.save()
@@ -0,0 +1,129 @@
+"""Adaptive submission pacing driven by judge feedback."""
+
+import asyncio
+import random
+import time
+from os import getenv
+from .utils import load_config
+
+
+class Pacer:
+    """Token bucket whose refill interval adapts to what the judge allows.
+
+    Each submission takes one token. The interval between tokens starts at
+    base_interval, shrinks slowly towards min_interval while submissions go
+    through, doubles (up to max_interval) on rate limiting, and stretches
+    while many of our submissions are still waiting for a verdict.
+    """
+
+    def __init__(self, base_interval=90, min_interval=30, max_interval=600, burst=1, jitter=0,
+                 queue_target=5, clock=time.monotonic, sleep=time.sleep):
+        """Initialize pacer.
+
+        Args:
+            base_interval: Starting seconds between submissions
+            min_interval: Fastest pace reached while the judge accepts everything
+            max_interval: Slowest pace after repeated rate limiting
+            burst: Tokens that may accumulate while idle
+            jitter: Random seconds (0..jitter) added to every wait
+            queue_target: Own submissions still waiting for a verdict above
+                which the pace slows down
+        """
+        self.interval = base_interval
+        self.min_interval = min(min_interval, base_interval)
+        self.max_interval = max(max_interval, base_interval)
+        self.burst = burst
+        self.jitter = jitter
+        self.queue_target = queue_target
+        self.queue_depth = 0
+        self.clock = clock
+        self.sleep = sleep
+        self.tokens = burst
+        self.updated = clock()
+        self.blocked_until = 0
+
+    @classmethod
+    def from_config(cls):
+        """Build pacer from SUBMIT_* settings in the config."""
+        load_config()
+        base = float(getenv("SUBMIT_WAIT_TIME", "90"))
+        return cls(
+            base_interval=base,
+            min_interval=float(getenv("SUBMIT_MIN_WAIT", str(base / 2))),
+            max_interval=float(getenv("SUBMIT_MAX_WAIT", str(base * 4))),
+            burst=int(getenv("SUBMIT_BURST", "1")),
+            jitter=float(getenv("SUBMIT_RANDOM_RANGE", "0")),
+            queue_target=int(getenv("JUDGE_QUEUE_TARGET", "5")),
+        )
+
+    def effective_interval(self):
+        """Current seconds per token, stretched by the submissions awaiting a verdict."""
+        if self.queue_depth > self.queue_target:
+            return min(self.max_interval, self.interval * self.queue_depth / self.queue_target)
+        return self.interval
+
+    def _refill(self):
+        now = self.clock()
+        interval = self.effective_interval()
+        if interval <= 0:
+            # No pacing at all
+            self.tokens = self.burst
+        else:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) / interval)
+        self.updated = now
+        return now
+
+    def delay(self):
+        """Seconds until the next submission may go out (without jitter)."""
+        now = self._refill()
+        wait = max(0, self.blocked_until - now)
+        if self.tokens < 1:
+            wait = max(wait, (1 - self.tokens) * self.effective_interval())
+        return wait
+
+    def wait(self):
+        """Block until a submission may go out, then take its token.
+
+        Returns the seconds waited. KeyboardInterrupt propagates so callers
+        can cut the wait short; call skip() to go ahead anyway.
+        """
+        wait = self.delay()
+        if wait > 0:
+            wait += random.uniform(0, self.jitter)
+            print(f"Waiting for {int(wait)} secs")
+            self.sleep(wait)
+        self.skip()
+        return wait
+
+    async def wait_async(self):
+        """Like wait(), but sleeps with asyncio so other work keeps running."""
+        wait = self.delay()
+        if wait > 0:
+            wait += random.uniform(0, self.jitter)
+            print(f"Waiting for {int(wait)} secs")
+            await asyncio.sleep(wait)
+        self.skip()
+        return wait
+
+    def skip(self):
+        """Take a token now, even if none has been refilled yet."""
+        self._refill()
+        self.tokens = max(0, self.tokens - 1)
+
+    def record_success(self):
+        """The judge accepted a submission: speed up a little."""
+        self.interval = max(self.min_interval, self.interval * 0.9)
+
+    def record_rate_limit(self, retry_after=None):
+        """The judge rejected a submission for rate limiting: back off.
+
+        Args:
+            retry_after: Seconds the judge asked us to wait, if it said so
+        """
+        self.interval = min(self.max_interval, self.interval * 2)
+        self.blocked_until = self.clock() + (retry_after if retry_after is not None else self.interval)
+        self.tokens = min(self.tokens, 0)
+
+    def record_queue_depth(self, depth):
+        """Report how many of our submissions are still waiting for a verdict."""
+        self.queue_depth = depth
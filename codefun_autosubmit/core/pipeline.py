@@ -0,0 +1,249 @@
+"""Asyncio submission pipeline whose stages overlap instead of running in turn."""
+
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from .errors import RateLimitedError, SubmitUncertainError, classify
+from .pacing import Pacer
+
+
+class AsyncSubmissionManager:
+    """Asyncio front end to a SubmissionManager.
+
+    Every call runs on one dedicated worker thread, so the event loop never
+    blocks and a Selenium driver is never used by two threads at once.
+    """
+
+    def __init__(self, manager):
+        """Initialize with a (possibly ResilientManager-wrapped) SubmissionManager."""
+        self.manager = manager
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    @property
+    def backend(self):
+        """Backend of the wrapped manager."""
+        return self.manager.backend
+
+    async def _run(self, method, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        call = functools.partial(getattr(self.manager, method), *args, **kwargs)
+        return await loop.run_in_executor(self.executor, call)
+
+    async def submit(self, abspath, lang, problem_code):
+        """Submit a file and return its submission ID."""
+        return await self._run("submit", abspath, lang, problem_code)
+
+    async def prepare(self, abspath, lang, problem_code):
+        """Get a submission ready to fire (see SubmissionManager.prepare)."""
+        return await self._run("prepare", abspath, lang, problem_code)
+
+    async def fire(self, prepared):
+        """Send a prepared submission and return its ID."""
+        return await self._run("fire", prepared)
+
+    async def retrieve_submission(self, submission_id, problem_code, language, crawl_folder=None):
+        """Retrieve submitted code."""
+        return await self._run("retrieve_submission", submission_id, problem_code, language,
+                               crawl_folder=crawl_folder)
+
+    async def close(self):
+        """Close the wrapped manager and stop the worker thread."""
+        await self._run("close")
+        self.executor.shutdown()
+
+
+class SubmissionPipeline:
+    """Read, prepare, submit and track submissions as overlapping stages.
+
+    Stages are connected by bounded queues and the pacer is the only
+    limiter: while it waits for the next slot, the next source is already
+    read and its form filled, and verdicts of earlier submissions are
+    being polled.
+
+    Jobs are dicts with "path", "language" and "problem_code" keys; any
+    other keys are passed back untouched to the callbacks. Before a job is
+    sent, its "source" key is set to the code being sent (None if the
+    manager does not tell).
+    """
+
+    def __init__(self, manager, pacer=None, tracker=None, queue_size=2, on_submitted=None,
+                 on_failed=None):
+        """Initialize pipeline.
+
+        Args:
+            manager: AsyncSubmissionManager (a plain manager is wrapped)
+            pacer: Pacer deciding when each submission may go out (default: from config)
+            tracker: Optional VerdictTracker fed with every new submission
+            queue_size: Jobs that may wait between two stages
+            on_submitted: Called with (job, submission_id); the ID is None when
+                the send failed in a way that may still have reached the judge
+            on_failed: Called with (job, error) for jobs that could not be submitted
+        """
+        if not isinstance(manager, AsyncSubmissionManager):
+            manager = AsyncSubmissionManager(manager)
+        self.manager = manager
+        self.pacer = pacer or Pacer.from_config()
+        self.tracker = tracker
+        self.queue_size = queue_size
+        self.on_submitted = on_submitted or (lambda job, submission_id: None)
+        self.on_failed = on_failed or (lambda job, error: None)
+        self.force_next = False
+        self.submitted = 0
+        # Set when run() ends, so job iterators that block waiting for work
+        # know to give up
+        self.stopping = threading.Event()
+        # Jobs taken from the source that were neither sent nor failed yet
+        self.in_flight = []
+        # Jobs whose submission was sent off but has not returned
+        self.firing = []
+
+    async def run(self, jobs):
+        """Push every job through the pipeline.
+
+        Args:
+            jobs: Iterable of job dicts; it is consumed lazily, one job at a
+                time, from a worker thread
+
+        Returns the number of jobs submitted.
+        """
+        self.in_flight = []
+        self.firing = []
+        self.stopping.clear()
+        read = asyncio.Queue(self.queue_size)
+        prepared = asyncio.Queue(self.queue_size)
+        sent = asyncio.Queue(self.queue_size)
+        # A browser has one submit form, so the next one is only filled
+        # after the previous one was sent
+        self.form_slots = asyncio.Semaphore(1 if self.manager.backend == "selenium" else self.queue_size)
+
+        stages = [
+            asyncio.ensure_future(self._read(iter(jobs), read)),
+            asyncio.ensure_future(self._prepare(read, prepared)),
+            asyncio.ensure_future(self._submit(prepared, sent)),
+            asyncio.ensure_future(self._track(sent)),
+        ]
+        try:
+            await asyncio.gather(*stages)
+        finally:
+            self.stopping.set()
+            for stage in stages:
+                stage.cancel()
+        return self.submitted
+
+    def _fail(self, job, error):
+        if job in self.in_flight:
+            self.in_flight.remove(job)
+        print(f"Error while submitting {job['problem_code']}: {error}")
+        self.on_failed(job, error)
+
+    async def _read(self, jobs, out):
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await loop.run_in_executor(None, next, jobs, None)
+            if job is None:
+                break
+            self.in_flight.append(job)
+            if not os.path.isfile(job["path"]):
+                self._fail(job, "File not found")
+                continue
+            if not job["language"]:
+                self._fail(job, "Unknown language")
+                continue
+            await out.put(job)
+        await out.put(None)
+
+    async def _prepare(self, jobs, out):
+        while True:
+            job = await jobs.get()
+            if job is None:
+                break
+            await self.form_slots.acquire()
+            try:
+                ready = await self.manager.prepare(job["path"], job["language"], job["problem_code"])
+            except Exception as e:
+                self.form_slots.release()
+                self._fail(job, e)
+                continue
+            await out.put((job, ready))
+        await out.put(None)
+
+    async def _submit(self, jobs, out):
+        while True:
+            item = await jobs.get()
+            if item is None:
+                break
+            job, ready = item
+            while True:
+                if self.force_next:
+                    self.force_next = False
+                    self.pacer.skip()
+                else:
+                    await self.pacer.wait_async()
+
+                self.in_flight.remove(job)
+                self.firing.append(job)
+                try:
+                    submission_id = await self._fire(job, ready)
+                except RateLimitedError as e:
+                    print(f"Rate limited while submitting {job['problem_code']}, retrying")
+                    self.pacer.record_rate_limit(e.retry_after)
+                    self.firing.remove(job)
+                    self.in_flight.append(job)
+                    try:
+                        ready = await self.manager.prepare(job["path"], job["language"],
+                                                           job["problem_code"])
+                    except Exception as e:
+                        self.form_slots.release()
+                        self._fail(job, e)
+                        break
+                    continue
+                except SubmitUncertainError as e:
+                    # Sending again could submit the same code twice
+                    self.firing.remove(job)
+                    self.form_slots.release()
+                    print(f"{job['problem_code']} may have been submitted ({e}), not sending it again")
+                    self.on_submitted(job, None)
+                    break
+                except Exception as e:
+                    self.firing.remove(job)
+                    self.form_slots.release()
+                    self._fail(job, e)
+                    break
+
+                self.firing.remove(job)
+                self.form_slots.release()
+                self.submitted += 1
+                self.pacer.record_success()
+                print(f"{job['problem_code']} submitted")
+                self.on_submitted(job, submission_id)
+                await out.put((job, submission_id))
+                break
+        await out.put(None)
+
+    async def _fire(self, job, ready):
+        job["source"] = getattr(ready, "source", None)
+        try:
+            return await self.manager.fire(ready)
+        except (RateLimitedError, SubmitUncertainError):
+            raise
+        except Exception as e:
+            if classify(e) is None:
+                raise
+            # fire() raises SubmitUncertainError once the click or POST may have
+            # gone out, so this failed before sending (e.g. the prepared form
+            # went stale); prepare again with the manager's retries
+            ready = await self.manager.prepare(job["path"], job["language"], job["problem_code"])
+            job["source"] = getattr(ready, "source", None)
+            return await self.manager.fire(ready)
+
+    async def _track(self, jobs):
+        while True:
+            item = await jobs.get()
+            if item is None:
+                break
+            job, submission_id = item
+            if self.tracker:
+                self.tracker.track(submission_id, job["problem_code"])
+                self.pacer.record_queue_depth(self.tracker.pending_count())
@@ -0,0 +1,118 @@
+"""Pool of logged-in drivers shared by parallel submission and retrieval jobs."""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import partial
+from os import getenv
+from .resilience import ResilientManager
+from .submission import SubmissionManager
+from .utils import load_config
+
+
+def default_manager_factory(slot=0):
+    """Start a Chrome instance wrapped in a retrying SubmissionManager.
+
+    Args:
+        slot: Position of the browser in its pool; selects its profile folder
+    """
+    from .browser import setup_driver
+    return ResilientManager(SubmissionManager(driver_factory=partial(setup_driver, slot=slot)))
+
+
+class DriverPool:
+    """Hand out SubmissionManagers, one job per manager at a time."""
+
+    def __init__(self, size=None, manager_factory=None, max_submitters=1):
+        """Initialize pool and start its drivers in parallel.
+
+        Args:
+            size: Number of drivers (default: DRIVER_POOL_SIZE env var or 1)
+            manager_factory: Callable returning a new SubmissionManager
+                (default: Chrome, each driver with its own profile folder)
+            max_submitters: How many submissions may run at once, so pacing
+                still applies however many drivers there are
+        """
+        load_config()
+        self.size = size or int(getenv("DRIVER_POOL_SIZE", "1"))
+        self.manager_factory = manager_factory
+        self.submit_slots = threading.BoundedSemaphore(max_submitters)
+        self.idle = queue.Queue()
+
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            futures = [executor.submit(self._start, slot) for slot in range(self.size)]
+        errors = [future.exception() for future in futures if future.exception() is not None]
+        if errors:
+            # Quit the drivers that did start before giving up
+            for future in futures:
+                if future.exception() is None:
+                    try:
+                        future.result().close()
+                    except Exception:
+                        pass
+            raise errors[0]
+        self.managers = [future.result() for future in futures]
+        for manager in self.managers:
+            self.idle.put(manager)
+
+    def _start(self, slot):
+        if self.manager_factory is None:
+            return default_manager_factory(slot)
+        return self.manager_factory()
+
+    def warm_up(self):
+        """Log every driver in at once; returns how many are ready."""
+        def warm_up(manager):
+            try:
+                return manager.warm_up()
+            except Exception as e:
+                print(f"Could not log in a browser ({e})")
+                return False
+
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            return sum(executor.map(warm_up, self.managers))
+
+    @contextmanager
+    def manager(self):
+        """Borrow an idle manager, waiting for one if all are busy."""
+        manager = self.idle.get()
+        try:
+            yield manager
+        finally:
+            self.idle.put(manager)
+
+    def submit(self, abspath, lang, problem_code):
+        """Submit a file on the next idle driver."""
+        with self.submit_slots, self.manager() as manager:
+            return manager.submit(abspath, lang, problem_code)
+
+    def retrieve_submission(self, submission_id, problem_code, language, crawl_folder=None):
+        """Retrieve a submission on the next idle driver."""
+        with self.manager() as manager:
+            return manager.retrieve_submission(submission_id, problem_code, language,
+                                               crawl_folder=crawl_folder)
+
+    def get_all_accepted_submissions(self, language=None):
+        """Get all accepted submissions (in a language)."""
+        return self.managers[0].get_all_accepted_submissions(language)
+
+    def map(self, fn, items):
+        """Run fn(manager, item) for every item from a shared work queue.
+
+        Yields (item, future) pairs as jobs finish; future.result() re-raises
+        the job's exception, if any.
+        """
+        def job(item):
+            with self.manager() as manager:
+                return fn(manager, item)
+
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            futures = {executor.submit(job, item): item for item in items}
+            for future in as_completed(futures):
+                yield futures[future], future
+
+    def close(self):
+        """Quit every driver in the pool."""
+        for manager in self.managers:
+            manager.close()
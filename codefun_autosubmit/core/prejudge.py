@@ -0,0 +1,190 @@
+"""Compile and run solutions against local sample tests before submitting."""
+
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from os import getenv
+from .utils import get_config_dir, load_config
+
+
+# Results that let a file through to the judge
+PASSING = {"passed", "no_tests", "skipped"}
+
+INPUT_EXTENSIONS = (".in", ".inp")
+OUTPUT_EXTENSIONS = (".out", ".ans", ".ok")
+
+
+def compile_command(language, source, binary):
+    """Compiler command line for a language, or None if it is not compiled."""
+    if language == "C++":
+        return [getenv("PREJUDGE_CXX", "g++"), "-O2", "-std=c++17", "-o", binary, source]
+    if language == "Pascal":
+        return [getenv("PREJUDGE_FPC", "fpc"), "-O2", f"-o{binary}", source]
+    return None
+
+
+def find_samples(samples_dir):
+    """List (input_path, expected_output_path) pairs in a problem's sample folder."""
+    if not os.path.isdir(samples_dir):
+        return []
+
+    samples = []
+    for filename in sorted(os.listdir(samples_dir)):
+        stem, ext = os.path.splitext(filename)
+        if ext not in INPUT_EXTENSIONS:
+            continue
+        for out_ext in OUTPUT_EXTENSIONS:
+            expected = os.path.join(samples_dir, stem + out_ext)
+            if os.path.exists(expected):
+                samples.append((os.path.join(samples_dir, filename), expected))
+                break
+    return samples
+
+
+def build(source, language, cache_dir):
+    """Compile a source file, reusing a cached binary for identical contents.
+
+    Returns (command to run, error message or None).
+    """
+    if language == "Python3":
+        try:
+            with open(source, "rb") as f:
+                compile(f.read(), source, "exec")
+        except (SyntaxError, ValueError) as e:
+            return None, f"{type(e).__name__}: {e}"
+        return [sys.executable, source], None
+
+    with open(source, "rb") as f:
+        data = f.read()
+    template = compile_command(language, "SOURCE", "BINARY")
+    key = hashlib.sha256(language.encode() + b"\0" + " ".join(template).encode() + b"\0" + data)
+    binary = os.path.join(cache_dir, key.hexdigest() + (".exe" if os.name == "nt" else ""))
+    if os.path.exists(binary):
+        return [binary], None
+
+    # Build in a scratch folder so compiler droppings stay out of the solutions folder
+    with tempfile.TemporaryDirectory() as scratch:
+        scratch_source = os.path.join(scratch, os.path.basename(source))
+        scratch_binary = os.path.join(scratch, "solution")
+        shutil.copyfile(source, scratch_source)
+        try:
+            result = subprocess.run(compile_command(language, scratch_source, scratch_binary),
+                                    cwd=scratch, capture_output=True, text=True)
+        except FileNotFoundError as e:
+            return None, f"Compiler not found: {e.filename}"
+        if result.returncode != 0:
+            return None, (result.stderr or result.stdout).strip()[-2000:]
+        if os.name == "nt" and not os.path.exists(scratch_binary):
+            scratch_binary += ".exe"
+        # Another worker may be building the same contents; replace is atomic
+        os.replace(scratch_binary, binary)
+    return [binary], None
+
+
+def judge_file(path, language, problem_code, samples_folder, cache_dir, timeout):
+    """Check one solution. Runs in a worker process.
+
+    Returns a dict with path, problem_code, status (see PASSING) and detail.
+    """
+    def verdict(status, detail=""):
+        return {"path": path, "problem_code": problem_code, "status": status, "detail": detail}
+
+    if language not in ("C++", "Pascal", "Python3"):
+        return verdict("skipped", f"No local checks for {language}")
+
+    command, error = build(path, language, cache_dir)
+    if error:
+        return verdict("compile_error", error)
+
+    samples = find_samples(os.path.join(samples_folder, problem_code))
+    if not samples:
+        return verdict("no_tests")
+
+    for input_path, expected_path in samples:
+        name = os.path.basename(input_path)
+        with open(input_path, "rb") as stdin:
+            try:
+                result = subprocess.run(command, stdin=stdin, capture_output=True, timeout=timeout)
+            except subprocess.TimeoutExpired:
+                return verdict("time_limit", name)
+        if result.returncode != 0:
+            return verdict("runtime_error", f"{name}: exit code {result.returncode}")
+        with open(expected_path, "rb") as f:
+            if result.stdout.split() != f.read().split():
+                return verdict("wrong_answer", name)
+    return verdict("passed", f"{len(samples)} sample(s)")
+
+
+class PreJudge:
+    """Run solutions through local checks in parallel before they use a judge slot."""
+
+    def __init__(self, samples_folder, cache_dir=None, workers=None, timeout=5):
+        """Initialize pre-judge.
+
+        Args:
+            samples_folder: Folder with one sub-folder of samples per problem
+                code, holding NAME.in/.inp inputs and NAME.out/.ans/.ok outputs
+            cache_dir: Where compiled binaries are kept (default: config folder)
+            workers: Worker processes (default: one per core)
+            timeout: Seconds each sample may run
+        """
+        self.samples_folder = samples_folder
+        self.cache_dir = str(cache_dir or get_config_dir() / "prejudge-cache")
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @classmethod
+    def from_config(cls, input_folder):
+        """Build pre-judge from SAMPLES_FOLDER and PREJUDGE_TIMEOUT.
+
+        Samples default to a "samples" folder inside the solutions folder.
+        """
+        load_config()
+        return cls(
+            getenv("SAMPLES_FOLDER") or os.path.join(input_folder, "samples"),
+            timeout=float(getenv("PREJUDGE_TIMEOUT", "5")),
+        )
+
+    def check(self, jobs):
+        """Check (abspath, lang, problem_code) jobs; returns results in job order."""
+        if not jobs:
+            return []
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(jobs))) as executor:
+            futures = [executor.submit(judge_file, path, lang, problem_code, self.samples_folder,
+                                       self.cache_dir, self.timeout)
+                       for path, lang, problem_code in jobs]
+            return [future.result() for future in futures]
+
+
+def prejudge_enabled(flag=False):
+    """Whether to pre-judge: the --prejudge flag or PREJUDGE in the config."""
+    load_config()
+    return flag or getenv("PREJUDGE", "0").lower() in ["1", "yes", "true"]
+
+
+def review_failures(results):
+    """Print pre-judge failures and ask whether to submit them anyway.
+
+    Returns the set of paths that should not be submitted.
+    """
+    failed = [result for result in results if result["status"] not in PASSING]
+    passed = len(results) - len(failed)
+    print(f"Pre-judge: {passed} passed, {len(failed)} failed")
+    if not failed:
+        return set()
+
+    for result in failed:
+        detail = result["detail"].splitlines()[0] if result["detail"] else ""
+        print(f"  {result['problem_code']:<10}{result['status']:<15}{detail}")
+    try:
+        submit_anyway = input("Submit failing files anyway? (y/n) ").lower()
+    except (KeyboardInterrupt, EOFError):
+        submit_anyway = "n"
+    if submit_anyway in ["y", "yes"]:
+        return set()
+    return {result["path"] for result in failed}
@@ -0,0 +1,58 @@
+"""Thresholds for replacing long-lived drivers before they slow down."""
+
+import time
+from os import getenv
+from .utils import load_config
+
+try:
+    import psutil
+except ImportError:  # RSS tracking is optional
+    psutil = None
+
+
+def chrome_rss(driver):
+    """Get resident memory (bytes) of the Chrome processes behind a driver.
+
+    Returns None when psutil is not installed or the processes are gone.
+    """
+    if psutil is None:
+        return None
+
+    try:
+        service = psutil.Process(driver.service.process.pid)
+        processes = [service] + service.children(recursive=True)
+        return sum(process.memory_info().rss for process in processes)
+    except (AttributeError, psutil.Error):
+        return None
+
+
+class RecyclePolicy:
+    """Decide when a driver has been alive, busy or large for too long."""
+
+    def __init__(self, max_age=3600, max_pages=200, max_rss_mb=1500):
+        """Initialize policy; a threshold of 0 disables that check."""
+        self.max_age = max_age
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+
+    @classmethod
+    def from_config(cls):
+        """Build policy from DRIVER_MAX_AGE, DRIVER_MAX_PAGES and DRIVER_MAX_RSS_MB."""
+        load_config()
+        return cls(
+            max_age=int(getenv("DRIVER_MAX_AGE", "3600")),
+            max_pages=int(getenv("DRIVER_MAX_PAGES", "200")),
+            max_rss_mb=int(getenv("DRIVER_MAX_RSS_MB", "1500")),
+        )
+
+    def reason(self, driver, started, pages):
+        """Return why the driver should be replaced, or None if it is fine."""
+        if self.max_age and time.monotonic() - started >= self.max_age:
+            return "age"
+        if self.max_pages and pages >= self.max_pages:
+            return "page count"
+        if self.max_rss_mb:
+            rss = chrome_rss(driver)
+            if rss is not None and rss >= self.max_rss_mb * 1024 * 1024:
+                return "memory"
+        return None
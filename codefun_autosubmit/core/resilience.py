@@ -0,0 +1,136 @@
+"""Retry, driver respawn and circuit breaking around a SubmissionManager."""
+
+import random
+import time
+from os import getenv
+from .errors import classify
+from .utils import load_config
+
+
+class CircuitBreaker:
+    """Pause all work after too many consecutive outage-like failures."""
+
+    def __init__(self, threshold=5, cooldown=300, sleep=time.sleep):
+        """Initialize breaker.
+
+        Args:
+            threshold: Consecutive failures that open the circuit
+            cooldown: Seconds to pause before letting work through again
+        """
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.sleep = sleep
+        self.failures = 0
+        self.opened_at = None
+
+    @property
+    def is_open(self):
+        """Whether work is currently paused."""
+        return self.opened_at is not None
+
+    def before_call(self):
+        """Wait out the cooldown if the circuit is open."""
+        if self.opened_at is None:
+            return
+        remaining = self.cooldown - (time.monotonic() - self.opened_at)
+        if remaining > 0:
+            print(f"Codefun looks unavailable, pausing for {int(remaining)} secs")
+            self.sleep(remaining)
+
+    def record_success(self):
+        """Close the circuit."""
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        """Count a failure, opening (or re-opening) the circuit at the threshold."""
+        self.failures += 1
+        if self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+
+
+class ResilientManager:
+    """Wrap a SubmissionManager with classified retries.
+
+    Transient DOM failures and server errors are retried with jittered
+    exponential backoff; a dead driver is respawned first; an expired HTTP
+    session is dropped so the next attempt logs in again. Failures that are
+    not retryable (missing files, unknown languages), rate limiting, which
+    is the pacer's job, and submissions that failed after they were sent
+    (SubmitUncertainError) are raised at once, so nothing is judged twice.
+    """
+
+    def __init__(self, manager, retries=None, base_delay=None, max_delay=60, breaker=None,
+                 sleep=time.sleep):
+        """Initialize wrapper, reading unset limits from config."""
+        load_config()
+        self.manager = manager
+        self.retries = int(getenv("SUBMIT_RETRIES", "3")) if retries is None else retries
+        self.base_delay = float(getenv("RETRY_BASE_DELAY", "2")) if base_delay is None else base_delay
+        self.max_delay = max_delay
+        self.breaker = breaker or CircuitBreaker(
+            threshold=int(getenv("BREAKER_THRESHOLD", "5")),
+            cooldown=int(getenv("BREAKER_COOLDOWN", "300")),
+            sleep=sleep,
+        )
+        self.sleep = sleep
+
+    def __getattr__(self, name):
+        return getattr(self.manager, name)
+
+    def call(self, method, *args, **kwargs):
+        """Call a manager method, retrying according to the failure kind."""
+        attempt = 0
+        while True:
+            self.breaker.before_call()
+            try:
+                result = getattr(self.manager, method)(*args, **kwargs)
+            except Exception as e:
+                kind = classify(e)
+                if kind in (None, "rate_limit", "uncertain"):
+                    raise
+                if kind in ("server", "driver"):
+                    self.breaker.record_failure()
+                if attempt >= self.retries:
+                    raise
+
+                attempt += 1
+                print(f"{method} failed ({kind}: {e}), retry {attempt}/{self.retries}")
+                self.recover(kind)
+                self.sleep(random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt)))
+                continue
+
+            self.breaker.record_success()
+            return result
+
+    def recover(self, kind):
+        """Repair the manager state a failure kind points to."""
+        if kind == "driver" and getattr(self.manager, "driver_factory", None) is not None:
+            self.manager.recycle_driver()
+        if kind == "session" and getattr(self.manager, "client", None) is not None:
+            self.manager.client.logout()
+
+    def warm_up(self):
+        """Log in ahead of the first submission with retries."""
+        return self.call("warm_up")
+
+    def submit(self, abspath, lang, problem_code):
+        """Submit a file with retries."""
+        return self.call("submit", abspath, lang, problem_code)
+
+    def prepare(self, abspath, lang, problem_code):
+        """Prepare a submission with retries."""
+        return self.call("prepare", abspath, lang, problem_code)
+
+    def submit_file(self, filename):
+        """Submit a single file with retries."""
+        return self.call("submit_file", filename)
+
+    def submit_by_id(self, problem_id, language, input_folder=None):
+        """Submit code by problem ID with retries."""
+        return self.call("submit_by_id", problem_id, language, input_folder=input_folder)
+
+    def retrieve_submission(self, submission_id, problem_code, language, crawl_folder=None):
+        """Retrieve submitted code with retries."""
+        return self.call("retrieve_submission", submission_id, problem_code, language,
+                         crawl_folder=crawl_folder)
@@ -0,0 +1,71 @@
+"""Persist login sessions in the configuration folder between runs."""
+
+import json
+from .utils import get_config_dir
+
+
+class SessionStore:
+    """Store cookies, local storage and tokens for one session kind."""
+
+    def __init__(self, name, path=None):
+        """Initialize store backed by {config_dir}/{name}-session.json."""
+        self.path = path or get_config_dir() / f"{name}-session.json"
+
+    def load(self):
+        """Load saved session data, or an empty dict if none is usable."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self, data):
+        """Save session data."""
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    def clear(self):
+        """Forget the saved session."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def save_browser_session(driver, store=None):
+    """Save the driver's cookies and local storage."""
+    store = store or SessionStore("browser")
+    store.save({
+        "cookies": driver.get_cookies(),
+        "local_storage": driver.execute_script(
+            "var items = {};"
+            "for (var i = 0; i < localStorage.length; i++) {"
+            "  var key = localStorage.key(i); items[key] = localStorage.getItem(key);"
+            "}"
+            "return items;"
+        ),
+    })
+
+
+def restore_browser_session(driver, base_url, store=None):
+    """Restore a saved browser session. Returns True if anything was restored.
+
+    The driver must be on the Codefun origin before cookies and local
+    storage can be set, so base_url is loaded first.
+    """
+    store = store or SessionStore("browser")
+    data = store.load()
+    if not data:
+        return False
+
+    driver.get(base_url)
+    for cookie in data.get("cookies", []):
+        cookie.pop("sameSite", None)
+        try:
+            driver.add_cookie(cookie)
+        except Exception:
+            pass
+    for key, value in data.get("local_storage", {}).items():
+        driver.execute_script("localStorage.setItem(arguments[0], arguments[1]);", key, value)
+
+    return True
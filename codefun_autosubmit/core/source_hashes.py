@@ -0,0 +1,102 @@
+"""Content hashes of submitted sources, so identical code is not sent twice."""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from os import getenv
+from .utils import get_config_dir, load_config
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    problem_code TEXT PRIMARY KEY,
+    language TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    submission_id INTEGER,
+    recorded_at REAL NOT NULL
+);
+"""
+
+
+def normalize_source(text):
+    """Drop BOM, line ending, trailing space and trailing blank line differences."""
+    text = text.lstrip("\ufeff").replace("\r\n", "\n").replace("\r", "\n")
+    return "\n".join(line.rstrip() for line in text.split("\n")).rstrip("\n")
+
+
+def code_digest(text):
+    """SHA-256 of normalized source code."""
+    return hashlib.sha256(normalize_source(text).encode("utf-8")).hexdigest()
+
+
+def source_digest(path):
+    """SHA-256 of a source file's normalized contents."""
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        return code_digest(f.read())
+
+
+def skip_unchanged_enabled():
+    """Whether batch/watch skip files identical to their last submission (SKIP_UNCHANGED)."""
+    load_config()
+    return getenv("SKIP_UNCHANGED", "1").lower() not in ["0", "no", "false"]
+
+
+class SourceHashes:
+    """Remember the normalized hash of the last source sent for each problem."""
+
+    def __init__(self, path=None):
+        """Open (creating if needed) the hash database in the config folder."""
+        self.path = path or get_config_dir() / "sources.db"
+        self.db = sqlite3.connect(str(self.path), timeout=30, isolation_level=None,
+                                  check_same_thread=False)
+        self.lock = threading.Lock()
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        """Close the database."""
+        with self.lock:
+            self.db.close()
+
+    def record(self, problem_code, language, digest, submission_id=None):
+        """Store the hash of the latest source for a problem.
+
+        A hash from an older submission (lower ID) does not replace a newer one.
+        """
+        with self.lock:
+            self.db.execute(
+                "INSERT INTO sources (problem_code, language, digest, submission_id, recorded_at) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT (problem_code) DO UPDATE SET "
+                "language = excluded.language, digest = excluded.digest, "
+                "submission_id = excluded.submission_id, recorded_at = excluded.recorded_at "
+                "WHERE excluded.submission_id IS NULL OR sources.submission_id IS NULL "
+                "OR excluded.submission_id >= sources.submission_id",
+                (problem_code, language, digest, submission_id, time.time()),
+            )
+
+    def record_code(self, problem_code, language, code, submission_id=None):
+        """Store the hash of source code exactly as it was submitted."""
+        self.record(problem_code, language, code_digest(code), submission_id)
+
+    def record_file(self, problem_code, language, path, submission_id=None):
+        """Store the hash of a source file that was just submitted or fetched."""
+        try:
+            digest = source_digest(path)
+        except OSError:
+            return
+        self.record(problem_code, language, digest, submission_id)
+
+    def last(self, problem_code):
+        """(language, digest) of the last source for a problem, or None."""
+        with self.lock:
+            row = self.db.execute("SELECT language, digest FROM sources WHERE problem_code = ?",
+                                  (problem_code,)).fetchone()
+        return tuple(row) if row else None
+
+    def is_unchanged(self, problem_code, language, path):
+        """Whether a file is the same code, in the same language, as the last submission."""
+        try:
+            return self.last(problem_code) == (language, source_digest(path))
+        except OSError:
+            return False
@@ -0,0 +1,165 @@
+"""Shared, cached snapshot of the user's Codefun stats."""
+
+import threading
+import time
+import requests
+from os import getenv
+from .session import SessionStore
+from .utils import get_base_url, get_config_dir, load_config
+
+
+def is_accepted(row):
+    """Whether a stats row has full score."""
+    return abs(row["score"] - row["maxScore"]) < 0.000000001
+
+
+def language_name(data):
+    """Language of a stats row or submission, which may be a name or an object."""
+    language = data.get("language")
+    if isinstance(language, dict):
+        return language.get("name") or language.get("code")
+    return language
+
+
+class StatsSnapshot:
+    """Stats rows indexed once for fast membership checks."""
+
+    def __init__(self, rows):
+        """Index rows from /api/users/{username}/stats."""
+        self.rows = rows
+        self.by_problem = {row["problem"]["code"]: row for row in rows}
+        self.submitted = set(self.by_problem)
+        self.accepted = {code for code, row in self.by_problem.items() if is_accepted(row)}
+
+    def accepted_problems(self):
+        """Accepted problem codes in stats order."""
+        return [code for code in self.by_problem if code in self.accepted]
+
+    def submitted_problems(self):
+        """Submitted problem codes in stats order."""
+        return list(self.by_problem)
+
+    def accepted_submissions(self, language=None):
+        """[submission_id, problem_code] of the accepted submission of each AC problem.
+
+        With a language, submissions the stats show in another language are
+        left out, so their pages are never loaded; submissions whose language
+        the stats do not show are kept.
+        """
+        return [[row["submissionId"], code] for code, row in self.by_problem.items()
+                if code in self.accepted
+                and (language is None or language_name(row) in (None, language))]
+
+
+class StatsClient:
+    """Fetch stats at most once per TTL, revalidating with ETag/Last-Modified.
+
+    The parsed snapshot is kept in memory and in the config folder, so
+    separate runs within the TTL make no request at all.
+    """
+
+    def __init__(self, username=None, base_url=None, ttl=None, timeout=15, store=None):
+        """Initialize client.
+
+        Args:
+            username: Codefun username (default: CF_USERNAME)
+            base_url: Site URL (default: CODEFUN_URL or https://codefun.vn)
+            ttl: Seconds a snapshot is used without asking the server (default: STATS_TTL)
+            timeout: Request timeout in seconds
+            store: SessionStore for the on-disk copy (default: stats-cache.json);
+                False keeps the snapshot in memory only
+        """
+        load_config()
+        self.username = username or getenv("CF_USERNAME")
+        self.base_url = (base_url or get_base_url()).rstrip("/")
+        self.ttl = float(getenv("STATS_TTL", "300")) if ttl is None else ttl
+        self.timeout = timeout
+        if store is None:
+            store = SessionStore("stats", path=get_config_dir() / "stats-cache.json")
+        self.store = store or None
+        self.session = requests.Session()
+        self.lock = threading.Lock()
+        self.cached = None
+        self.current = None
+
+    def _load(self):
+        if self.cached is None and self.store is not None:
+            saved = self.store.load()
+            if saved.get("username") == self.username and saved.get("base_url") == self.base_url:
+                self.cached = saved
+                self.current = StatsSnapshot(saved["rows"])
+        return self.cached
+
+    def _save(self):
+        if self.store is not None:
+            self.store.save(self.cached)
+
+    def snapshot(self, max_age=None):
+        """Current StatsSnapshot, refreshed if it is older than max_age (default: TTL).
+
+        If the server cannot be reached, a stale snapshot is returned when
+        there is one; otherwise the error is raised.
+        """
+        max_age = self.ttl if max_age is None else max_age
+        with self.lock:
+            cached = self._load()
+            if cached and time.time() - cached["fetched_at"] < max_age:
+                return self.current
+
+            headers = {}
+            if cached and cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached and cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+            try:
+                response = self.session.get(f"{self.base_url}/api/users/{self.username}/stats",
+                                            headers=headers, timeout=self.timeout)
+                if response.status_code != 304:
+                    response.raise_for_status()
+            except requests.RequestException:
+                if cached:
+                    print("Could not refresh stats, using the cached copy")
+                    return self.current
+                raise
+
+            if response.status_code == 304:
+                cached["fetched_at"] = time.time()
+            else:
+                self.cached = cached = {
+                    "username": self.username,
+                    "base_url": self.base_url,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "fetched_at": time.time(),
+                    "rows": response.json()["data"],
+                }
+                self.current = StatsSnapshot(cached["rows"])
+            self._save()
+            return self.current
+
+    def invalidate(self):
+        """Make the next snapshot() ask the server (still conditionally)."""
+        with self.lock:
+            if self._load():
+                self.cached["fetched_at"] = 0
+
+    def close(self):
+        """Close the HTTP session."""
+        self.session.close()
+
+
+_shared_client = None
+_shared_lock = threading.Lock()
+
+
+def get_stats(max_age=None):
+    """Stats snapshot from the process-wide StatsClient."""
+    global _shared_client
+    load_config()
+    with _shared_lock:
+        if _shared_client is None or _shared_client.username != getenv("CF_USERNAME") \
+                or _shared_client.base_url != get_base_url():
+            _shared_client = StatsClient()
+        client = _shared_client
+    return client.snapshot(max_age)
@@ -1,30 +1,45 @@
 """Core submission functionality."""
 
 import json
-import pyperclip
-from selenium.webdriver.common.by import By
+import time
+from collections import namedtuple
+from selenium.common.exceptions import (ElementClickInterceptedException,
+                                        ElementNotInteractableException,
+                                        StaleElementReferenceException, TimeoutException,
+                                        WebDriverException)
 from selenium.webdriver.support.ui import Select
-from selenium.webdriver.common.keys import Keys
 from os import getenv
-from .browser import load_page, login_to_codefun
-from .utils import get_extension, load_config
+from .browser import ensure_login, load_page, set_field_value
+from .errors import RateLimitedError, SessionExpiredError, SubmitUncertainError, TransientDomError
+from .recycle import RecyclePolicy
+from .utils import get_base_url, get_extension, load_config
+from .waits import wait_for, wait_for_any
+
+
+BACKENDS = ["selenium", "http"]
+
+# What prepare() returns when there is no form to fill
+PreparedSource = namedtuple("PreparedSource", ["abspath", "lang", "problem_code", "source"])
 
 
 class Query:
     """Handle individual code submission queries."""
     
-    def __init__(self, driver, abspath, lang, problem_id):
-        """Initialize submission query."""
-        load_page(driver, "https://codefun.vn/submit", 5)
-        login_to_codefun(driver)
+    def __init__(self, driver, abspath, lang, problem_id, submit=True):
+        """Initialize submission query.
+
+        With submit=False the form is only filled; call fire() to submit it.
+        """
+        self.driver = driver
+        load_page(driver, f"{get_base_url()}/submit")
+        if ensure_login(driver, ready="submit_form") != "Success":
+            raise SessionExpiredError("Login failed")
 
         try:
-            form_pcode = driver.find_element(By.XPATH, "//input[@placeholder = 'Pxxxxx']")
-            form_lang = Select(driver.find_element(By.XPATH, "//select[@class = 'form-control']"))
-            form_sol = driver.find_element(By.XPATH, "//textarea")
-            form_submit = driver.find_element(By.XPATH, "//button[@type = 'submit']")
-        except:
-            raise Exception("Selenium Error")
+            form_pcode, form_lang, form_sol, form_submit = wait_for(driver, "submit_form")
+            form_lang = Select(form_lang)
+        except TimeoutException:
+            raise TransientDomError("Selenium Error")
             
         try:
             with open(abspath, 'r') as txt:
@@ -34,11 +49,46 @@ class Query:
 
         form_pcode.send_keys(problem_id)
         form_lang.select_by_value(lang)
-        old_clipboard = pyperclip.paste()
-        pyperclip.copy(data)
-        form_sol.send_keys(Keys.CONTROL, "v")
-        pyperclip.copy(old_clipboard)
-        form_submit.click()
+        set_field_value(driver, form_sol, data)
+        self.source = data
+        self.form_submit = form_submit
+        self.submission_id = None
+
+        if submit:
+            self.fire()
+            self.check_result()
+
+    def fire(self):
+        """Click the submit button of the filled form.
+
+        Raises SubmitUncertainError if the click failed in a way that may
+        still have sent the form.
+        """
+        try:
+            self.form_submit.click()
+        except (StaleElementReferenceException, ElementClickInterceptedException,
+                ElementNotInteractableException):
+            # The click never reached the button
+            raise
+        except WebDriverException as e:
+            raise SubmitUncertainError(f"Submit click failed: {e.msg}") from e
+
+    def check_result(self):
+        """Record the new submission ID, or raise RateLimitedError.
+
+        Codefun redirects to the submission page after a successful submit;
+        if neither that nor a rate-limit message shows up, the ID stays None.
+        """
+        try:
+            state, result = wait_for_any(self.driver, ["submitted", "rate_limited"])
+        except TimeoutException:
+            return None
+        except WebDriverException as e:
+            raise SubmitUncertainError(f"Result of the submit could not be read: {e.msg}") from e
+        if state == "rate_limited":
+            raise RateLimitedError("Rate limit message shown")
+        self.submission_id = result
+        return result
 
     def __del__(self):
         """Cleanup."""
@@ -48,86 +98,185 @@ class Query:
 class SubmissionManager:
     """Manage code submissions."""
     
-    def __init__(self, driver):
-        """Initialize submission manager."""
+    def __init__(self, driver=None, backend="selenium", client=None, driver_factory=None,
+                 recycle_policy=None):
+        """Initialize submission manager.
+
+        Args:
+            driver: Selenium WebDriver (selenium backend, unless driver_factory is given)
+            backend: "selenium" to drive the web form, "http" to post to the API
+            client: Optional CodefunClient to use for the http backend
+            driver_factory: Callable returning a new driver; lets the manager
+                replace its driver when recycle_policy says it is worn out
+            recycle_policy: RecyclePolicy (default: from config when a
+                driver_factory is given)
+        """
+        if backend not in BACKENDS:
+            raise Exception(f"Unknown backend: {backend}")
+
+        if backend == "selenium" and driver is None and driver_factory is not None:
+            driver = driver_factory()
+
         self.driver = driver
+        self.backend = backend
+        self.client = client
+        self.driver_factory = driver_factory
+        self.recycle_policy = recycle_policy
+        if self.recycle_policy is None and driver_factory is not None:
+            self.recycle_policy = RecyclePolicy.from_config()
+        self.driver_started = time.monotonic()
+        self.page_count = 0
+
+        if backend == "http" and self.client is None:
+            from .http import CodefunClient
+            self.client = CodefunClient()
+
+    def submit(self, abspath, lang, problem_code):
+        """Submit a file through the configured backend."""
+        if self.backend == "http":
+            try:
+                with open(abspath, 'r') as txt:
+                    data = txt.read()
+            except:
+                raise Exception("File not found")
+            return self.client.submit(problem_code, lang, data)
+
+        self.before_page_load()
+        return Query(self.driver, abspath, lang, problem_code).submission_id
+
+    def prepare(self, abspath, lang, problem_code):
+        """Get a submission ready so that fire() only has to send it.
+
+        The selenium backend loads the submit page and fills the form; other
+        backends read the source. Either way the result's source attribute
+        is the code that fire() sends.
+        """
+        if self.backend == "selenium":
+            self.before_page_load()
+            return Query(self.driver, abspath, lang, problem_code, submit=False)
+
+        try:
+            with open(abspath, 'r') as txt:
+                data = txt.read()
+        except:
+            raise Exception("File not found")
+        return PreparedSource(abspath, lang, problem_code, data)
+
+    def fire(self, prepared):
+        """Send a submission made by prepare() and return its ID."""
+        if isinstance(prepared, Query):
+            prepared.fire()
+            return prepared.check_result()
+
+        abspath, lang, problem_code, data = prepared
+        if self.backend == "http":
+            return self.client.submit(problem_code, lang, data)
+        return self.submit(abspath, lang, problem_code)
+
+    def warm_up(self):
+        """Log in ahead of the first submission, so it does not pay for it.
+
+        Returns True if the session is ready.
+        """
+        if self.backend == "http":
+            self.client.ensure_login()
+            return True
+
+        self.before_page_load()
+        load_page(self.driver, f"{get_base_url()}/submit")
+        return ensure_login(self.driver, ready="submit_form") == "Success"
+
+    def before_page_load(self):
+        """Count a page load, replacing the driver first if it is worn out.
+
+        The new driver restores the saved login, so callers carry on with
+        their work list as if nothing happened.
+        """
+        if self.driver_factory is not None and self.recycle_policy is not None:
+            reason = self.recycle_policy.reason(self.driver, self.driver_started, self.page_count)
+            if reason:
+                print(f"Recycling browser ({reason})")
+                self.recycle_driver()
+        self.page_count += 1
+
+    def recycle_driver(self):
+        """Quit the current driver and start a fresh one."""
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+        self.driver = self.driver_factory()
+        self.driver_started = time.monotonic()
+        self.page_count = 0
+
+    def close(self):
+        """Release the driver or HTTP session held by this manager."""
+        if self.driver is not None:
+            self.driver.quit()
+        if self.client is not None:
+            self.client.close()
     
     def submit_file(self, filename):
         """Submit a single file."""
-        from .utils import get_language
+        from .workspace import solution_info
         
-        lang = get_language(filename[filename.rfind('.') + 1:])
-        Query(self.driver, filename, lang, filename[:filename.rfind('.')].split("\\")[-1])
+        problem_code, lang = solution_info(filename)
+        return self.submit(filename, lang, problem_code)
     
     def submit_by_id(self, problem_id, language, input_folder=None):
         """Submit code by problem ID and language."""
+        found_file, detected_language = self.find_file(problem_id, language, input_folder)
+        return self.submit(found_file, detected_language, f"P{problem_id}")
+
+    def find_file(self, problem_id, language, input_folder=None):
+        """Find the solution file for a problem ID, preferring the given language.
+
+        Returns (path, language).
+        """
         load_config()
         file_path = input_folder or getenv("PATH_TO_FOLDER")
         
-        # Check for files with different extensions
-        import os
-        from .utils import get_language
-        
-        # Try to find file with specified language extension first
-        ext = get_extension(language)
-        target_file = f"{file_path}\\P{problem_id}.{ext}"
+        from .workspace import WorkspaceIndex
+        found = WorkspaceIndex(file_path).find(f"P{problem_id}", language)
+        if found is None:
+            raise Exception(f"No file found for problem P{problem_id}")
         
-        if os.path.exists(target_file):
-            Query(self.driver, target_file, language, f"P{problem_id}")
-        else:
-            # Auto-detect language from existing file
-            found_file = None
-            detected_language = None
-            
-            for ext in ["cpp", "py", "pas", "s"]:
-                test_file = f"{file_path}\\P{problem_id}.{ext}"
-                if os.path.exists(test_file):
-                    found_file = test_file
-                    detected_language = get_language(ext)
-                    break
-            
-            if found_file:
-                print(f"File found with different extension. Using {detected_language} instead of {language}")
-                Query(self.driver, found_file, detected_language, f"P{problem_id}")
-            else:
-                raise Exception(f"No file found for problem P{problem_id}")
+        found_file, detected_language = found
+        if detected_language != language:
+            print(f"File found with different extension. Using {detected_language} instead of {language}")
+        return found_file, detected_language
     
     def retrieve_submission(self, submission_id, problem_code, language, crawl_folder=None):
-        """Retrieve submitted code."""
-        load_page(self.driver, f"https://codefun.vn/submissions/{submission_id}", 3)
-        login_to_codefun(self.driver)
+        """Retrieve submitted code and return the path it was saved to.
+
+        With language=None, code in any language is saved under its own
+        extension; otherwise code in other languages is skipped (None).
+        """
+        self.before_page_load()
+        load_page(self.driver, f"{get_base_url()}/submissions/{submission_id}")
+        ensure_login(self.driver, ready="submission_code")
 
         load_config()
         path = crawl_folder or getenv("CRAWL_FOLDER") or getenv("PATH_TO_FOLDER")
 
         try:
-            rawcode = self.driver.find_element(By.XPATH, "//code").text
-            lang_text = self.driver.find_element(By.XPATH, "//*[@id='root']/div/div[1]/div[1]/div/div/div[1]/div/div[2]/ul/li[3]/b").text
-        except:
+            code, lang = wait_for(self.driver, "submission_code")
+            rawcode = code.text
+            lang_text = lang.text
+        except TimeoutException:
             return "No code found"
 
         print(lang_text)
 
-        if lang_text != language:
+        if language is not None and lang_text != language:
             return
 
-        from .utils import get_extension
-        with open(f"{path}/{problem_code}.{get_extension(language)}", "w+", encoding="utf-8") as f:
+        saved_path = f"{path}/{problem_code}.{get_extension(lang_text)}"
+        with open(saved_path, "w+", encoding="utf-8") as f:
             f.write(rawcode)
+        return saved_path
     
-    def get_all_accepted_submissions(self):
-        """Get all accepted submissions."""
-        load_config()
-        username = getenv("CF_USERNAME")
-        
-        import requests
-        response = requests.get(f"https://codefun.vn/api/users/{username}/stats?")
-        data = response.json()["data"]
-
-        sublist = []
-
-        for problem in data:
-            if abs(problem["score"] - problem["maxScore"]) < 0.000000001:
-                sublist.append([problem["submissionId"], problem["problem"]["code"]])
-
-        return sublist
\ No newline at end of file
+    def get_all_accepted_submissions(self, language=None):
+        """Get [submission_id, problem_code] of all accepted submissions (in a language)."""
+        from .stats import get_stats
+        return get_stats().accepted_submissions(language)
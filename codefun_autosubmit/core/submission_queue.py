@@ -0,0 +1,227 @@
+"""Durable submission queue stored in SQLite under the config folder."""
+
+import os
+import sqlite3
+import threading
+import time
+from .utils import get_config_dir
+
+try:
+    import psutil
+except ImportError:  # Process checks fall back to the OS APIs
+    psutil = None
+
+
+# queued -> submitting -> submitted -> judged, or failed at any step
+STATES = ["queued", "submitting", "submitted", "judged", "failed"]
+
+# Submissions whose ID is unknown cannot be tracked to a verdict; they stop
+# blocking their problem after this many seconds
+UNTRACKED_TTL = 3600
+
+# Tracked submissions whose verdict was never recorded (tracking disabled,
+# timed out or unreachable) stop blocking their problem after this many seconds
+VERDICT_TTL = 6 * 3600
+
+# Windows process access right and exit code of a running process
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+STILL_ACTIVE = 259
+ERROR_ACCESS_DENIED = 5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    path TEXT NOT NULL,
+    problem_code TEXT NOT NULL,
+    language TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'queued',
+    owner_pid INTEGER,
+    submission_id INTEGER,
+    result TEXT,
+    score REAL,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state, id);
+CREATE INDEX IF NOT EXISTS jobs_problem ON jobs (problem_code, state);
+CREATE INDEX IF NOT EXISTS jobs_submission ON jobs (submission_id);
+"""
+
+
+def pid_alive(pid):
+    """Whether a process with this PID is still running.
+
+    Never signals the process: on Windows os.kill terminates it.
+    """
+    if not pid:
+        return False
+    if psutil is not None:
+        return psutil.pid_exists(pid)
+    if os.name == "nt":
+        return windows_pid_alive(pid)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+def windows_pid_alive(pid):
+    """Whether a Windows process is running, via OpenProcess/GetExitCodeProcess."""
+    import ctypes
+    from ctypes import wintypes
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        # The process exists but belongs to someone we may not query
+        return ctypes.get_last_error() == ERROR_ACCESS_DENIED
+    try:
+        exit_code = wintypes.DWORD()
+        if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+            return True
+        return exit_code.value == STILL_ACTIVE
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+class SubmissionQueue:
+    """Track every file from queued to judged across runs and processes."""
+
+    def __init__(self, path=None):
+        """Open (creating if needed) the queue database."""
+        self.path = path or get_config_dir() / "queue.db"
+        self.db = sqlite3.connect(str(self.path), timeout=30, isolation_level=None,
+                                  check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        # The verdict tracker thread shares the connection
+        self.lock = threading.RLock()
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        """Close the database."""
+        with self.lock:
+            self.db.close()
+
+    def _update(self, where, args, **fields):
+        fields["updated_at"] = time.time()
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self.lock:
+            self.db.execute(f"UPDATE jobs SET {assignments} WHERE {where}",
+                            [*fields.values(), *args])
+
+    def _transaction(self, fn):
+        with self.lock:
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                result = fn()
+            except Exception:
+                self.db.execute("ROLLBACK")
+                raise
+            self.db.execute("COMMIT")
+            return result
+
+    def enqueue(self, path, problem_code, language):
+        """Queue a file unless its problem already has an active job.
+
+        Returns the job ID, or None if it was already queued, being
+        submitted, or submitted and still waiting for a verdict. Submitted
+        jobs stop counting after UNTRACKED_TTL (no submission ID) or
+        VERDICT_TTL, so a verdict that is never recorded cannot block a
+        problem forever.
+        """
+        now = time.time()
+
+        def insert():
+            active = self.db.execute(
+                "SELECT id FROM jobs WHERE problem_code = ? AND (state IN ('queued', 'submitting') "
+                "OR (state = 'submitted' AND updated_at > "
+                "CASE WHEN submission_id IS NULL THEN ? ELSE ? END))",
+                (problem_code, now - UNTRACKED_TTL, now - VERDICT_TTL),
+            ).fetchone()
+            if active:
+                return None
+            return self.db.execute(
+                "INSERT INTO jobs (path, problem_code, language, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (path, problem_code, language, now, now),
+            ).lastrowid
+
+        return self._transaction(insert)
+
+    def claim_next(self):
+        """Atomically take the oldest queued job for this process, or None."""
+        def claim():
+            job = self.db.execute(
+                "SELECT * FROM jobs WHERE state = 'queued' ORDER BY id LIMIT 1"
+            ).fetchone()
+            if not job:
+                return None
+            self._update("id = ?", (job["id"],), state="submitting", owner_pid=os.getpid())
+            return dict(self.db.execute("SELECT * FROM jobs WHERE id = ?", (job["id"],)).fetchone())
+
+        return self._transaction(claim)
+
+    def discard(self, job_ids):
+        """Delete jobs that are still queued, e.g. after the user aborts."""
+        with self.lock:
+            self.db.executemany("DELETE FROM jobs WHERE id = ? AND state = 'queued'",
+                                [(job_id,) for job_id in job_ids])
+
+    def release(self, job_id):
+        """Put a claimed job back at its place in the queue."""
+        self._update("id = ?", (job_id,), state="queued", owner_pid=None)
+
+    def mark_submitted(self, job_id, submission_id):
+        """Record that a job reached the judge."""
+        self._update("id = ?", (job_id,), state="submitted", submission_id=submission_id)
+
+    def mark_failed(self, job_id, error):
+        """Record that a job could not be submitted."""
+        self._update("id = ?", (job_id,), state="failed", error=str(error))
+
+    def mark_judged(self, submission_id, result, score):
+        """Record the verdict of a submitted job."""
+        self._update("submission_id = ?", (submission_id,), state="judged", result=result,
+                     score=score)
+
+    def recover(self):
+        """Settle jobs claimed by processes that died mid-submission.
+
+        Such a job may already have reached the judge, so it is never sent
+        again: it is marked submitted without a submission ID and stops
+        blocking its problem after UNTRACKED_TTL.
+
+        Returns the number of jobs settled.
+        """
+        with self.lock:
+            rows = self.db.execute("SELECT id, owner_pid FROM jobs WHERE state = 'submitting'").fetchall()
+        stale = [row["id"] for row in rows if not pid_alive(row["owner_pid"])]
+        for job_id in stale:
+            self._update("id = ?", (job_id,), state="submitted", submission_id=None)
+        return len(stale)
+
+    def jobs(self, *states):
+        """Jobs in the given states (all jobs if none given), oldest first."""
+        with self.lock:
+            if states:
+                placeholders = ", ".join("?" for _ in states)
+                rows = self.db.execute(
+                    f"SELECT * FROM jobs WHERE state IN ({placeholders}) ORDER BY id", states
+                ).fetchall()
+            else:
+                rows = self.db.execute("SELECT * FROM jobs ORDER BY id").fetchall()
+        return [dict(row) for row in rows]
+
+    def counts(self):
+        """Number of jobs per state."""
+        counts = dict.fromkeys(STATES, 0)
+        with self.lock:
+            rows = self.db.execute("SELECT state, COUNT(*) AS n FROM jobs GROUP BY state").fetchall()
+        for row in rows:
+            counts[row["state"]] = row["n"]
+        return counts
@@ -1,14 +1,12 @@
 """Utility functions for language handling and API interactions."""
 
-import json
 import os
-import requests
 from dotenv import load_dotenv
-from os import getenv, listdir
+from os import getenv
 from pathlib import Path
 
 
-def get_config_path():
+def get_config_dir():
     """Get absolute path to AppData configuration folder."""
     if os.name == 'nt':  # Windows
         appdata = os.environ.get('APPDATA', '')
@@ -18,7 +16,12 @@ def get_config_path():
         config_dir = Path(home) / '.config' / 'codefun-autosubmit'
     
     config_dir.mkdir(parents=True, exist_ok=True)
-    return config_dir / '.env'
+    return config_dir
+
+
+def get_config_path():
+    """Get absolute path to the .env file in the configuration folder."""
+    return get_config_dir() / '.env'
 
 
 def load_config():
@@ -27,6 +30,12 @@ def load_config():
     load_dotenv(env_path)
 
 
+def get_base_url():
+    """Get Codefun base URL (overridable with CODEFUN_URL for local testing)."""
+    load_config()
+    return (getenv("CODEFUN_URL") or "https://codefun.vn").rstrip("/")
+
+
 def get_extension(language):
     """Get file extension for programming language."""
     language_map = {
@@ -58,77 +67,48 @@ def get_language(extension):
 
 
 def get_accepted_problems():
-    """Get list of accepted problems from Codefun API."""
-    load_config()
-    username = getenv("CF_USERNAME")
-    
-    accepted = []
-    response = requests.get(f"https://codefun.vn/api/users/{username}/stats?")
-    json_data = json.loads(response.text)["data"]
-
-    for submission in json_data:
-        if abs(submission["score"] - submission["maxScore"]) < 0.000000001:
-            accepted.append(submission["problem"]["code"])
-    
-    return accepted
+    """Get list of accepted problems from the cached Codefun stats."""
+    from .stats import get_stats
+    return get_stats().accepted_problems()
 
 
 def get_submitted_problems():
-    """Get list of all submitted problems (regardless of status) from Codefun API."""
-    load_config()
-    username = getenv("CF_USERNAME")
-    
-    submitted = []
-    response = requests.get(f"https://codefun.vn/api/users/{username}/stats?")
-    json_data = json.loads(response.text)["data"]
+    """Get list of all submitted problems (regardless of status) from the cached Codefun stats."""
+    from .stats import get_stats
+    return get_stats().submitted_problems()
 
-    for submission in json_data:
-        submitted.append(submission["problem"]["code"])
-    
-    return submitted
 
-
-def get_loop_list(folder_path=None, skip_submitted=False):
+def get_loop_list(folder_path=None, skip_submitted=False, offline=False):
     """Get list of problems to submit.
     
     Args:
         folder_path: Path to folder containing code files
         skip_submitted: If True, skip all submitted problems. If False, only skip AC problems.
+        offline: Use only the local history, without asking Codefun for stats
+
+    Returns paths relative to the folder (subfolders included), one per problem.
     """
     load_config()
     file_path = folder_path or getenv("PATH_TO_FOLDER")
     
-    # Get list of problems to skip based on option
-    if skip_submitted:
-        from .utils import get_submitted_problems
-        skip_list = get_submitted_problems()
-    else:
-        skip_list = get_accepted_problems()
-    
-    sublist = []
-    processed_problems = set()  # Track problems we've already added
-    
-    # Get all supported extensions
-    supported_exts = ["cpp", "py", "pas", "s"]
+    # Get set of problems to skip based on option, from the local history
+    # after mirroring the latest stats and our own verdicts into it
+    from .history import History
+    from .submission_queue import SubmissionQueue
+    history = History()
+    if not offline:
+        from .stats import get_stats
+        history.sync_stats(get_stats())
+    queue = SubmissionQueue()
+    history.sync_queue(queue)
+    queue.close()
+    skip_list = history.submitted() if skip_submitted else history.accepted()
+    history.close()
     
-    for filename in listdir(file_path):
-        if filename.startswith("pass"):
-            continue
-            
-        # Extract problem name (without extension)
-        problem_name = filename.split(".")[0]
-        
-        # Skip if already processed this problem
-        if problem_name in processed_problems:
-            continue
-            
-        # Check if file has supported extension and problem not yet accepted
-        file_ext = filename.split(".")[-1] if "." in filename else ""
-        
-        if (file_ext in supported_exts and 
-            problem_name not in skip_list):
-            print(problem_name)
-            sublist.append(filename)
-            processed_problems.add(problem_name)
+    # One file per problem from the workspace index, preferring LANGUAGE
+    from .workspace import WorkspaceIndex, solution_info
+    files = WorkspaceIndex(file_path).files(getenv("LANGUAGE"))
+    sublist = [file for file in files if solution_info(file)[0] not in skip_list]
+    print(f"{len(sublist)} of {len(files)} solution file(s) to submit")
     
     return sublist
\ No newline at end of file
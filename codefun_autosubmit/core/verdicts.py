@@ -0,0 +1,166 @@
+"""Background tracking of verdicts for new submissions."""
+
+import threading
+import time
+from os import getenv
+from .http import CodefunClient
+from .utils import load_config
+
+
+# Results Codefun shows while a submission is still waiting or being judged
+PENDING_RESULTS = {"", "Q", "R", "Pending", "Queued", "Running", "Judging", "Compiling"}
+
+
+def is_pending(result):
+    """Whether a submission result is not final yet."""
+    return result is None or result in PENDING_RESULTS
+
+
+def start_tracker(on_verdict=None):
+    """Start a VerdictTracker, or return None if TRACK_VERDICTS is off."""
+    load_config()
+    if getenv("TRACK_VERDICTS", "1").lower() in ["0", "no", "false"]:
+        return None
+    return VerdictTracker(on_verdict=on_verdict)
+
+
+def finish_tracker(tracker):
+    """Wait up to VERDICT_WAIT seconds for pending verdicts, print them and stop.
+
+    Ctrl+C stops waiting; the verdicts known so far are still printed.
+    """
+    if tracker is None:
+        return
+    if tracker.pending_count():
+        print("Waiting for verdicts (Ctrl+C to stop waiting)...")
+        try:
+            tracker.wait(timeout=int(getenv("VERDICT_WAIT", "120")))
+        except KeyboardInterrupt:
+            print("Stopped waiting for verdicts")
+    tracker.print_results()
+    tracker.stop()
+
+
+class VerdictTracker:
+    """Poll submission results in a background thread with backoff."""
+
+    def __init__(self, client=None, poll_interval=3, max_interval=60, on_verdict=None):
+        """Initialize tracker.
+
+        Args:
+            client: CodefunClient used for polling (default: a new one)
+            poll_interval: Seconds before the first poll of a submission
+            max_interval: Cap for the doubling delay between polls
+            on_verdict: Called with each finished entry (default: print it)
+        """
+        self.client = client or CodefunClient()
+        self.poll_interval = poll_interval
+        self.max_interval = max_interval
+        self.on_verdict = on_verdict or self.print_verdict
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.wakeup = threading.Condition(self.lock)
+        self.stopped = False
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def track(self, submission_id, problem_code):
+        """Start tracking a new submission."""
+        if submission_id is None:
+            return
+        now = time.monotonic()
+        with self.lock:
+            self.entries[submission_id] = {
+                "submission_id": submission_id,
+                "problem_code": problem_code,
+                "result": None,
+                "score": None,
+                "submitted_at": now,
+                "judged_at": None,
+                "next_poll": now + self.poll_interval,
+                "interval": self.poll_interval,
+            }
+            self.wakeup.notify()
+
+    def pending_count(self):
+        """Number of tracked submissions still waiting for a verdict."""
+        with self.lock:
+            return sum(1 for entry in self.entries.values() if is_pending(entry["result"]))
+
+    def results(self):
+        """All tracked entries, in submission order."""
+        with self.lock:
+            return [dict(entry) for entry in self.entries.values()]
+
+    def wait(self, timeout=None):
+        """Block until every tracked submission is judged or the timeout passes.
+
+        Returns True if nothing is pending anymore.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.pending_count():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.2)
+        return True
+
+    def stop(self):
+        """Stop the polling thread."""
+        with self.lock:
+            self.stopped = True
+            self.wakeup.notify()
+        self.thread.join()
+
+    def print_verdict(self, entry):
+        """Default on_verdict callback."""
+        latency = entry["judged_at"] - entry["submitted_at"]
+        print(f"{entry['problem_code']}: {entry['result']} ({entry['score']}) after {latency:.0f} secs")
+
+    def print_results(self):
+        """Print a results table of every tracked submission."""
+        print(f"{'Problem':<10}{'Submission':>12}  {'Result':<10}Score")
+        for entry in self.results():
+            result = "Pending" if is_pending(entry["result"]) else entry["result"]
+            score = "" if entry["score"] is None else entry["score"]
+            print(f"{entry['problem_code']:<10}{entry['submission_id']:>12}  {result:<10}{score}")
+
+    def _due(self):
+        now = time.monotonic()
+        due = [entry for entry in self.entries.values()
+               if is_pending(entry["result"]) and entry["next_poll"] <= now]
+        upcoming = [entry["next_poll"] for entry in self.entries.values() if is_pending(entry["result"])]
+        return due, (min(upcoming) - now if upcoming else None)
+
+    def _run(self):
+        while True:
+            with self.lock:
+                due, wait = self._due()
+                if self.stopped:
+                    return
+                if not due:
+                    self.wakeup.wait(wait)
+                    continue
+
+            for entry in due:
+                self._poll(entry)
+
+    def _poll(self, entry):
+        try:
+            data = self.client.get_submission(entry["submission_id"])
+            result, score = data.get("result"), data.get("score")
+        except Exception:
+            result, score = None, None
+
+        with self.lock:
+            if is_pending(result):
+                entry["interval"] = min(self.max_interval, entry["interval"] * 2)
+                entry["next_poll"] = time.monotonic() + entry["interval"]
+                return
+            entry["result"], entry["score"] = result, score
+            entry["judged_at"] = time.monotonic()
+
+        try:
+            self.on_verdict(dict(entry))
+        except Exception as e:
+            # A failing callback must not stop the tracking of other submissions
+            print(f"Error while handling the verdict of {entry['problem_code']}: {e}")
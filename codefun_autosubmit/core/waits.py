@@ -0,0 +1,98 @@
+"""Named readiness conditions built on explicit waits."""
+
+import re
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+LOGIN_USER_XPATH = "//input[@placeholder = 'Username']"
+LOGIN_PASS_XPATH = "//input[@placeholder = 'Password']"
+SUBMIT_BUTTON_XPATH = "//button[@type = 'submit']"
+PROBLEM_CODE_XPATH = "//input[@placeholder = 'Pxxxxx']"
+LANGUAGE_SELECT_XPATH = "//select[@class = 'form-control']"
+SOURCE_XPATH = "//textarea"
+CODE_XPATH = "//code"
+SUBMISSION_LANGUAGE_XPATH = "//*[@id='root']/div/div[1]/div[1]/div/div/div[1]/div/div[2]/ul/li[3]/b"
+RATE_LIMIT_XPATH = ("//*[contains(translate(text(), 'TOMANYREQUS', 'tomanyrequs'), 'too many')"
+                    " or contains(translate(text(), 'RATELIMT', 'ratelimt'), 'rate limit')]")
+
+POLL_FREQUENCY = 0.1
+
+
+def all_present(*xpaths):
+    """Condition: every XPath matches; yields the first match of each."""
+    def check(driver):
+        elements = []
+        for xpath in xpaths:
+            found = driver.find_elements(By.XPATH, xpath)
+            if not found:
+                return False
+            elements.append(found[0])
+        return elements
+    return check
+
+
+def none_present(xpath):
+    """Condition: the XPath matches nothing."""
+    def check(driver):
+        return not driver.find_elements(By.XPATH, xpath)
+    return check
+
+
+def code_rendered(driver):
+    """Condition: submission source and language are rendered with text."""
+    elements = all_present(CODE_XPATH, SUBMISSION_LANGUAGE_XPATH)(driver)
+    if elements and elements[1].text:
+        return elements
+    return False
+
+
+def submission_page(driver):
+    """Condition: browser was redirected to a submission page; yields its ID."""
+    match = re.search(r"/submissions/(\d+)", driver.current_url)
+    return int(match.group(1)) if match else False
+
+
+# name: (condition, default timeout in seconds)
+CONDITIONS = {
+    "login_form": (all_present(LOGIN_USER_XPATH, LOGIN_PASS_XPATH, SUBMIT_BUTTON_XPATH), 5),
+    "logged_in": (none_present(LOGIN_USER_XPATH), 10),
+    "submit_form": (all_present(PROBLEM_CODE_XPATH, LANGUAGE_SELECT_XPATH, SOURCE_XPATH,
+                                SUBMIT_BUTTON_XPATH), 10),
+    "submission_code": (code_rendered, 10),
+    "rate_limited": (all_present(RATE_LIMIT_XPATH), 1),
+    "submitted": (submission_page, 5),
+}
+
+
+def wait_for(driver, name, timeout=None, poll=POLL_FREQUENCY):
+    """Wait until a named condition holds and return its result.
+
+    Raises TimeoutException if it does not hold within the timeout.
+    """
+    condition, default_timeout = CONDITIONS[name]
+    timeout = default_timeout if timeout is None else timeout
+    return WebDriverWait(driver, timeout, poll_frequency=poll).until(
+        condition, f"Timed out waiting for {name}"
+    )
+
+
+def wait_for_any(driver, names, timeout=None, poll=POLL_FREQUENCY):
+    """Wait until any of the named conditions holds.
+
+    Returns (name, result) for the first condition that held. The timeout
+    defaults to the longest of the conditions' own timeouts.
+    """
+    if timeout is None:
+        timeout = max(CONDITIONS[name][1] for name in names)
+
+    def check(driver):
+        for name in names:
+            result = CONDITIONS[name][0](driver)
+            if result:
+                return name, result
+        return False
+
+    return WebDriverWait(driver, timeout, poll_frequency=poll).until(
+        check, f"Timed out waiting for any of {', '.join(names)}"
+    )
@@ -0,0 +1,129 @@
+"""Watch a solutions folder and report files whose contents changed."""
+
+import hashlib
+import os
+import threading
+import time
+from .workspace import solution_info
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # Without watchdog the folder is polled
+    Observer = None
+
+
+def file_digest(path):
+    """SHA-1 of a file's contents, or None if it cannot be read."""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+class FolderWatcher:
+    """Call on_change(path) once a solution file's contents settle on a new version.
+
+    Uses inotify (or the platform equivalent) through watchdog when it is
+    installed and falls back to polling modification times. Rapid saves
+    are debounced, and saves that leave the contents unchanged are ignored.
+    """
+
+    def __init__(self, folder, on_change, debounce=1.0, poll_interval=1.0, use_polling=None):
+        """Initialize watcher.
+
+        Args:
+            folder: Folder to watch (not recursive)
+            on_change: Called with the path of each changed solution file
+            debounce: Seconds a file must stay quiet before it is reported
+            poll_interval: Seconds between scans when polling
+            use_polling: Force (True) or forbid (False) polling; default
+                polls only when watchdog is not installed
+        """
+        self.folder = folder
+        self.on_change = on_change
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.use_polling = Observer is None if use_polling is None else use_polling
+        self.digests = {}
+        self.mtimes = {}
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.observer = None
+        self.threads = []
+
+    def _scan(self):
+        found = {}
+        with os.scandir(self.folder) as entries:
+            for entry in entries:
+                if entry.is_file() and solution_info(entry.path):
+                    found[entry.path] = entry.stat().st_mtime_ns
+        return found
+
+    def start(self):
+        """Record the current contents as the baseline and start watching."""
+        self.mtimes = self._scan()
+        self.digests = {path: file_digest(path) for path in self.mtimes}
+
+        if self.use_polling:
+            self.threads.append(threading.Thread(target=self._poll, daemon=True))
+        else:
+            watcher = self
+
+            class Handler(FileSystemEventHandler):
+                def on_any_event(self, event):
+                    if not event.is_directory:
+                        watcher.touch(getattr(event, "dest_path", "") or event.src_path)
+
+            self.observer = Observer()
+            self.observer.schedule(Handler(), self.folder, recursive=False)
+            self.observer.start()
+
+        self.threads.append(threading.Thread(target=self._flush, daemon=True))
+        for thread in self.threads:
+            thread.start()
+        return self
+
+    def stop(self):
+        """Stop watching."""
+        self.stopped.set()
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join()
+        for thread in self.threads:
+            thread.join()
+
+    def touch(self, path):
+        """Note that a file may have changed; it is checked once it settles."""
+        if solution_info(path) is None:
+            return
+        with self.lock:
+            self.pending[path] = time.monotonic()
+
+    def _poll(self):
+        while not self.stopped.wait(self.poll_interval):
+            try:
+                found = self._scan()
+            except OSError:
+                continue
+            for path, mtime in found.items():
+                if self.mtimes.get(path) != mtime:
+                    self.touch(path)
+            self.mtimes = found
+
+    def _flush(self):
+        while not self.stopped.wait(min(self.debounce, 0.2) or 0.05):
+            now = time.monotonic()
+            with self.lock:
+                settled = [path for path, last in self.pending.items() if now - last >= self.debounce]
+                for path in settled:
+                    del self.pending[path]
+
+            for path in settled:
+                digest = file_digest(path)
+                if digest is None or digest == self.digests.get(path):
+                    continue
+                self.digests[path] = digest
+                self.on_change(path)
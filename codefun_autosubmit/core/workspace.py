@@ -0,0 +1,182 @@
+"""Index of the solution files in a workspace folder."""
+
+import hashlib
+import os
+import time
+from fnmatch import fnmatch
+from os import getenv
+from .session import SessionStore
+from .utils import get_config_dir, get_language, load_config
+
+
+# Order in which languages are tried when the wanted one has no file
+EXTENSION_ORDER = ["cpp", "py", "pas", "s"]
+
+# Directories whose mtime is this close to the scan time are listed again
+# next time, since a change in the same clock tick would not move the mtime
+MTIME_GRACE_NS = 2 * 10 ** 9
+
+
+def solution_info(path):
+    """Get (problem_code, language) for a solution file, or None to ignore it.
+
+    Files starting with "pass" and files without a known extension are ignored.
+    """
+    filename = os.path.basename(path)
+    if filename.startswith("pass") or "." not in filename:
+        return None
+    try:
+        return filename.split(".")[0], get_language(filename.split(".")[-1])
+    except Exception:
+        return None
+
+
+def split_globs(value):
+    """Comma-separated glob patterns as a list."""
+    return [pattern.strip() for pattern in (value or "").split(",") if pattern.strip()]
+
+
+class WorkspaceIndex:
+    """Map problem codes to solution files under a folder and its subfolders.
+
+    Folders are listed with os.scandir. The listing of each folder is cached
+    together with its mtime, so later scans only list folders where files
+    were added, removed or renamed.
+    """
+
+    def __init__(self, root=None, include=None, exclude=None, recursive=None, store=None):
+        """Initialize index.
+
+        Args:
+            root: Workspace folder (default: PATH_TO_FOLDER)
+            include: Globs a file's name or relative path must match (default:
+                WORKSPACE_INCLUDE, otherwise every file)
+            exclude: Globs of files and folders to leave out (default:
+                WORKSPACE_EXCLUDE, otherwise hidden files and folders)
+            recursive: Also index subfolders (default: WORKSPACE_RECURSIVE, off)
+            store: SessionStore for the cached listings (default: one file per
+                workspace in the config folder); False keeps them in memory only
+        """
+        load_config()
+        self.root = os.path.abspath(root or getenv("PATH_TO_FOLDER"))
+        self.include = include if include is not None else split_globs(getenv("WORKSPACE_INCLUDE"))
+        self.exclude = exclude if exclude is not None else \
+            split_globs(getenv("WORKSPACE_EXCLUDE", ".*"))
+        if recursive is None:
+            recursive = getenv("WORKSPACE_RECURSIVE", "0").lower() in ["1", "yes", "true"]
+        self.recursive = recursive
+        if store is None:
+            key = hashlib.sha1(self.root.encode("utf-8")).hexdigest()[:16]
+            store = SessionStore("workspace", path=get_config_dir() / f"workspace-{key}.json")
+        self.store = store or None
+        self.folders = {}
+        self.problems = {}
+        self.scanned = False
+
+    def _settings(self):
+        return {"root": self.root, "include": self.include, "exclude": self.exclude,
+                "recursive": self.recursive}
+
+    def _excluded(self, name, relative):
+        return any(fnmatch(name, pattern) or fnmatch(relative, pattern) for pattern in self.exclude)
+
+    def _included(self, name, relative):
+        return not self.include or any(fnmatch(name, pattern) or fnmatch(relative, pattern)
+                                       for pattern in self.include)
+
+    def _list(self, path, relative):
+        """Solution files and subfolders directly inside one folder."""
+        files, folders = [], []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                entry_relative = f"{relative}/{entry.name}" if relative else entry.name
+                if self._excluded(entry.name, entry_relative):
+                    continue
+                if entry.is_dir():
+                    if self.recursive:
+                        folders.append(entry_relative)
+                elif solution_info(entry.name) and self._included(entry.name, entry_relative):
+                    files.append(entry_relative)
+        return sorted(files), sorted(folders)
+
+    def scan(self):
+        """Bring the index up to date; returns the number of folders listed."""
+        cached = {}
+        if not self.folders and self.store is not None:
+            saved = self.store.load()
+            if saved.get("settings") == self._settings():
+                cached = saved["folders"]
+        cached = cached or self.folders
+
+        now = time.time_ns()
+        folders = {}
+        listed = 0
+        pending = [""]
+        while pending:
+            relative = pending.pop()
+            path = os.path.join(self.root, relative) if relative else self.root
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+            entry = cached.get(relative)
+            if entry is None or entry["mtime"] != mtime or now - mtime < MTIME_GRACE_NS:
+                try:
+                    files, subfolders = self._list(path, relative)
+                except OSError:
+                    continue
+                entry = {"mtime": mtime, "files": files, "folders": subfolders}
+                listed += 1
+            folders[relative] = entry
+            pending.extend(reversed(entry["folders"]))
+
+        problems = {}
+        for relative in sorted(folders, key=lambda name: (name.count("/") if name else -1, name)):
+            for file in folders[relative]["files"]:
+                problem_code, language = solution_info(file)
+                # A file nearer the root wins over one deeper down
+                problems.setdefault(problem_code, {}).setdefault(language, file)
+
+        self.folders = folders
+        self.problems = problems
+        self.scanned = True
+        if self.store is not None and listed:
+            self.store.save({"settings": self._settings(), "folders": folders})
+        return listed
+
+    def _ensure_scanned(self):
+        if not self.scanned:
+            self.scan()
+
+    def _pick(self, problem_code, language):
+        files = self.problems.get(problem_code)
+        if not files:
+            return None
+        if language not in files:
+            language = next(get_language(ext) for ext in EXTENSION_ORDER if get_language(ext) in files)
+        return files[language], language
+
+    def find(self, problem_code, language=None):
+        """(path, language) of the file solving a problem, or None.
+
+        The given language is preferred; otherwise languages are tried in
+        the order C++, Python3, Pascal, NAsm.
+        """
+        self._ensure_scanned()
+        found = self._pick(problem_code, language)
+        if found is None:
+            return None
+        return os.path.join(self.root, found[0]), found[1]
+
+    def files(self, language=None):
+        """Path relative to the root of one file per problem, in problem code order."""
+        self._ensure_scanned()
+        return [self._pick(problem_code, language)[0] for problem_code in sorted(self.problems)]
+
+    def __contains__(self, problem_code):
+        self._ensure_scanned()
+        return problem_code in self.problems
+
+    def __len__(self):
+        self._ensure_scanned()
+        return len(self.problems)
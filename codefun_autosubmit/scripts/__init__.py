@@ -3,9 +3,19 @@
 from .auto_submit import main as auto_submit_main
 from .batch_submit import main as batch_submit_main  
 from .fetch_ac import main as fetch_ac_main
+from .export import main as export_main
+from .daemon import main as daemon_main
+from .burst import main as burst_main
+from .watch import main as watch_main
+from .status import main as status_main
 
 __all__ = [
     "auto_submit_main",
     "batch_submit_main", 
     "fetch_ac_main",
+    "export_main",
+    "daemon_main",
+    "burst_main",
+    "watch_main",
+    "status_main",
 ]
\ No newline at end of file
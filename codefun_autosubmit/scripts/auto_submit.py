@@ -1,35 +1,83 @@
 """Auto-submit script for specific problem IDs."""
 
-import random
-import time
 from os import getenv
-from ..core.browser import setup_driver
-from ..core.submission import SubmissionManager
+from ..core.daemon import open_manager
+from ..core.errors import RateLimitedError
+from ..core.pacing import Pacer
+from ..core.source_hashes import SourceHashes
+from ..core.prejudge import PreJudge, prejudge_enabled, review_failures
+from ..core.verdicts import finish_tracker, start_tracker
 from ..core.utils import load_config
 
 
-def main(input_folder=None):
+def main(input_folder=None, backend="selenium", tasks=None, prejudge=False):
     """Main function for auto-submission."""
-    tasks = ["001"]  # Edit this list to specify problems to submit
+    tasks = tasks or ["001"]  # Edit this list to specify problems to submit
     language = getenv("LANGUAGE", "Python3")
-    base_wait_time = int(getenv("SUBMIT_WAIT_TIME", "90"))
-    random_range = int(getenv("SUBMIT_RANDOM_RANGE", "0"))
+    pacer = Pacer.from_config()
+    tracker = start_tracker()
     
-    driver = setup_driver()
-    submission_manager = SubmissionManager(driver)
+    submission_manager = open_manager(backend)
+    hashes = SourceHashes()
 
+    # Each file is looked up once and that same file is submitted and hashed
+    found = {}
     for task_id in tasks:
         try:
-            submission_manager.submit_by_id(task_id, language, input_folder=input_folder)
-            wait_time = base_wait_time + random.randint(0, random_range)
-            print(f"{task_id} submitted, waiting for {wait_time} secs")
-            time.sleep(wait_time)
-        except KeyboardInterrupt:
-            print("Sleep period interrupted, force submitting next file")
+            found[task_id] = submission_manager.find_file(task_id, language, input_folder)
         except Exception as e:
             print(f"Error while submitting {task_id}: {e}")
+    tasks = [task_id for task_id in tasks if task_id in found]
+
+    if prejudge_enabled(prejudge):
+        jobs = [(abspath, lang, f"P{task_id}") for task_id, (abspath, lang) in found.items()]
+        prejudge_folder = input_folder or getenv("PATH_TO_FOLDER")
+        rejected = review_failures(PreJudge.from_config(prejudge_folder).check(jobs))
+        tasks = [task_id for task_id in tasks if found[task_id][0] not in rejected]
+
+    retries = int(getenv("SUBMIT_RETRIES", "3"))
+    halted = False
+    for task_id in tasks:
+        abspath, lang = found[task_id]
+        attempt = 0
+        while True:
+            try:
+                pacer.wait()
+            except KeyboardInterrupt:
+                print("Sleep period interrupted, force submitting next file")
+                pacer.skip()
+            try:
+                submission_id = submission_manager.submit(abspath, lang, f"P{task_id}")
+                pacer.record_success()
+                print(f"{task_id} submitted")
+                hashes.record_file(f"P{task_id}", lang, abspath, submission_id)
+                if tracker:
+                    tracker.track(submission_id, f"P{task_id}")
+                    pacer.record_queue_depth(tracker.pending_count())
+            except RateLimitedError as e:
+                pacer.record_rate_limit(e.retry_after)
+                if attempt < retries:
+                    attempt += 1
+                    print(f"Rate limited while submitting {task_id}, retry {attempt}/{retries}")
+                    continue
+                print(f"Still rate limited after {retries} retries, skipping {task_id}")
+            except KeyboardInterrupt:
+                halt = input(f"Interrupted while submitting {task_id} (it may have been sent), "
+                             "halt program? (y/n) ").lower()
+                if halt in ["y", "yes"]:
+                    print("Aborted")
+                    halted = True
+                else:
+                    print("Moving on to the next file")
+            except Exception as e:
+                print(f"Error while submitting {task_id}: {e}")
+            break
+        if halted:
+            break
     
-    driver.quit()
+    submission_manager.close()
+    hashes.close()
+    finish_tracker(tracker)
 
 
 if __name__ == "__main__":
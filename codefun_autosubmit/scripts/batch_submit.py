@@ -1,67 +1,152 @@
 """Batch submission script for multiple files."""
 
-import random
-import time
+import asyncio
+import os
 from os import getenv
 from requests.exceptions import ConnectionError
-from ..core.browser import setup_driver
-from ..core.submission import SubmissionManager
+from ..core.daemon import discard_manager, start_manager
+from ..core.pacing import Pacer
+from ..core.pipeline import SubmissionPipeline
+from ..core.prejudge import PreJudge, prejudge_enabled, review_failures
+from ..core.source_hashes import SourceHashes, skip_unchanged_enabled
+from ..core.submission_queue import SubmissionQueue
+from ..core.verdicts import finish_tracker, start_tracker
 from ..core.utils import get_loop_list, load_config
+from ..core.workspace import solution_info
 
 
-def main(input_folder=None, skip_submitted=False):
+def main(input_folder=None, skip_submitted=False, backend="selenium", resume=False,
+         enqueue_only=False, prejudge=False, offline=False):
     """Main function for batch submission.
     
     Args:
         input_folder: Path to folder containing code files
         skip_submitted: If True, skip all submitted problems. If False, only skip AC problems.
+        backend: "selenium" to submit through Chrome, "http" to submit over the API
+        resume: Continue the persistent queue without rescanning the folder
+        enqueue_only: Add files to the persistent queue without submitting
+        prejudge: Check files against local samples first (also enabled by PREJUDGE)
+        offline: Decide what to skip from the local history only
     """
     load_config()
     file_path = input_folder or getenv("PATH_TO_FOLDER")
-    base_wait_time = int(getenv("SUBMIT_WAIT_TIME", "90"))
-    random_range = int(getenv("SUBMIT_RANDOM_RANGE", "0"))
+    pacer = Pacer.from_config()
+    queue = SubmissionQueue()
+    hashes = SourceHashes()
     sublist = []
+    added = []
 
-    print(f"Preparing for submission of all files in folder {file_path}")
-    
+    interrupted = queue.recover()
+    if interrupted:
+        print(f"{interrupted} interrupted submission(s) may have been sent; they are not sent again")
+
+    # Browser startup and login don't depend on the work list or the prompt
+    pending_manager = None if enqueue_only else start_manager(backend)
+    confirm = "n"
     try:
-        sublist = get_loop_list(file_path, skip_submitted)
-    except ConnectionError:
-        print("Connection error")
-        exit(1)
+        if not resume:
+            print(f"Preparing for submission of all files in folder {file_path}")
+            try:
+                sublist = get_loop_list(file_path, skip_submitted, offline=offline)
+            except ConnectionError:
+                print("Connection error")
+                exit(1)
+
+            skip_unchanged = skip_unchanged_enabled()
+            for file in sublist:
+                path = os.path.join(file_path, file)
+                problem_code, language = solution_info(file)
+                if skip_unchanged and hashes.is_unchanged(problem_code, language, path):
+                    print(f"{problem_code} is unchanged since its last submission, skipping")
+                    continue
+                job_id = queue.enqueue(path, problem_code, language)
+                if job_id:
+                    added.append(job_id)
 
-    if len(sublist) == 0:
-        print("Nothing to submit")
-        exit(0)
+        if enqueue_only:
+            print(f"Queued {len(added)} file(s)")
+            queue.close()
+            hashes.close()
+            return
 
-    print(f"Submitting {sublist}")
-    confirm = input("Proceed? (y/n) ").lower()
+        pending_jobs = queue.jobs("queued")
+        if pending_jobs and prejudge_enabled(prejudge):
+            results = PreJudge.from_config(file_path).check(
+                [(job["path"], job["language"], job["problem_code"]) for job in pending_jobs])
+            rejected = review_failures(results)
+            queue.discard([job["id"] for job in pending_jobs if job["path"] in rejected])
+            pending_jobs = [job for job in pending_jobs if job["path"] not in rejected]
+
+        if len(pending_jobs) == 0:
+            print("Nothing to submit")
+            exit(0)
+
+        print(f"Submitting {[job['problem_code'] for job in pending_jobs]}")
+        try:
+            confirm = input("Proceed? (y/n) ").lower()
+        except (KeyboardInterrupt, EOFError):
+            confirm = "n"
+    finally:
+        # Unless the run goes ahead, no browser is left behind
+        if pending_manager and confirm not in ["y", "yes"]:
+            discard_manager(pending_manager)
 
     if confirm in ["y", "yes"]:
         print("Submitting...")
-        driver = setup_driver()
-        submission_manager = SubmissionManager(driver)
-        
-        for file in sublist:
+        submission_manager = pending_manager.result()
+
+        def on_verdict(entry):
+            tracker.print_verdict(entry)
+            queue.mark_judged(entry["submission_id"], entry["result"], entry["score"])
+
+        def on_submitted(job, submission_id):
+            queue.mark_submitted(job["id"], submission_id)
+            if job.get("source") is not None:
+                hashes.record_code(job["problem_code"], job["language"], job["source"], submission_id)
+            else:
+                hashes.record_file(job["problem_code"], job["language"], job["path"], submission_id)
+
+        tracker = start_tracker(on_verdict=on_verdict)
+        if tracker:
+            # Submissions from an interrupted run that were never judged
+            for job in queue.jobs("submitted"):
+                tracker.track(job["submission_id"], job["problem_code"])
+
+        pipeline = SubmissionPipeline(
+            submission_manager,
+            pacer=pacer,
+            tracker=tracker,
+            on_submitted=on_submitted,
+            on_failed=lambda job, error: queue.mark_failed(job["id"], error),
+        )
+
+        while True:
             try:
-                submission_manager.submit_file(f"{file_path}\\{file}")
-                wait_time = base_wait_time + random.randint(0, random_range)
-                print(f"{file} submitted, waiting for {wait_time} secs")
-                time.sleep(wait_time)
+                asyncio.run(pipeline.run(iter(queue.claim_next, None)))
+                break
             except KeyboardInterrupt:
-                halt = input("Sleep period interrupted, halt program? (y/n) ").lower()
+                # Jobs that were not sent go back to their place in the queue
+                for job in pipeline.in_flight:
+                    queue.release(job["id"])
+                # A send that was cut off may or may not have reached the judge
+                for job in pipeline.firing:
+                    queue.mark_submitted(job["id"], None)
+                halt = input("Submission interrupted, halt program? (y/n) ").lower()
                 if halt in ["y", "yes"]:
                     print("Aborted")
-                    exit(0)
-                else:
-                    print("Force submitting next file")
-            except Exception as e:
-                print(f"Error while submitting {file}: {e}")
-        
-        driver.quit()
+                    break
+                print("Force submitting next file")
+                pipeline.force_next = True
+
+        asyncio.run(pipeline.manager.close())
+        finish_tracker(tracker)
     else:
+        queue.discard(added)
         print("Aborted")
 
+    queue.close()
+    hashes.close()
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
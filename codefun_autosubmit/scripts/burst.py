@@ -0,0 +1,56 @@
+"""Burst submission script for contest starts."""
+
+from datetime import datetime
+from os import getenv
+from ..core.browser import setup_driver
+from ..core.burst import BurstSubmitter, parse_start_time, wait_until
+from ..core.submission import SubmissionManager
+from ..core.utils import load_config
+
+
+def main(at, tasks, input_folder=None, backend="selenium"):
+    """Main function for burst submission.
+
+    Args:
+        at: Start time, HH:MM[:SS] or ISO datetime
+        tasks: Problem IDs to submit at the start time
+        input_folder: Folder containing files to submit
+        backend: "selenium" to submit through Chrome, "http" to submit over the API
+    """
+    load_config()
+    language = getenv("LANGUAGE", "Python3")
+    start = parse_start_time(at)
+
+    # Prepared tabs must live in this process until T0, so the daemon is not used
+    submission_manager = SubmissionManager(backend=backend, driver_factory=setup_driver)
+
+    try:
+        jobs = []
+        for task_id in tasks:
+            try:
+                abspath, lang = submission_manager.find_file(task_id, language, input_folder)
+                jobs.append((abspath, lang, f"P{task_id}"))
+            except Exception as e:
+                print(f"Skipping {task_id}: {e}")
+
+        burst = BurstSubmitter(submission_manager)
+        for problem_code, error in burst.prepare(jobs):
+            print(f"Skipping {problem_code}: {error}")
+        print(f"{len(burst.prepared)} submission(s) ready, firing at {start:%Y-%m-%d %H:%M:%S}")
+
+        try:
+            wait_until(start)
+        except KeyboardInterrupt:
+            print("Aborted")
+            return
+
+        fired_at = datetime.now()
+        results = burst.fire()
+
+        print(f"Fired at {fired_at:%H:%M:%S.%f}")
+        print(f"{'Problem':<10}{'Latency (ms)':>14}  Result")
+        for problem_code, seconds, result in results:
+            status = f"Error: {result}" if isinstance(result, Exception) else (result or "Submitted")
+            print(f"{problem_code:<10}{seconds * 1000:>14.1f}  {status}")
+    finally:
+        submission_manager.close()
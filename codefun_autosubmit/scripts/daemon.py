@@ -0,0 +1,53 @@
+"""Warm-browser daemon script."""
+
+from ..core.daemon import DEFAULT_PORT, DaemonClient, DaemonServer
+from ..core.pool import DriverPool
+from ..core.utils import load_config
+
+
+def main(drivers=1, port=DEFAULT_PORT, stop=False):
+    """Main function for the daemon.
+
+    Args:
+        drivers: Number of warm Chrome instances to keep
+        port: Localhost port to listen on
+        stop: Stop the running daemon instead of starting one
+    """
+    load_config()
+    running = DaemonClient.connect()
+
+    if stop:
+        if running:
+            running.call("stop")
+            print("Daemon stopped")
+        else:
+            print("No daemon running")
+        return
+
+    if running:
+        print("Daemon already running")
+        return
+
+    print(f"Starting {drivers} browser(s)...")
+    pool = DriverPool(drivers)
+    try:
+        daemon = DaemonServer(pool, port=port)
+    except Exception:
+        # e.g. the port is in use; no browser is left behind
+        pool.close()
+        raise
+
+    try:
+        ready = pool.warm_up()
+        print(f"{ready} of {pool.size} browser(s) logged in")
+        print(f"Daemon listening on 127.0.0.1:{daemon.port}, press Ctrl+C to stop")
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.close()
+        print("Daemon stopped")
+
+
+if __name__ == "__main__":
+    main()
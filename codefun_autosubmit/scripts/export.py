@@ -0,0 +1,34 @@
+"""Export script expanding a source archive into plain files."""
+
+import os
+from os import getenv
+from ..core.archive import SourceArchive, get_archive_path
+from ..core.utils import load_config
+
+
+def main(archive=None, output_folder=None, problems=None):
+    """Main function for exporting an archive made by fetch --archive.
+
+    Args:
+        archive: Archive file (default: codefun-sources.db in the crawl folder)
+        output_folder: Folder to write files to (default: CRAWL_FOLDER, then PATH_TO_FOLDER)
+        problems: Only export these problem codes (all if None)
+    """
+    load_config()
+    crawl_folder = getenv("CRAWL_FOLDER") or getenv("PATH_TO_FOLDER")
+    archive = archive or get_archive_path(crawl_folder)
+    if not os.path.isfile(archive):
+        print(f"No archive at {archive}")
+        return
+    output_folder = output_folder or crawl_folder
+
+    source_archive = SourceArchive(archive)
+    try:
+        count = source_archive.export(output_folder, problems)
+    finally:
+        source_archive.close()
+    print(f"Exported {count} source(s) to {output_folder}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,138 @@
 """Fetch accepted submissions script."""
 
+import os
+import tempfile
 from os import getenv
-from ..core.browser import setup_driver
-from ..core.submission import SubmissionManager
-from ..core.utils import load_config
+from ..core.archive import SourceArchive, get_archive_path
+from ..core.daemon import open_manager
+from ..core.fetch import HttpFetcher
+from ..core.manifest import FetchManifest
+from ..core.pool import DriverPool
+from ..core.source_hashes import SourceHashes
+from ..core.stats import get_stats
+from ..core.utils import get_language, load_config
 
 
-def main(crawl_folder=None):
-    """Main function for fetching accepted submissions."""
+def main(crawl_folder=None, workers=None, backend="selenium", full=False, all_languages=False,
+         archive=None):
+    """Main function for fetching accepted submissions.
+
+    Args:
+        crawl_folder: Folder to save crawled submissions
+        workers: Number of browsers (selenium) or concurrent requests (http)
+        backend: "selenium" to scrape submission pages, "http" to use the API
+        full: Fetch everything again, ignoring the crawl folder's manifest
+        all_languages: Save submissions in every language, each under its own
+            extension (otherwise only LANGUAGE, or all if it is unset)
+        archive: Store sources in this single archive file instead of one
+            file per problem ("" for codefun-sources.db in the crawl folder)
+    """
     load_config()
-    language = getenv("LANGUAGE")
-    
-    driver = setup_driver()
-    submission_manager = SubmissionManager(driver)
+    language = None if all_languages else getenv("LANGUAGE")
+    crawl_folder = crawl_folder or getenv("CRAWL_FOLDER") or getenv("PATH_TO_FOLDER")
+    hashes = SourceHashes()
+    if archive is not None:
+        archive = SourceArchive(archive or get_archive_path(crawl_folder))
+        manifest = FetchManifest(os.path.dirname(os.path.abspath(archive.path)))
+    else:
+        manifest = FetchManifest(crawl_folder)
+
+    def saved(problem, saved_path):
+        if saved_path is None:
+            # Not in the wanted language
+            manifest.record(problem[0], problem[1], None, language_filter=language)
+        elif archive is not None:
+            # saved_path is the member name in the archive
+            row = archive.get(problem[1])
+            hashes.record(problem[1], row["language"], row["sha256"], problem[0])
+        elif os.path.isfile(saved_path):
+            saved_language = get_language(saved_path.rsplit(".", 1)[-1])
+            manifest.record(problem[0], problem[1], saved_path, saved_language, language_filter=language)
+            # Fetched code counts as the last submission of its problem
+            hashes.record_file(problem[1], saved_language, saved_path, problem[0])
+
+    def select(sublist):
+        if full:
+            pending = sublist
+        elif archive is not None:
+            pending = archive.pending(manifest.pending(sublist, language))
+        else:
+            pending = manifest.pending(sublist, language)
+        print(f"{len(sublist) - len(pending)} accepted submission(s) up to date, fetching {len(pending)}")
+        return pending
+
+    try:
+        if backend == "http":
+            fetch_http(crawl_folder, workers or 8, language, select, saved, archive)
+        elif archive is not None:
+            with tempfile.TemporaryDirectory() as scratch:
+                def scraped(problem, saved_path):
+                    # Move the file scraped into the temporary folder into the archive
+                    if saved_path is not None:
+                        saved_path = archive.put_file(problem[0], problem[1],
+                                                      get_language(saved_path.rsplit(".", 1)[-1]),
+                                                      saved_path)
+                    saved(problem, saved_path)
+
+                fetch_selenium(scratch, workers or 1, language, select, scraped)
+        else:
+            fetch_selenium(crawl_folder, workers or 1, language, select, saved)
+    finally:
+        manifest.save()
+        hashes.close()
+        if archive is not None:
+            print(f"Sources stored in {archive.path}")
+            archive.close()
+
 
-    sublist = submission_manager.get_all_accepted_submissions()
+def fetch_http(crawl_folder, workers, language, select, saved, archive=None):
+    """Fetch over the HTTP API."""
+    fetcher = HttpFetcher(workers=workers, crawl_folder=crawl_folder, archive=archive)
+
+    def on_result(submission_id, problem_code, saved_path, error):
+        if error:
+            print(f"Error while fetching {problem_code}: {error}")
+            return
+        if saved_path:
+            print(f"{problem_code} saved")
+        saved((submission_id, problem_code), saved_path)
+
+    sublist = select(get_stats().accepted_submissions(language))
+    count = fetcher.fetch(sublist, language=language, on_result=on_result)
+    print(f"Saved {count} of {len(sublist)} accepted submission(s)")
+    fetcher.close()
+
+
+def fetch_selenium(crawl_folder, workers, language, select, saved):
+    """Fetch by scraping submission pages in one or more browsers."""
+    if workers > 1:
+        submission_manager = DriverPool(workers)
+    else:
+        submission_manager = open_manager()
+
+    sublist = select(submission_manager.get_all_accepted_submissions(language))
     
-    for problem in sublist:
-        submission_manager.retrieve_submission(problem[0], problem[1], language, crawl_folder=crawl_folder)
+    if workers > 1:
+        def retrieve(manager, problem):
+            return manager.retrieve_submission(problem[0], problem[1], language, crawl_folder=crawl_folder)
+
+        for problem, future in submission_manager.map(retrieve, sublist):
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"Error while fetching {problem[1]}: {e}")
+                continue
+            if result != "No code found":
+                saved(problem, result)
+    else:
+        for problem in sublist:
+            result = submission_manager.retrieve_submission(problem[0], problem[1], language,
+                                                            crawl_folder=crawl_folder)
+            if result != "No code found":
+                saved(problem, result)
+
+    submission_manager.close()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
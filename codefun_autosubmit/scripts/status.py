@@ -0,0 +1,69 @@
+"""Status script answering progress questions from the local history."""
+
+from datetime import datetime
+from requests.exceptions import RequestException
+from ..core.history import History
+from ..core.stats import get_stats
+from ..core.submission_queue import SubmissionQueue
+from ..core.utils import load_config
+
+
+def format_time(timestamp):
+    """Format a Unix timestamp for tables."""
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M") if timestamp else "-"
+
+
+def main(sync=False, unsolved=False, partial=False, problem=None, recent=10):
+    """Main function for the status command.
+
+    Args:
+        sync: Refresh stats from Codefun first (otherwise runs offline)
+        unsolved: List attempted problems without AC
+        partial: List problems with a partial score
+        problem: Show every known submission of this problem code
+        recent: Number of recent verdicts to show
+    """
+    load_config()
+    history = History()
+    queue = SubmissionQueue()
+    history.sync_queue(queue)
+    queue.close()
+
+    if sync:
+        try:
+            history.sync_stats(get_stats(max_age=0))
+        except RequestException as e:
+            print(f"Could not sync stats: {e}")
+
+    if problem:
+        rows = history.attempts(problem)
+        print(f"{problem}: {len(rows)} known submission(s)")
+        print(f"{'Submission':>12}  {'Language':<10}{'Result':<10}{'Score':<8}Submitted")
+        for row in rows:
+            print(f"{row['submission_id']:>12}  {row['language'] or '-':<10}{row['result'] or '-':<10}"
+                  f"{'' if row['score'] is None else row['score']:<8}{format_time(row['submitted_at'])}")
+    elif unsolved or partial:
+        rows = history.partial() if partial else history.unsolved()
+        print(f"{len(rows)} problem(s)")
+        for row in rows:
+            print(f"{row['problem_code']:<10}{row['score']:g}/{row['max_score']:g}")
+    else:
+        summary = history.summary()
+        if summary["synced_at"] is None:
+            print("No stats synced yet, run codefun status --sync")
+        else:
+            print(f"Stats synced {format_time(summary['synced_at'])}: {summary['accepted']} AC, "
+                  f"{summary['attempted'] - summary['accepted']} unsolved "
+                  f"({summary['partial']} with partial score)")
+        rows = history.recent(recent)
+        if rows:
+            print(f"{'Problem':<10}{'Submission':>12}  {'Result':<10}{'Score':<8}Submitted")
+            for row in rows:
+                print(f"{row['problem_code']:<10}{row['submission_id']:>12}  {row['result'] or 'Pending':<10}"
+                      f"{'' if row['score'] is None else row['score']:<8}{format_time(row['submitted_at'])}")
+
+    history.close()
+
+
+if __name__ == "__main__":
+    main()
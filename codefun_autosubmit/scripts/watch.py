@@ -0,0 +1,141 @@
+"""Watch script that submits solutions as they are saved."""
+
+import asyncio
+import os
+import threading
+from os import getenv
+from requests.exceptions import ConnectionError
+from ..core.daemon import open_manager
+from ..core.pacing import Pacer
+from ..core.pipeline import SubmissionPipeline
+from ..core.source_hashes import SourceHashes, skip_unchanged_enabled
+from ..core.submission_queue import SubmissionQueue
+from ..core.verdicts import finish_tracker, start_tracker
+from ..core.utils import get_accepted_problems, load_config
+from ..core.watch import FolderWatcher, solution_info
+
+
+def main(input_folder=None, backend="selenium", debounce=None):
+    """Main function for watch mode.
+
+    Args:
+        input_folder: Folder to watch (overrides PATH_TO_FOLDER)
+        backend: "selenium" to submit through Chrome, "http" to submit over the API
+        debounce: Seconds a file must stay unchanged before it is submitted
+    """
+    load_config()
+    folder = input_folder or getenv("PATH_TO_FOLDER")
+    debounce = float(getenv("WATCH_DEBOUNCE", "1.5")) if debounce is None else debounce
+    pacer = Pacer.from_config()
+    queue = SubmissionQueue()
+    queue.recover()
+    hashes = SourceHashes()
+    skip_unchanged = skip_unchanged_enabled()
+
+    try:
+        accepted = set(get_accepted_problems())
+    except ConnectionError:
+        print("Connection error, AC problems will not be skipped")
+        accepted = set()
+
+    wakeup = threading.Event()
+    # Saves made while the last submission of their problem was still active
+    deferred = set()
+    deferred_lock = threading.Lock()
+
+    def offer(path):
+        """Queue a changed file; returns False if it has to wait for an active job."""
+        problem_code, language = solution_info(path)
+        if problem_code in accepted or not os.path.isfile(path):
+            return True
+        if skip_unchanged and hashes.is_unchanged(problem_code, language, path):
+            return True
+        if queue.enqueue(path, problem_code, language):
+            print(f"{problem_code} changed, queued")
+            wakeup.set()
+            return True
+        # A queued job reads the file when it is sent, so it sends this save too
+        return any(job["problem_code"] == problem_code for job in queue.jobs("queued"))
+
+    def on_change(path):
+        if offer(path):
+            return
+        with deferred_lock:
+            known = path in deferred
+            deferred.add(path)
+        if not known:
+            print(f"{os.path.basename(path)} changed while the last submission of its problem "
+                  f"is waiting for a verdict, it is queued once that is done")
+
+    def retry_deferred():
+        with deferred_lock:
+            paths = list(deferred)
+        for path in paths:
+            if offer(path):
+                with deferred_lock:
+                    deferred.discard(path)
+
+    def on_submitted(job, submission_id):
+        queue.mark_submitted(job["id"], submission_id)
+        if job.get("source") is not None:
+            hashes.record_code(job["problem_code"], job["language"], job["source"], submission_id)
+        else:
+            hashes.record_file(job["problem_code"], job["language"], job["path"], submission_id)
+
+    def on_verdict(entry):
+        tracker.print_verdict(entry)
+        queue.mark_judged(entry["submission_id"], entry["result"], entry["score"])
+        if entry["result"] == "AC":
+            accepted.add(entry["problem_code"])
+        wakeup.set()
+
+    def on_failed(job, error):
+        queue.mark_failed(job["id"], error)
+        wakeup.set()
+
+    def watched_jobs():
+        while not pipeline.stopping.is_set():
+            job = queue.claim_next()
+            if job is not None:
+                yield job
+                continue
+            wakeup.wait(0.5)
+            wakeup.clear()
+            if deferred:
+                retry_deferred()
+
+    # The browser stays open (and logged in) for the whole session
+    submission_manager = open_manager(backend)
+    tracker = start_tracker(on_verdict=on_verdict)
+    pipeline = SubmissionPipeline(
+        submission_manager,
+        pacer=pacer,
+        tracker=tracker,
+        on_submitted=on_submitted,
+        on_failed=on_failed,
+    )
+
+    watcher = FolderWatcher(folder, on_change, debounce=debounce).start()
+    mode = "polling" if watcher.use_polling else "file system events"
+    print(f"Watching {folder} ({mode}), press Ctrl+C to stop")
+
+    try:
+        asyncio.run(pipeline.run(watched_jobs()))
+    except KeyboardInterrupt:
+        for job in pipeline.firing:
+            queue.mark_submitted(job["id"], None)
+        # Everything else this process claimed goes back to the queue
+        for job in queue.jobs("submitting"):
+            if job["owner_pid"] == os.getpid():
+                queue.release(job["id"])
+        print("Stopped watching")
+
+    watcher.stop()
+    asyncio.run(pipeline.manager.close())
+    finish_tracker(tracker)
+    queue.close()
+    hashes.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Local stand-in for the Codefun API used by HTTP tests."""
+
+import hashlib
+import html
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubCodefun:
+    """Minimal in-memory Codefun server running on localhost."""
+
+    TOKEN = "stub-token"
+
+    def __init__(self, username="user", password="pass"):
+        """Initialize server state."""
+        self.username = username
+        self.password = password
+        self.submissions = []
+        self.verdicts = {}
+        self.stats = []
+        self.requests = []
+        # Seconds each submission lookup takes, and whether the API leaves out
+        # the code so clients must read it from the page
+        self.delay = 0
+        self.code_in_api = True
+        # Seconds the server takes to answer a submit, after storing it
+        self.submit_delay = 0
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        """Base URL of the running server."""
+        host, port = self.server.server_address
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Start serving in a background thread."""
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Stop the server."""
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status, payload):
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _body(self):
+                length = int(self.headers.get("Content-Length", 0))
+                return json.loads(self.rfile.read(length) or b"{}")
+
+            def _authorized(self):
+                return self.headers.get("Authorization") == f"Bearer {stub.TOKEN}"
+
+            def do_GET(self):
+                stub.requests.append(("GET", self.path))
+                if self.path == f"/api/users/{stub.username}/stats":
+                    body = json.dumps({"data": stub.stats}).encode()
+                    etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                    if self.headers.get("If-None-Match") == etag:
+                        self.send_response(304)
+                        self.send_header("ETag", etag)
+                        self.end_headers()
+                        return
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    self.wfile.write(body)
+                    return
+
+                if not self._authorized():
+                    return self._reply(401, {"error": "Unauthorized"})
+
+                if self.path.startswith("/api/submissions/"):
+                    submission_id = int(self.path.rsplit("/", 1)[-1])
+                    if not 1 <= submission_id <= len(stub.submissions):
+                        return self._reply(404, {"error": "Not found"})
+                    with stub.lock:
+                        stub.active += 1
+                        stub.max_active = max(stub.max_active, stub.active)
+                    time.sleep(stub.delay)
+                    with stub.lock:
+                        stub.active -= 1
+                    submission = stub.submissions[submission_id - 1]
+                    data = {"id": submission_id, "problem": {"code": submission["problem"]},
+                            "language": submission["language"], "code": submission["code"],
+                            "result": "Q", "score": None}
+                    if not stub.code_in_api:
+                        del data["code"]
+                    data.update(stub.verdicts.get(submission_id, {}))
+                    return self._reply(200, {"data": data})
+
+                if self.path.startswith("/submissions/"):
+                    submission = stub.submissions[int(self.path.rsplit("/", 1)[-1]) - 1]
+                    body = f"<html><pre><code class=\"src\">{html.escape(submission['code'])}</code></pre></html>"
+                    body = body.encode()
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/html")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                    return
+
+                self._reply(404, {"error": "Not found"})
+
+            def do_POST(self):
+                stub.requests.append(("POST", self.path))
+                body = self._body()
+
+                if self.path == "/api/auth":
+                    if body.get("username") == stub.username and body.get("password") == stub.password:
+                        return self._reply(200, {"data": stub.TOKEN})
+                    return self._reply(401, {"error": "Invalid credentials"})
+
+                if self.path == "/api/submit":
+                    if not self._authorized():
+                        return self._reply(401, {"error": "Unauthorized"})
+                    stub.submissions.append(body)
+                    time.sleep(stub.submit_delay)
+                    return self._reply(200, {"data": len(stub.submissions)})
+
+                self._reply(404, {"error": "Not found"})
+
+        return Handler
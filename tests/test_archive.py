@@ -0,0 +1,118 @@
+"""Test module for the single-file source archive."""
+
+import unittest
+import sys
+import os
+import tempfile
+from unittest import mock
+
+# Add the parent directory to the path to import the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from codefun_autosubmit.core.archive import SourceArchive, get_archive_path
+from codefun_autosubmit.scripts import export, fetch_ac
+from tests.stub_server import StubCodefun
+
+
+class TestSourceArchive(unittest.TestCase):
+    """Test storing, looking up and exporting archived sources."""
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.archive = SourceArchive(os.path.join(self.folder.name, "sources.db"))
+
+    def tearDown(self):
+        self.archive.close()
+        self.folder.cleanup()
+
+    def test_put_and_get(self):
+        """Test sources are looked up by problem code and replaced by new submissions."""
+        self.assertEqual(self.archive.put(10, "P00001", "C++", "// old"), "P00001.cpp")
+        self.archive.put(12, "P00001", "Python3", "# new")
+        row = self.archive.get("P00001")
+        self.assertEqual((row["submission_id"], row["extension"], row["code"]), (12, "py", "# new"))
+        self.assertIsNone(self.archive.get("P00002"))
+
+    def test_pending(self):
+        """Test only new or changed submissions are pending."""
+        self.archive.put(10, "P00001", "C++", "// 1")
+        self.assertEqual(self.archive.pending([[10, "P00001"], [11, "P00002"], [12, "P00001"]]),
+                         [[11, "P00002"], [12, "P00001"]])
+
+    def test_export(self):
+        """Test export writes plain files, optionally for some problems only."""
+        self.archive.put(10, "P00001", "C++", "// 1")
+        self.archive.put(11, "P00002", "Pascal", "begin end.")
+        output = os.path.join(self.folder.name, "out")
+        self.assertEqual(self.archive.export(output, ["P00002", "P00009"]), 1)
+        self.assertEqual(os.listdir(output), ["P00002.pas"])
+        self.assertEqual(self.archive.export(output), 2)
+        with open(os.path.join(output, "P00001.cpp")) as f:
+            self.assertEqual(f.read(), "// 1")
+
+
+class TestArchiveFetch(unittest.TestCase):
+    """Test fetch --archive against the stub server."""
+
+    def setUp(self):
+        self.stub = StubCodefun().start()
+        self.stub.submissions = [{"problem": f"P0000{i}", "language": "C++", "code": f"// {i}"}
+                                 for i in range(1, 4)]
+        self.stub.stats = [{"problem": {"code": f"P0000{i}"}, "score": 100, "maxScore": 100,
+                            "submissionId": i} for i in range(1, 4)]
+        self.home = tempfile.TemporaryDirectory()
+        self.crawl = os.path.join(self.home.name, "crawl")
+        os.makedirs(self.crawl)
+        self.env = mock.patch.dict(os.environ, {
+            "HOME": self.home.name, "APPDATA": self.home.name, "CODEFUN_URL": self.stub.url,
+            "CF_USERNAME": "user", "CF_PASSWORD": "pass", "CRAWL_FOLDER": self.crawl,
+            "LANGUAGE": "C++", "STATS_TTL": "0",
+        })
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        self.stub.stop()
+        self.home.cleanup()
+
+    def lookups(self):
+        return len([path for _, path in self.stub.requests if path.startswith("/api/submissions/")])
+
+    def test_fetch_into_archive_then_export(self):
+        """Test sources go into one file, re-runs skip them, and export expands them."""
+        with mock.patch("builtins.print"):
+            fetch_ac.main(backend="http", archive="")
+            fetch_ac.main(backend="http", archive="")
+        self.assertEqual(self.lookups(), 3)
+        self.assertIn("codefun-sources.db", os.listdir(self.crawl))
+        self.assertFalse(any(name.endswith(".cpp") for name in os.listdir(self.crawl)))
+
+        archive = SourceArchive(get_archive_path(self.crawl))
+        self.assertEqual(archive.get("P00002")["code"], "// 2")
+        archive.close()
+
+        output = os.path.join(self.home.name, "out")
+        with mock.patch("builtins.print"):
+            export.main(output_folder=output)
+        self.assertEqual(sorted(os.listdir(output)), ["P00001.cpp", "P00002.cpp", "P00003.cpp"])
+
+    def test_fetch_leaves_same_named_local_files_alone(self):
+        """Test a file in the current folder named like a member is not archived or removed."""
+        cwd = os.getcwd()
+        os.chdir(self.home.name)
+        try:
+            with open("P00001.cpp", "w") as f:
+                f.write("// mine")
+            with mock.patch("builtins.print"):
+                fetch_ac.main(backend="http", archive="")
+            with open("P00001.cpp") as f:
+                self.assertEqual(f.read(), "// mine")
+        finally:
+            os.chdir(cwd)
+        archive = SourceArchive(get_archive_path(self.crawl))
+        self.assertEqual(archive.get("P00001")["code"], "// 1")
+        archive.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
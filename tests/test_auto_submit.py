@@ -0,0 +1,67 @@
+"""Test module for the auto-submit script."""
+
+import unittest
+import sys
+import os
+import tempfile
+from unittest import mock
+
+# Add the parent directory to the path to import the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from codefun_autosubmit.core.errors import RateLimitedError
+from codefun_autosubmit.core.pacing import Pacer
+from codefun_autosubmit.scripts import auto_submit
+
+
+class TestAutoSubmit(unittest.TestCase):
+    """Test retries and interruptions of the submit loop."""
+
+    def setUp(self):
+        self.home = tempfile.TemporaryDirectory()
+        self.manager = mock.Mock()
+        # Submissions go through either entry point
+        self.send = self.manager.submit = self.manager.submit_by_id = mock.Mock()
+        self.manager.find_file.side_effect = lambda task_id, language, folder: (
+            os.path.join(self.home.name, f"P{task_id}.py"), "Python3")
+        self.patches = [
+            mock.patch.dict(os.environ, {"HOME": self.home.name, "APPDATA": self.home.name,
+                                         "SUBMIT_RETRIES": "2", "PREJUDGE": "0",
+                                         "TRACK_VERDICTS": "0"}),
+            mock.patch.object(auto_submit, "open_manager", return_value=self.manager),
+            mock.patch.object(Pacer, "from_config",
+                              return_value=Pacer(base_interval=0, min_interval=0, max_interval=0)),
+            mock.patch("builtins.print"),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self):
+        for patch in reversed(self.patches):
+            patch.stop()
+        self.home.cleanup()
+
+    def test_rate_limit_retries_are_capped(self):
+        """Test a problem that stays rate limited is skipped after SUBMIT_RETRIES."""
+        self.send.side_effect = [RateLimitedError(retry_after=0)] * 3 + [7]
+        auto_submit.main(tasks=["001", "002"])
+        self.assertEqual(self.send.call_count, 4)
+        self.manager.close.assert_called_once()
+
+    def test_interrupted_submission_can_halt(self):
+        """Test Ctrl+C while submitting asks whether to halt instead of crashing."""
+        self.send.side_effect = KeyboardInterrupt
+        with mock.patch("builtins.input", return_value="y"):
+            auto_submit.main(tasks=["001", "002"])
+        self.assertEqual(self.send.call_count, 1)
+        self.manager.close.assert_called_once()
+
+        self.send.reset_mock()
+        self.send.side_effect = [KeyboardInterrupt, 8]
+        with mock.patch("builtins.input", return_value="n"):
+            auto_submit.main(tasks=["001", "002"])
+        self.assertEqual(self.send.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
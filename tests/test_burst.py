@@ -0,0 +1,114 @@
+"""Test module for burst submission."""
+
+import unittest
+import sys
+import os
+import tempfile
+from datetime import datetime
+
+# Add the parent directory to the path to import the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from unittest import mock
+from codefun_autosubmit.core import burst as burst_module
+from codefun_autosubmit.core.burst import BurstSubmitter, parse_start_time
+from codefun_autosubmit.core.errors import RateLimitedError
+from codefun_autosubmit.core.http import CodefunClient
+from codefun_autosubmit.core.submission import SubmissionManager
+from tests.stub_server import StubCodefun
+
+
+class FakeDriver:
+    """Driver stand-in that only tracks tabs."""
+
+    def __init__(self):
+        self.tabs = 1
+        self.current_window_handle = 1
+        self.switch_to = mock.Mock()
+        self.switch_to.new_window.side_effect = self.new_window
+
+    def new_window(self, kind):
+        self.tabs += 1
+        self.current_window_handle = self.tabs
+
+
+class FakeQuery:
+    """Query stand-in whose form fill fails for problem BAD."""
+
+    events = []
+
+    def __init__(self, driver, abspath, lang, problem_id, submit=True):
+        if problem_id == "BAD":
+            raise Exception("Login failed")
+        self.problem_id = problem_id
+
+    def fire(self):
+        FakeQuery.events.append(f"fire {self.problem_id}")
+
+    def check_result(self):
+        FakeQuery.events.append(f"check {self.problem_id}")
+        if self.problem_id == "LIMITED":
+            raise RateLimitedError()
+        return 100 + len([e for e in FakeQuery.events if e.startswith("check")])
+
+
+class TestBurst(unittest.TestCase):
+    """Test start time parsing and HTTP burst submission."""
+
+    def test_parse_start_time(self):
+        """Test clock times roll over to tomorrow and ISO datetimes pass through."""
+        now = datetime(2024, 5, 1, 12, 0, 0)
+        self.assertEqual(parse_start_time("19:30", now), datetime(2024, 5, 1, 19, 30))
+        self.assertEqual(parse_start_time("08:00:05", now), datetime(2024, 5, 2, 8, 0, 5))
+        self.assertEqual(parse_start_time("2024-06-01T10:00:00", now), datetime(2024, 6, 1, 10))
+        with self.assertRaises(Exception):
+            parse_start_time("soon", now)
+
+    def test_http_burst(self):
+        """Test that prepared jobs are all posted with latency reported."""
+        stub = StubCodefun().start()
+        client = CodefunClient("user", "pass", base_url=stub.url, store=False)
+        manager = SubmissionManager(backend="http", client=client)
+        try:
+            with tempfile.TemporaryDirectory() as folder:
+                jobs = []
+                for code in ["P00001", "P00002", "P00003"]:
+                    path = os.path.join(folder, f"{code}.py")
+                    with open(path, "w") as f:
+                        f.write(f"# {code}")
+                    jobs.append((path, "Python3", code))
+
+                burst = BurstSubmitter(manager)
+                burst.prepare(jobs)
+                self.assertEqual(len(stub.submissions), 0)
+                results = burst.fire()
+        finally:
+            manager.close()
+            stub.stop()
+
+        self.assertEqual(sorted(r[0] for r in results), ["P00001", "P00002", "P00003"])
+        self.assertTrue(all(r[1] >= 0 and not isinstance(r[2], Exception) for r in results))
+        self.assertEqual(len(stub.submissions), 3)
+
+    def test_selenium_burst(self):
+        """Test that a failed form fill is reported and results are read after every click."""
+        driver = FakeDriver()
+        manager = mock.Mock(backend="selenium", driver=driver)
+        with mock.patch.object(burst_module, "Query", FakeQuery):
+            burst = BurstSubmitter(manager)
+            failed = burst.prepare([("a", "C++", "P00001"), ("b", "C++", "BAD"), ("c", "C++", "P00003"),
+                                    ("d", "C++", "LIMITED")])
+            results = burst.fire()
+
+        self.assertEqual([(code, str(e)) for code, e in failed], [("BAD", "Login failed")])
+        # The tab left by the failed fill is reused
+        self.assertEqual(driver.tabs, 3)
+        self.assertEqual([r[0] for r in results], ["P00001", "P00003", "LIMITED"])
+        self.assertEqual(results[0][2], 101)
+        self.assertIsInstance(results[2][2], RateLimitedError)
+        self.assertEqual(FakeQuery.events[:4], ["fire P00001", "fire P00003", "fire LIMITED",
+                                                "check P00001"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+"""Test module for the warm-browser daemon."""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+from unittest import mock
+
+# Add the parent directory to the path to import the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from codefun_autosubmit.core import daemon as daemon_module
+from codefun_autosubmit.core.daemon import (DaemonClient, DaemonServer, RemoteSubmissionManager,
+                                            discard_manager, get_daemon_info_path, start_manager)
+from codefun_autosubmit.core.pool import DriverPool
+from codefun_autosubmit.scripts import daemon as daemon_script
+
+
+class FakeManager:
+    """Records jobs instead of driving a browser."""
+
+    def __init__(self):
+        self.jobs = []
+        self.closed = False
+        self.warmed = False
+
+    def warm_up(self):
+        self.warmed = True
+        return True
+
+    def submit(self, abspath, lang, problem_code):
+        self.jobs.append((abspath, lang, problem_code))
+        return len(self.jobs)
+
+    def retrieve_submission(self, submission_id, problem_code, language, crawl_folder=None):
+        raise Exception("No code found")
+
+    def close(self):
+        self.closed = True
+
+
+class TestDaemon(unittest.TestCase):
+    """Test the daemon server and its thin client."""
+
+    def setUp(self):
+        self.home = tempfile.TemporaryDirectory()
+        self.env = mock.patch.dict(os.environ, {"HOME": self.home.name, "APPDATA": self.home.name})
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        self.home.cleanup()
+
+    def test_connect_without_daemon(self):
+        """Test that no client is returned when no daemon is running."""
+        self.assertIsNone(DaemonClient.connect())
+
+    def test_submit_through_daemon(self):
+        """Test that jobs run on the daemon's managers and stop cleans up."""
+        manager = FakeManager()
+        daemon = DaemonServer(DriverPool(1, manager_factory=lambda: manager), port=0)
+        thread = threading.Thread(target=daemon.serve_forever)
+        thread.start()
+        try:
+            for _ in range(50):
+                if get_daemon_info_path().exists():
+                    break
+                threading.Event().wait(0.02)
+
+            if os.name == "posix":
+                self.assertEqual(get_daemon_info_path().stat().st_mode & 0o777, 0o600)
+            client = DaemonClient.connect()
+            self.assertIsNotNone(client)
+            remote = RemoteSubmissionManager(client)
+            self.assertEqual(remote.submit("P00001.cpp", "C++", "P00001"), 1)
+            self.assertEqual(manager.jobs[0], (os.path.abspath("P00001.cpp"), "C++", "P00001"))
+
+            with self.assertRaises(Exception):
+                remote.retrieve_submission(1, "P00001", "C++")
+
+            client.call("stop")
+            remote.close()
+        finally:
+            thread.join(timeout=5)
+            daemon.close()
+
+        self.assertFalse(get_daemon_info_path().exists())
+        self.assertTrue(manager.closed)
+
+    def test_busy_port_closes_pool(self):
+        """Test that browsers started for the daemon are quit when the port is taken."""
+        manager = FakeManager()
+        busy = DaemonServer(DriverPool(1, manager_factory=FakeManager), port=0)
+        try:
+            with mock.patch.object(daemon_script, "DriverPool",
+                                   lambda size: DriverPool(size, manager_factory=lambda: manager)), \
+                    mock.patch("builtins.print"):
+                with self.assertRaises(OSError):
+                    daemon_script.main(port=busy.port)
+        finally:
+            busy.close()
+        self.assertTrue(manager.closed)
+        self.assertFalse(manager.warmed)
+
+    def test_pool_warm_up(self):
+        """Test that every pooled driver is logged in."""
+        pool = DriverPool(3, manager_factory=FakeManager)
+        self.assertEqual(pool.warm_up(), 3)
+        self.assertTrue(all(manager.warmed for manager in pool.managers))
+        pool.close()
+
+    def test_discard_started_manager(self):
+        """Test that a manager started in the background is closed when discarded."""
+        manager = FakeManager()
+        with mock.patch.object(daemon_module, "open_manager", lambda backend: manager):
+            future = start_manager("selenium")
+            discard_manager(future)
+
+        self.assertTrue(manager.closed)
+
+    def test_started_manager_logs_in(self):
+        """Test that a manager started in the background logs in before it is handed over."""
+        manager = FakeManager()
+        with mock.patch.object(daemon_module, "open_manager", lambda backend: manager):
+            self.assertIs(start_manager("selenium").result(), manager)
+        self.assertTrue(manager.warmed)
+
+
+if __name__ == "__main__":
+    unittest.main()
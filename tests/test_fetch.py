@@ -0,0 +1,69 @@
+"""Test module for the HTTP submission fetcher."""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Add the parent directory to the path to import the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from codefun_autosubmit.core.fetch import HttpFetcher
+from codefun_autosubmit.core.http import CodefunClient
+from tests.stub_server import StubCodefun
+
+
+class TestHttpFetcher(unittest.TestCase):
+    """Test concurrent fetching against the stub server."""
+
+    def setUp(self):
+        self.stub = StubCodefun().start()
+        self.stub.submissions = [
+            {"problem": f"P{index:05d}", "language": "C++" if index % 2 else "Python3",
+             "code": f"// solution {index} <&>\n"}
+            for index in range(1, 21)
+        ]
+        self.folder = tempfile.TemporaryDirectory()
+        client = CodefunClient("user", "pass", base_url=self.stub.url, pool_size=4, store=False)
+        self.fetcher = HttpFetcher(client, workers=4, crawl_folder=self.folder.name)
+        self.pairs = [[index, f"P{index:05d}"] for index in range(1, 21)]
+
+    def tearDown(self):
+        self.fetcher.close()
+        self.stub.stop()
+        self.folder.cleanup()
+
+    def test_fetch_saves_every_source(self):
+        """Test all sources are saved with bounded concurrency."""
+        self.stub.delay = 0.05
+        results = []
+        saved = self.fetcher.fetch(self.pairs, on_result=lambda *result: results.append(result))
+        self.assertEqual(saved, 20)
+        self.assertEqual(len(results), 20)
+        self.assertTrue(1 < self.stub.max_active <= 4)
+        with open(os.path.join(self.folder.name, "P00002.py")) as f:
+            self.assertEqual(f.read(), "// solution 2 <&>\n")
+
+    def test_language_filter(self):
+        """Test only submissions in the wanted language are saved."""
+        self.assertEqual(self.fetcher.fetch(self.pairs, language="C++"), 10)
+        self.assertEqual(sorted(os.listdir(self.folder.name))[:2], ["P00001.cpp", "P00003.cpp"])
+
+    def test_page_fallback(self):
+        """Test the code is read from the page when the API leaves it out."""
+        self.stub.code_in_api = False
+        self.assertEqual(self.fetcher.fetch(self.pairs[:3]), 3)
+        with open(os.path.join(self.folder.name, "P00001.cpp")) as f:
+            self.assertEqual(f.read(), "// solution 1 <&>\n")
+
+    def test_errors_are_reported(self):
+        """Test a failing submission is reported and does not stop the rest."""
+        results = []
+        saved = self.fetcher.fetch([[99, "P00099"]] + self.pairs[:2],
+                                   on_result=lambda *result: results.append(result))
+        self.assertEqual(saved, 2)
+        self.assertTrue(any(error is not None for *_, error in results))
+
+
+if __name__ == '__main__':
+    unittest.main()
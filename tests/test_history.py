@@ -0,0 +1,92 @@
+"""Test module for the local stats and submission history."""
+
+import unittest
+import sys
+import os
+import tempfile
+from unittest import mock
+
+# Add the parent directory to the path to import the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from codefun_autosubmit.core.history import History
+from codefun_autosubmit.core.stats import StatsSnapshot
+from codefun_autosubmit.core.submission_queue import SubmissionQueue
+from codefun_autosubmit.core.utils import get_loop_list
+
+
+def row(code, score, max_score=100, submission_id=None):
+    """Build a stats row like Codefun returns."""
+    return {"problem": {"code": code}, "score": score, "maxScore": max_score,
+            "submissionId": submission_id}
+
+
+STATS = StatsSnapshot([row("P00001", 100, submission_id=11), row("P00002", 40, submission_id=12),
+                       row("P00003", 0, submission_id=13)])
+
+
+class TestHistory(unittest.TestCase):
+    """Test syncing and status queries."""
+
+    def setUp(self):
+        self.home = tempfile.TemporaryDirectory()
+        self.env = mock.patch.dict(os.environ, {"HOME": self.home.name, "APPDATA": self.home.name,
+                                                "PATH_TO_FOLDER": self.home.name})
+        self.env.start()
+        self.history = History()
+        self.queue = SubmissionQueue()
+
+    def tearDown(self):
+        self.history.close()
+        self.queue.close()
+        self.env.stop()
+        self.home.cleanup()
+
+    def submit(self, problem_code, submission_id, result=None, score=None):
+        job_id = self.queue.enqueue(f"/src/{problem_code}.cpp", problem_code, "C++")
+        self.queue.claim_next()
+        self.queue.mark_submitted(job_id, submission_id)
+        if result:
+            self.queue.mark_judged(submission_id, result, score)
+
+    def test_sync_stats_is_incremental(self):
+        """Test unchanged rows are not rewritten."""
+        self.assertEqual(self.history.sync_stats(STATS), 3)
+        self.assertEqual(self.history.sync_stats(STATS), 0)
+        changed = StatsSnapshot([row("P00001", 100, submission_id=11), row("P00002", 70, submission_id=20),
+                                 row("P00003", 0, submission_id=13)])
+        self.assertEqual(self.history.sync_stats(changed), 1)
+
+    def test_status_queries(self):
+        """Test unsolved, partial and accepted problems."""
+        self.history.sync_stats(STATS)
+        self.assertEqual(self.history.accepted(), {"P00001"})
+        self.assertEqual([r["problem_code"] for r in self.history.unsolved()], ["P00002", "P00003"])
+        self.assertEqual([r["problem_code"] for r in self.history.partial()], ["P00002"])
+        summary = self.history.summary()
+        self.assertEqual((summary["attempted"], summary["accepted"], summary["partial"]), (3, 1, 1))
+
+    def test_own_submissions(self):
+        """Test our verdicts are merged with stats and counted as attempts."""
+        self.history.sync_stats(STATS)
+        self.submit("P00002", 30, "WA", 40)
+        self.submit("P00003", 31, "AC", 100)
+        self.assertEqual(self.history.sync_queue(self.queue), 2)
+        self.assertEqual(self.history.sync_queue(self.queue), 0)
+
+        self.assertEqual(self.history.accepted(), {"P00001", "P00003"})
+        self.assertEqual([r["submission_id"] for r in self.history.attempts("P00002")], [30, 12])
+        self.assertEqual([r["result"] for r in self.history.recent()], ["AC", "WA"])
+
+    def test_get_loop_list_offline(self):
+        """Test get_loop_list decides from the local history without the network."""
+        self.history.sync_stats(STATS)
+        for name in ["P00001.cpp", "P00002.cpp", "P00004.py"]:
+            open(os.path.join(self.home.name, name), "w").close()
+        with mock.patch("builtins.print"):
+            self.assertEqual(sorted(get_loop_list(offline=True)), ["P00002.cpp", "P00004.py"])
+            self.assertEqual(get_loop_list(skip_submitted=True, offline=True), ["P00004.py"])
+
+
+if __name__ == '__main__':
+    unittest.main()
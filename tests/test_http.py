@@ -0,0 +1,112 @@
+"""Test module for the HTTP submission backend."""
+
+import unittest
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add the parent directory to the path to import the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import requests
+from codefun_autosubmit.core.errors import SubmitUncertainError, request_not_sent
+from codefun_autosubmit.core.http import CodefunClient
+from codefun_autosubmit.core.resilience import ResilientManager
+from codefun_autosubmit.core.session import SessionStore
+from codefun_autosubmit.core.submission import SubmissionManager
+from tests.stub_server import StubCodefun
+
+
+class TestHttpBackend(unittest.TestCase):
+    """Test submissions against a local stand-in server."""
+
+    def setUp(self):
+        self.stub = StubCodefun().start()
+        self.client = CodefunClient("user", "pass", base_url=self.stub.url, store=False)
+
+    def tearDown(self):
+        self.client.close()
+        self.stub.stop()
+
+    def test_login_and_submit(self):
+        """Test that submit logs in once and posts the source."""
+        self.assertEqual(self.client.submit("P00001", "C++", "int main() {}"), 1)
+        self.assertEqual(self.client.submit("P00002", "Python3", "print(1)"), 2)
+
+        logins = [path for _, path in self.stub.requests if path == "/api/auth"]
+        self.assertEqual(len(logins), 1)
+        self.assertEqual(self.stub.submissions[0],
+                         {"problem": "P00001", "language": "C++", "code": "int main() {}"})
+
+    def test_bad_credentials(self):
+        """Test that a rejected login raises."""
+        client = CodefunClient("user", "wrong", base_url=self.stub.url, store=False)
+        with self.assertRaises(Exception):
+            client.login()
+        client.close()
+
+    def test_saved_session_reused(self):
+        """Test that a saved token skips login and is renewed once it expires."""
+        with tempfile.TemporaryDirectory() as folder:
+            store = SessionStore("http", Path(folder) / "http-session.json")
+            first = CodefunClient("user", "pass", base_url=self.stub.url, store=store)
+            first.submit("P00001", "C++", "")
+            first.close()
+
+            second = CodefunClient("user", "pass", base_url=self.stub.url, store=store)
+            second.submit("P00002", "C++", "")
+            logins = [path for _, path in self.stub.requests if path == "/api/auth"]
+            self.assertEqual(len(logins), 1)
+
+            self.stub.TOKEN = "rotated-token"
+            second.submit("P00003", "C++", "")
+            second.close()
+            logins = [path for _, path in self.stub.requests if path == "/api/auth"]
+            self.assertEqual(len(logins), 2)
+            self.assertEqual(store.load()["token"], "rotated-token")
+
+    def test_manager_http_backend(self):
+        """Test SubmissionManager routing through the HTTP backend."""
+        manager = SubmissionManager(backend="http", client=self.client)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "P00003.py")
+            with open(path, "w") as f:
+                f.write("print(3)")
+            manager.submit(path, "Python3", "P00003")
+
+        self.assertEqual(self.stub.submissions[-1]["problem"], "P00003")
+        self.assertEqual(self.stub.submissions[-1]["code"], "print(3)")
+
+    def test_ambiguous_submit_is_not_retried(self):
+        """Test a submit that timed out after it was sent is raised, not sent again."""
+        client = CodefunClient("user", "pass", base_url=self.stub.url, store=False, timeout=0.2)
+        manager = ResilientManager(SubmissionManager(backend="http", client=client),
+                                   sleep=lambda seconds: None)
+        self.stub.submit_delay = 1
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "P00004.cpp")
+            with open(path, "w") as f:
+                f.write("")
+            with self.assertRaises(SubmitUncertainError):
+                manager.submit(path, "C++", "P00004")
+        client.close()
+        self.assertEqual(len([path for _, path in self.stub.requests if path == "/api/submit"]), 1)
+
+    def test_refused_connection_was_not_sent(self):
+        """Test a refused connection counts as never sent, so it may be retried."""
+        port = self.stub.server.server_address[1]
+        self.stub.stop()
+        with self.assertRaises(requests.ConnectionError) as caught:
+            requests.post(f"http://127.0.0.1:{port}/api/submit", timeout=1)
+        self.assertTrue(request_not_sent(caught.exception))
+        self.stub = StubCodefun().start()
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend is rejected."""
+        with self.assertRaises(Exception):
+            SubmissionManager(backend="telnet")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+"""Test module for the incremental fetch manifest."""
+
+import unittest
+import sys
+import os
+import tempfile
+from unittest import mock
+
+# Add the parent directory to the path to import the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from codefun_autosubmit.core.manifest import FetchManifest
+from codefun_autosubmit.scripts import fetch_ac
+from tests.stub_server import StubCodefun
+
+
+class TestFetchManifest(unittest.TestCase):
+    """Test which submissions count as already fetched."""
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, "P00001.cpp")
+        with open(self.path, "w") as f:
+            f.write("int main() {}")
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_pending_after_reload(self):
+        """Test only new or changed submissions are pending after a reload."""
+        manifest = FetchManifest(self.folder.name)
+        manifest.record(10, "P00001", self.path, "C++")
+        manifest.save()
+
+        manifest = FetchManifest(self.folder.name)
+        self.assertEqual(manifest.pending([[10, "P00001"], [11, "P00002"]]), [[11, "P00002"]])
+        self.assertEqual(manifest.pending([[12, "P00001"]]), [[12, "P00001"]])
+        self.assertEqual(len(manifest.entries["P00001"]["sha256"]), 64)
+
+    def test_deleted_files_are_fetched_again(self):
+        """Test a fetched file that was deleted is pending again."""
+        manifest = FetchManifest(self.folder.name)
+        manifest.record(10, "P00001", self.path, "C++")
+        os.remove(self.path)
+        self.assertEqual(manifest.pending([[10, "P00001"]]), [[10, "P00001"]])
+
+    def test_skipped_languages(self):
+        """Test submissions skipped for their language wait for a different filter."""
+        manifest = FetchManifest(self.folder.name)
+        manifest.record(10, "P00003", None, language_filter="C++")
+        self.assertEqual(manifest.pending([[10, "P00003"]], "C++"), [])
+        self.assertEqual(manifest.pending([[10, "P00003"]], None), [[10, "P00003"]])
+
+
+class TestIncrementalFetch(unittest.TestCase):
+    """Test fetch only downloads changed submissions from the stub server."""
+
+    def setUp(self):
+        self.stub = StubCodefun().start()
+        self.stub.submissions = [{"problem": f"P0000{i}", "language": "C++", "code": f"// {i}"}
+                                 for i in range(1, 4)]
+        self.stub.stats = [{"problem": {"code": f"P0000{i}"}, "score": 100, "maxScore": 100,
+                            "submissionId": i} for i in range(1, 4)]
+        self.home = tempfile.TemporaryDirectory()
+        self.crawl = os.path.join(self.home.name, "crawl")
+        os.makedirs(self.crawl)
+        self.env = mock.patch.dict(os.environ, {
+            "HOME": self.home.name, "APPDATA": self.home.name, "CODEFUN_URL": self.stub.url,
+            "CF_USERNAME": "user", "CF_PASSWORD": "pass", "CRAWL_FOLDER": self.crawl,
+            "LANGUAGE": "C++", "STATS_TTL": "0",
+        })
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        self.stub.stop()
+        self.home.cleanup()
+
+    def lookups(self):
+        return len([path for _, path in self.stub.requests if path.startswith("/api/submissions/")])
+
+    def test_second_fetch_only_gets_changes(self):
+        """Test a re-run downloads nothing until a submission ID changes."""
+        with mock.patch("builtins.print"):
+            fetch_ac.main(backend="http")
+            self.assertEqual(self.lookups(), 3)
+            fetch_ac.main(backend="http")
+            self.assertEqual(self.lookups(), 3)
+
+            self.stub.submissions.append({"problem": "P00002", "language": "C++", "code": "// better"})
+            self.stub.stats[1]["submissionId"] = 4
+            fetch_ac.main(backend="http")
+        self.assertEqual(self.lookups(), 4)
+        with open(os.path.join(self.crawl, "P00002.cpp")) as f:
+            self.assertEqual(f.read(), "// better")
+
+    def test_all_languages(self):
+        """Test every language is saved under its own extension."""
+        self.stub.submissions[1]["language"] = "Python3"
+        with mock.patch("builtins.print"):
+            fetch_ac.main(backend="http")
+            self.assertEqual(sorted(os.listdir(self.crawl)),
+                             [".codefun-manifest.json", "P00001.cpp", "P00003.cpp"])
+            fetch_ac.main(backend="http", all_languages=True)
+        self.assertIn("P00002.py", os.listdir(self.crawl))
+        self.assertEqual(self.lookups(), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""Test module for the adaptive submission pacer."""
+
+import unittest
+import sys
+import os
+
+# Add the parent directory to the path to import the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from codefun_autosubmit.core.pacing import Pacer
+
+
+class FakeClock:
+    """Clock advanced by the pacer's own sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestPacer(unittest.TestCase):
+    """Test token bucket pacing and feedback."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def make(self, **kwargs):
+        return Pacer(clock=self.clock, sleep=self.clock.sleep, **kwargs)
+
+    def test_first_submission_immediate(self):
+        """Test that the bucket starts full and then spaces submissions."""
+        pacer = self.make(base_interval=90, min_interval=90)
+        self.assertEqual(pacer.wait(), 0)
+        self.assertAlmostEqual(pacer.wait(), 90)
+
+    def test_burst(self):
+        """Test that idle time accumulates up to the burst size."""
+        pacer = self.make(base_interval=10, min_interval=10, burst=3)
+        self.clock.now += 1000
+        waits = [pacer.wait() for _ in range(4)]
+        self.assertEqual(waits[:3], [0, 0, 0])
+        self.assertAlmostEqual(waits[3], 10)
+
+    def test_success_speeds_up(self):
+        """Test that accepted submissions shrink the interval to the floor."""
+        pacer = self.make(base_interval=90, min_interval=30)
+        for _ in range(50):
+            pacer.record_success()
+        self.assertEqual(pacer.interval, 30)
+
+    def test_rate_limit_backs_off(self):
+        """Test that Retry-After blocks and the interval doubles."""
+        pacer = self.make(base_interval=10, min_interval=10, max_interval=100)
+        pacer.wait()
+        pacer.record_rate_limit(retry_after=60)
+        self.assertEqual(pacer.interval, 20)
+        self.assertAlmostEqual(pacer.wait(), 60)
+
+    def test_queue_depth_slows_down(self):
+        """Test that a deep judge queue stretches the interval."""
+        pacer = self.make(base_interval=10, min_interval=10, max_interval=100, queue_target=5)
+        pacer.record_queue_depth(20)
+        self.assertEqual(pacer.effective_interval(), 40)
+
+    def test_skip(self):
+        """Test that a skipped wait does not leave debt behind."""
+        pacer = self.make(base_interval=10, min_interval=10)
+        pacer.wait()
+        pacer.skip()
+        self.assertAlmostEqual(pacer.delay(), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+"""Test module for the asyncio submission pipeline."""
+
+import unittest
+import sys
+import os
+import asyncio
+import tempfile
+
+# Add the parent directory to the path to import the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from selenium.common.exceptions import StaleElementReferenceException
+from codefun_autosubmit.core.errors import RateLimitedError, SubmitUncertainError
+from codefun_autosubmit.core.http import CodefunClient
+from codefun_autosubmit.core.pacing import Pacer
+from codefun_autosubmit.core.pipeline import SubmissionPipeline
+from codefun_autosubmit.core.submission import SubmissionManager
+from tests.stub_server import StubCodefun
+
+
+class FakeBrowserManager:
+    """Records the order of form fills and sends, like a one-window browser."""
+
+    backend = "selenium"
+
+    def __init__(self, rate_limit_once=(), fail_once=None):
+        self.events = []
+        self.rate_limit_once = set(rate_limit_once)
+        # problem_code -> error the first fire of that problem raises
+        self.fail_once = dict(fail_once or {})
+
+    def prepare(self, abspath, lang, problem_code):
+        self.events.append(("prepare", problem_code))
+        return problem_code
+
+    def fire(self, prepared):
+        self.events.append(("fire", prepared))
+        if prepared in self.rate_limit_once:
+            self.rate_limit_once.remove(prepared)
+            raise RateLimitedError(retry_after=0)
+        if prepared in self.fail_once:
+            raise self.fail_once.pop(prepared)
+        return len([e for e in self.events if e[0] == "fire"])
+
+    def close(self):
+        pass
+
+
+class TestPipeline(unittest.TestCase):
+    """Test stage ordering, rate limiting and HTTP submission."""
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.jobs = []
+        for index, code in enumerate(["P00001", "P00002", "P00003"]):
+            path = os.path.join(self.folder.name, f"{code}.py")
+            with open(path, "w") as f:
+                f.write(f"# {code}")
+            self.jobs.append({"id": index, "path": path, "language": "Python3", "problem_code": code})
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def run_pipeline(self, manager, jobs, pacer=None):
+        submitted, failed = [], []
+        pipeline = SubmissionPipeline(
+            manager,
+            pacer=pacer or Pacer(base_interval=0, min_interval=0, max_interval=0),
+            on_submitted=lambda job, submission_id: submitted.append((job["id"], submission_id)),
+            on_failed=lambda job, error: failed.append((job["id"], str(error))),
+        )
+        count = asyncio.run(pipeline.run(jobs))
+        asyncio.run(pipeline.manager.close())
+        return count, submitted, failed
+
+    def test_browser_fills_next_form_after_send(self):
+        """Test one browser form is filled at a time, in job order."""
+        manager = FakeBrowserManager()
+        count, submitted, failed = self.run_pipeline(manager, self.jobs)
+        self.assertEqual(count, 3)
+        self.assertEqual(failed, [])
+        self.assertEqual(manager.events, [("prepare", "P00001"), ("fire", "P00001"),
+                                          ("prepare", "P00002"), ("fire", "P00002"),
+                                          ("prepare", "P00003"), ("fire", "P00003")])
+
+    def test_next_form_is_filled_while_pacer_waits(self):
+        """Test preparation overlaps the wait for the next submission slot."""
+        manager = FakeBrowserManager()
+        pacer = Pacer(base_interval=0.2, min_interval=0.2, max_interval=0.2)
+        self.run_pipeline(manager, self.jobs[:2], pacer)
+        self.assertEqual(manager.events[:3], [("prepare", "P00001"), ("fire", "P00001"),
+                                              ("prepare", "P00002")])
+
+    def test_rate_limited_job_is_prepared_again(self):
+        """Test a rate-limited submission is refilled and retried, not dropped."""
+        manager = FakeBrowserManager(rate_limit_once=["P00002"])
+        count, submitted, failed = self.run_pipeline(manager, self.jobs)
+        self.assertEqual(count, 3)
+        self.assertEqual([job_id for job_id, _ in submitted], [0, 1, 2])
+        self.assertEqual(manager.events.count(("prepare", "P00002")), 2)
+
+    def test_send_failures(self):
+        """Test only failures before the send start over; possibly sent jobs are not resent."""
+        manager = FakeBrowserManager(fail_once={
+            "P00001": StaleElementReferenceException(),
+            "P00002": SubmitUncertainError("click timed out"),
+        })
+        count, submitted, failed = self.run_pipeline(manager, self.jobs)
+        self.assertEqual(count, 2)
+        self.assertEqual(submitted, [(0, 2), (1, None), (2, 4)])
+        self.assertEqual(manager.events.count(("prepare", "P00001")), 2)
+        self.assertEqual(manager.events.count(("prepare", "P00002")), 1)
+        self.assertEqual(failed, [])
+
+    def test_missing_files_fail_without_blocking(self):
+        """Test invalid jobs are reported and the rest still go through."""
+        jobs = [dict(self.jobs[0], path="/missing/P00009.py")] + self.jobs[1:]
+        count, submitted, failed = self.run_pipeline(FakeBrowserManager(), jobs)
+        self.assertEqual(count, 2)
+        self.assertEqual(failed, [(0, "File not found")])
+
+    def test_http_pipeline(self):
+        """Test the pipeline submits over HTTP to the stub server."""
+        stub = StubCodefun().start()
+        client = CodefunClient("user", "pass", base_url=stub.url, store=False)
+        try:
+            count, submitted, failed = self.run_pipeline(
+                SubmissionManager(backend="http", client=client), iter(self.jobs))
+        finally:
+            stub.stop()
+
+        self.assertEqual(count, 3)
+        self.assertEqual(sorted(submission_id for _, submission_id in submitted), [1, 2, 3])
+        self.assertEqual([s["problem"] for s in stub.submissions], ["P00001", "P00002", "P00003"])
+        # Callbacks see the code that was sent, not whatever the file holds later
+        self.assertEqual([job["source"] for job in self.jobs], ["# P00001", "# P00002", "# P00003"])
+
+
+if __name__ == "__main__":
+    unittest.main()
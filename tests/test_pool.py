@@ -0,0 +1,108 @@
+"""Test module for the driver pool."""
+
+import unittest
+import sys
+import os
+import threading
+import time
+from unittest import mock
+
+# Add the parent directory to the path to import the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from codefun_autosubmit.core import pool as pool_module
+from codefun_autosubmit.core.browser import get_profile_dir
+from codefun_autosubmit.core.pool import DriverPool
+
+
+class SlowManager:
+    """Manager whose jobs take a while, tracking concurrency."""
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def __init__(self):
+        self.closed = False
+
+    def _work(self):
+        with SlowManager.lock:
+            SlowManager.active += 1
+            SlowManager.peak = max(SlowManager.peak, SlowManager.active)
+        time.sleep(0.05)
+        with SlowManager.lock:
+            SlowManager.active -= 1
+
+    def submit(self, abspath, lang, problem_code):
+        self._work()
+
+    def retrieve_submission(self, submission_id, problem_code, language, crawl_folder=None):
+        self._work()
+        return problem_code
+
+    def close(self):
+        self.closed = True
+
+
+class TestDriverPool(unittest.TestCase):
+    """Test job distribution over pooled managers."""
+
+    def setUp(self):
+        SlowManager.peak = 0
+        self.pool = DriverPool(3, manager_factory=SlowManager)
+
+    def tearDown(self):
+        self.pool.close()
+        self.assertTrue(all(manager.closed for manager in self.pool.managers))
+
+    def test_failed_start_closes_started_drivers(self):
+        """Test that drivers which started are closed when another fails to start."""
+        started = []
+        lock = threading.Lock()
+
+        def factory():
+            with lock:
+                if started:
+                    raise Exception("chromedriver failed to start")
+                started.append(SlowManager())
+                return started[-1]
+
+        with self.assertRaises(Exception):
+            DriverPool(3, manager_factory=factory)
+        self.assertEqual(len(started), 1)
+        self.assertTrue(started[0].closed)
+
+    def test_map_runs_in_parallel(self):
+        """Test that retrieval jobs spread over every driver."""
+        items = [(i, f"P{i:05d}") for i in range(9)]
+        results = {item: future.result() for item, future in self.pool.map(
+            lambda manager, item: manager.retrieve_submission(item[0], item[1], "C++"), items)}
+
+        self.assertEqual(results[(4, "P00004")], "P00004")
+        self.assertEqual(SlowManager.peak, 3)
+
+    def test_submissions_bounded(self):
+        """Test that submissions never exceed max_submitters at once."""
+        threads = [threading.Thread(target=self.pool.submit, args=("P.cpp", "C++", "P"))
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(SlowManager.peak, 1)
+
+    def test_drivers_get_their_own_profile(self):
+        """Test each default driver gets a slot, and so its own Chrome profile folder."""
+        with mock.patch.object(pool_module, "default_manager_factory",
+                               side_effect=lambda slot: SlowManager()) as factory:
+            DriverPool(3)
+        self.assertEqual(sorted(call.args[0] for call in factory.call_args_list), [0, 1, 2])
+
+        with mock.patch.dict(os.environ, {"CHROME_PROFILE_DIR": "/profiles/chrome"}):
+            self.assertEqual([get_profile_dir(slot) for slot in range(3)],
+                             ["/profiles/chrome", "/profiles/chrome-2", "/profiles/chrome-3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""Test module for the local pre-judge."""
+
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+# Add the parent directory to the path to import the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from codefun_autosubmit.core import prejudge
+from codefun_autosubmit.core.prejudge import PreJudge, judge_file, review_failures
+
+
+class TestPreJudge(unittest.TestCase):
+    """Test compile checks, sample runs and the compile cache."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = self.tmp.name
+        self.samples = os.path.join(self.folder, "samples")
+        self.cache = os.path.join(self.folder, "cache")
+        os.makedirs(os.path.join(self.samples, "P00001"))
+        os.makedirs(self.cache)
+        self.write(os.path.join(self.samples, "P00001", "1.inp"), "2 3\n")
+        self.write(os.path.join(self.samples, "P00001", "1.out"), "5\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, path, text):
+        with open(path, "w") as f:
+            f.write(text)
+        return path
+
+    def judge(self, filename, language, text, problem_code="P00001"):
+        path = self.write(os.path.join(self.folder, filename), text)
+        return judge_file(path, language, problem_code, self.samples, self.cache, 5)
+
+    def test_python_results(self):
+        """Test Python files are syntax-checked and run against samples."""
+        self.assertEqual(self.judge("a.py", "Python3", "print(sum(map(int, input().split())))")["status"],
+                         "passed")
+        self.assertEqual(self.judge("b.py", "Python3", "print(6)")["status"], "wrong_answer")
+        self.assertEqual(self.judge("c.py", "Python3", "print(")["status"], "compile_error")
+        self.assertEqual(self.judge("d.py", "Python3", "raise SystemExit(3)")["status"], "runtime_error")
+        self.assertEqual(self.judge("e.py", "Python3", "print(1)", "P00002")["status"], "no_tests")
+
+    def test_unsupported_language_is_skipped(self):
+        """Test languages without local checks go straight through."""
+        self.assertEqual(self.judge("a.s", "NAsm", "")["status"], "skipped")
+
+    @unittest.skipIf(shutil.which("g++") is None, "g++ is not installed")
+    def test_cpp_binaries_are_cached(self):
+        """Test identical C++ sources are compiled once."""
+        source = "#include <iostream>\nint main(){int a,b;std::cin>>a>>b;std::cout<<a+b;}\n"
+        self.assertEqual(self.judge("a.cpp", "C++", source)["status"], "passed")
+        self.assertEqual(len(os.listdir(self.cache)), 1)
+
+        with mock.patch.object(prejudge.subprocess, "run", wraps=prejudge.subprocess.run) as run:
+            self.assertEqual(self.judge("b.cpp", "C++", source)["status"], "passed")
+        # Only the sample run, no compiler call
+        self.assertEqual(run.call_count, 1)
+        self.assertEqual(self.judge("c.cpp", "C++", "int main( {")["status"], "compile_error")
+
+    def test_pool_keeps_job_order(self):
+        """Test results from the process pool come back in job order."""
+        jobs = [(self.write(os.path.join(self.folder, f"{i}.py"), f"print({4 + i})"), "Python3", "P00001")
+                for i in range(3)]
+        results = PreJudge(self.samples, cache_dir=self.cache, workers=2).check(jobs)
+        self.assertEqual([r["status"] for r in results], ["wrong_answer", "passed", "wrong_answer"])
+
+    def test_failures_need_confirmation(self):
+        """Test failing files are held back unless the user confirms."""
+        results = [{"path": "a.py", "problem_code": "P1", "status": "passed", "detail": ""},
+                   {"path": "b.py", "problem_code": "P2", "status": "wrong_answer", "detail": "1.inp"}]
+        with mock.patch("builtins.input", return_value="n"), mock.patch("builtins.print"):
+            self.assertEqual(review_failures(results), {"b.py"})
+        with mock.patch("builtins.input", return_value="y"), mock.patch("builtins.print"):
+            self.assertEqual(review_failures(results), set())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+"""Test module for driver recycling."""
+
+import unittest
+import sys
+import os
+import time
+
+# Add the parent directory to the path to import the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from codefun_autosubmit.core.recycle import RecyclePolicy
+from codefun_autosubmit.core.submission import SubmissionManager
+
+
+class FakeDriver:
+    """Driver that only records whether it was quit."""
+
+    def __init__(self):
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+class TestRecycle(unittest.TestCase):
+    """Test recycle thresholds and driver replacement."""
+
+    def test_policy_reasons(self):
+        """Test each threshold and that 0 disables it."""
+        policy = RecyclePolicy(max_age=60, max_pages=10, max_rss_mb=0)
+        now = time.monotonic()
+        self.assertIsNone(policy.reason(FakeDriver(), now, 9))
+        self.assertEqual(policy.reason(FakeDriver(), now, 10), "page count")
+        self.assertEqual(policy.reason(FakeDriver(), now - 60, 0), "age")
+        self.assertIsNone(RecyclePolicy(0, 0, 0).reason(FakeDriver(), now - 1e6, 10 ** 6))
+
+    def test_manager_replaces_driver(self):
+        """Test that the manager swaps drivers once the page budget is spent."""
+        drivers = []
+
+        def factory():
+            drivers.append(FakeDriver())
+            return drivers[-1]
+
+        manager = SubmissionManager(driver_factory=factory,
+                                    recycle_policy=RecyclePolicy(max_age=0, max_pages=3, max_rss_mb=0))
+        for _ in range(7):
+            manager.before_page_load()
+
+        self.assertEqual(len(drivers), 3)
+        self.assertTrue(drivers[0].quit_called and drivers[1].quit_called)
+        self.assertIs(manager.driver, drivers[2])
+        self.assertEqual(manager.page_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
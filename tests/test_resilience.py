@@ -0,0 +1,102 @@
+"""Test module for the retry and circuit-breaker layer."""
+
+import unittest
+import sys
+import os
+
+# Add the parent directory to the path to import the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from selenium.common.exceptions import InvalidSessionIdException, TimeoutException
+from codefun_autosubmit.core.errors import ServerError, SubmitUncertainError, classify
+from codefun_autosubmit.core.resilience import CircuitBreaker, ResilientManager
+
+
+class FlakyManager:
+    """Manager that raises queued errors before succeeding."""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+        self.recycled = 0
+        self.driver_factory = object
+
+    def submit_file(self, filename):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return filename
+
+    def recycle_driver(self):
+        self.recycled += 1
+
+
+class TestResilience(unittest.TestCase):
+    """Test failure classification, retries and the circuit breaker."""
+
+    def setUp(self):
+        self.sleeps = []
+
+    def wrap(self, manager, retries=3, breaker=None):
+        return ResilientManager(manager, retries=retries, base_delay=1, breaker=breaker,
+                                sleep=self.sleeps.append)
+
+    def test_classify(self):
+        """Test that failures map to the right kind."""
+        self.assertEqual(classify(TimeoutException()), "transient")
+        self.assertEqual(classify(InvalidSessionIdException()), "driver")
+        self.assertEqual(classify(ServerError("502")), "server")
+        self.assertIsNone(classify(Exception("File not found")))
+
+    def test_retries_then_succeeds(self):
+        """Test that transient failures are retried with bounded jittered delays."""
+        manager = FlakyManager([TimeoutException(), TimeoutException()])
+        self.assertEqual(self.wrap(manager).submit_file("P00001.cpp"), "P00001.cpp")
+        self.assertEqual(manager.calls, 3)
+        self.assertEqual(len(self.sleeps), 2)
+        self.assertTrue(0 <= self.sleeps[0] <= 2 and 0 <= self.sleeps[1] <= 4)
+
+    def test_uncertain_submit_not_retried(self):
+        """Test that a submission which may have been sent is never sent again."""
+        manager = FlakyManager([SubmitUncertainError("read timed out")])
+        with self.assertRaises(SubmitUncertainError):
+            self.wrap(manager).submit_file("P00001.cpp")
+        self.assertEqual(manager.calls, 1)
+
+    def test_dead_driver_respawned(self):
+        """Test that a dead driver is replaced before retrying."""
+        manager = FlakyManager([InvalidSessionIdException()])
+        self.wrap(manager).submit_file("P00001.cpp")
+        self.assertEqual(manager.recycled, 1)
+
+    def test_fatal_not_retried(self):
+        """Test that unclassified errors are raised immediately."""
+        manager = FlakyManager([Exception("File not found")])
+        with self.assertRaises(Exception):
+            self.wrap(manager).submit_file("P00001.cpp")
+        self.assertEqual(manager.calls, 1)
+
+    def test_gives_up_after_retries(self):
+        """Test that the last error is raised once retries run out."""
+        manager = FlakyManager([TimeoutException()] * 5)
+        with self.assertRaises(TimeoutException):
+            self.wrap(manager, retries=2).submit_file("P00001.cpp")
+        self.assertEqual(manager.calls, 3)
+
+    def test_breaker_pauses_queue(self):
+        """Test that repeated outages open the breaker and pause the next call."""
+        breaker = CircuitBreaker(threshold=2, cooldown=100, sleep=self.sleeps.append)
+        manager = FlakyManager([ServerError("503"), ServerError("503")])
+        wrapped = self.wrap(manager, retries=0, breaker=breaker)
+        for _ in range(2):
+            with self.assertRaises(ServerError):
+                wrapped.submit_file("P00001.cpp")
+        self.assertTrue(breaker.is_open)
+
+        wrapped.submit_file("P00001.cpp")
+        self.assertGreater(self.sleeps[-1], 90)
+        self.assertFalse(breaker.is_open)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+"""Test module for submitted source hashes."""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Add the parent directory to the path to import the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from codefun_autosubmit.core.source_hashes import SourceHashes, normalize_source
+
+
+class TestSourceHashes(unittest.TestCase):
+    """Test normalization and unchanged-source detection."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.hashes = SourceHashes(os.path.join(self.tmp.name, "sources.db"))
+        self.path = self.write("P00001.py", "print(1)\n")
+
+    def tearDown(self):
+        self.hashes.close()
+        self.tmp.cleanup()
+
+    def write(self, name, text):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", newline="") as f:
+            f.write(text)
+        return path
+
+    def test_normalize_source(self):
+        """Test formatting-only differences normalize away."""
+        self.assertEqual(normalize_source("\ufeffa = 1  \r\nb = 2\r\n\r\n"), "a = 1\nb = 2")
+        self.assertNotEqual(normalize_source("a = 1"), normalize_source("a = 2"))
+
+    def test_unchanged_after_submission(self):
+        """Test a recorded file counts as unchanged until its code changes."""
+        self.assertFalse(self.hashes.is_unchanged("P00001", "Python3", self.path))
+        self.hashes.record_file("P00001", "Python3", self.path, 10)
+        self.assertTrue(self.hashes.is_unchanged("P00001", "Python3", self.path))
+        self.assertFalse(self.hashes.is_unchanged("P00001", "C++", self.path))
+
+        self.write("P00001.py", "print(1)   \r\n\r\n")
+        self.assertTrue(self.hashes.is_unchanged("P00001", "Python3", self.path))
+        self.write("P00001.py", "print(2)\n")
+        self.assertFalse(self.hashes.is_unchanged("P00001", "Python3", self.path))
+
+    def test_code_as_sent_is_recorded(self):
+        """Test the submitted code is hashed, not an edit saved after it was sent."""
+        self.hashes.record_code("P00001", "Python3", "print(1)\n", 11)
+        self.write("P00001.py", "print(2)\n")
+        self.assertFalse(self.hashes.is_unchanged("P00001", "Python3", self.path))
+        self.write("P00001.py", "print(1)\n")
+        self.assertTrue(self.hashes.is_unchanged("P00001", "Python3", self.path))
+
+    def test_older_submissions_do_not_overwrite(self):
+        """Test seeding from an older fetched submission keeps the newer hash."""
+        self.hashes.record("P00001", "Python3", "new", 20)
+        self.hashes.record("P00001", "Python3", "old", 5)
+        self.assertEqual(self.hashes.last("P00001"), ("Python3", "new"))
+        self.hashes.record("P00001", "Python3", "newest", 21)
+        self.assertEqual(self.hashes.last("P00001"), ("Python3", "newest"))
+
+    def test_missing_files_are_not_unchanged(self):
+        """Test a file that is gone is never reported as unchanged."""
+        self.hashes.record_file("P00002", "Python3", os.path.join(self.tmp.name, "missing.py"))
+        self.assertIsNone(self.hashes.last("P00002"))
+        self.assertFalse(self.hashes.is_unchanged("P00002", "Python3", "/missing.py"))
+
+
+if __name__ == '__main__':
+    unittest.main()
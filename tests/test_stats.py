@@ -0,0 +1,87 @@
+"""Test module for the shared stats cache."""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Add the parent directory to the path to import the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from codefun_autosubmit.core.session import SessionStore
+from codefun_autosubmit.core.stats import StatsClient
+from tests.stub_server import StubCodefun
+
+
+def row(code, score, max_score=100, submission_id=1):
+    """Build a stats row like Codefun returns."""
+    return {"problem": {"code": code}, "score": score, "maxScore": max_score,
+            "submissionId": submission_id}
+
+
+class TestStatsClient(unittest.TestCase):
+    """Test snapshot indexing, TTL caching and revalidation."""
+
+    def setUp(self):
+        self.stub = StubCodefun().start()
+        self.stub.stats = [row("P00001", 100, submission_id=11), row("P00002", 40, submission_id=12),
+                           row("P00003", 100, submission_id=13)]
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store_path = os.path.join(self.tmp.name, "stats-cache.json")
+
+    def tearDown(self):
+        self.stub.stop()
+        self.tmp.cleanup()
+
+    def client(self, ttl=60):
+        return StatsClient("user", base_url=self.stub.url, ttl=ttl,
+                           store=SessionStore("stats", path=self.store_path))
+
+    def stats_requests(self):
+        return [path for _, path in self.stub.requests if path.endswith("/stats")]
+
+    def test_snapshot_indexes(self):
+        """Test accepted and submitted sets and accepted submissions."""
+        snapshot = self.client().snapshot()
+        self.assertEqual(snapshot.accepted, {"P00001", "P00003"})
+        self.assertEqual(snapshot.submitted, {"P00001", "P00002", "P00003"})
+        self.assertEqual(snapshot.accepted_problems(), ["P00001", "P00003"])
+        self.assertEqual(snapshot.accepted_submissions(), [[11, "P00001"], [13, "P00003"]])
+
+    def test_accepted_submissions_by_language(self):
+        """Test rows in another language are dropped and rows without one are kept."""
+        self.stub.stats[0]["language"] = {"code": "PAS", "name": "Pascal"}
+        self.stub.stats.append(dict(row("P00004", 100, submission_id=14), language="C++"))
+        snapshot = self.client().snapshot()
+        self.assertEqual(snapshot.accepted_submissions("C++"), [[13, "P00003"], [14, "P00004"]])
+        self.assertEqual(len(snapshot.accepted_submissions()), 3)
+
+    def test_ttl_is_shared_through_disk(self):
+        """Test a second client within the TTL reads the cache without a request."""
+        self.client().snapshot()
+        self.client().snapshot()
+        self.assertEqual(len(self.stats_requests()), 1)
+
+    def test_revalidation(self):
+        """Test expired snapshots are revalidated and only re-read when changed."""
+        client = self.client(ttl=0)
+        first = client.snapshot()
+        self.assertIs(client.snapshot(), first)
+        self.assertEqual(len(self.stats_requests()), 2)
+
+        self.stub.stats.append(row("P00004", 100))
+        self.assertIn("P00004", client.snapshot().accepted)
+
+    def test_stale_snapshot_when_offline(self):
+        """Test a cached snapshot is used when the server is down."""
+        self.client().snapshot()
+        self.stub.stop()
+        self.assertEqual(self.client(ttl=0).snapshot().accepted, {"P00001", "P00003"})
+
+        os.remove(self.store_path)
+        with self.assertRaises(Exception):
+            self.client(ttl=0).snapshot()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+"""Test module for filling the submit form."""
+
+import unittest
+import sys
+import os
+import tempfile
+from unittest import mock
+
+# Add the parent directory to the path to import the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from selenium.webdriver.common.keys import Keys
+from codefun_autosubmit.core import submission
+from codefun_autosubmit.core.browser import set_field_value
+
+
+class TestFormFilling(unittest.TestCase):
+    """Test the source is set on the textarea instead of pasted from the clipboard."""
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, "P00001.py")
+        self.source = "print('hello')\n# ünïcode\n"
+        with open(self.path, "w") as f:
+            f.write(self.source)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def assert_value_set(self, driver, element, value):
+        script, *args = driver.execute_script.call_args.args
+        self.assertIn("Object.getOwnPropertyDescriptor(proto, 'value').set.call", script)
+        self.assertIn("new Event('input'", script)
+        self.assertEqual(args, [element, value])
+
+    def test_set_field_value(self):
+        """Test the native value setter is called with the element and text."""
+        driver, textarea = mock.Mock(), mock.Mock()
+        set_field_value(driver, textarea, self.source)
+        self.assert_value_set(driver, textarea, self.source)
+
+    def test_query_fills_source_without_clipboard(self):
+        """Test Query sets the source through the DOM, with no paste shortcut."""
+        driver = mock.Mock()
+        pcode, language, textarea, button = mock.Mock(), mock.Mock(), mock.Mock(), mock.Mock()
+        with mock.patch.object(submission, "load_page"), \
+                mock.patch.object(submission, "ensure_login", return_value="Success"), \
+                mock.patch.object(submission, "wait_for", return_value=(pcode, language, textarea, button)), \
+                mock.patch.object(submission, "Select"):
+            submission.Query(driver, self.path, "Python3", "P00001", submit=False)
+
+        self.assert_value_set(driver, textarea, self.source)
+        pcode.send_keys.assert_called_once_with("P00001")
+        textarea.send_keys.assert_not_called()
+        for element in (driver, pcode, language, button):
+            for _, args, _ in element.mock_calls:
+                self.assertNotIn(Keys.CONTROL, args)
+        self.assertNotIn("pyperclip", sys.modules)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+"""Test module for the persistent submission queue."""
+
+import unittest
+import sys
+import os
+import tempfile
+import time
+from unittest import mock
+
+# Add the parent directory to the path to import the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from codefun_autosubmit.core import submission_queue
+from codefun_autosubmit.core.submission_queue import SubmissionQueue
+
+
+class TestSubmissionQueue(unittest.TestCase):
+    """Test job state transitions and recovery."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "queue.db")
+        self.queue = SubmissionQueue(self.path)
+
+    def tearDown(self):
+        self.queue.close()
+        self.tmp.cleanup()
+
+    def test_jobs_move_from_queued_to_judged(self):
+        """Test a job's full lifecycle."""
+        job_id = self.queue.enqueue("/src/P001.cpp", "P001", "C++")
+        job = self.queue.claim_next()
+        self.assertEqual(job["id"], job_id)
+        self.assertEqual(job["state"], "submitting")
+        self.assertEqual(job["owner_pid"], os.getpid())
+        self.assertIsNone(self.queue.claim_next())
+
+        self.queue.mark_submitted(job_id, 42)
+        self.queue.mark_judged(42, "AC", 100)
+        self.assertEqual(self.queue.jobs("judged")[0]["result"], "AC")
+        self.assertEqual(self.queue.counts()["judged"], 1)
+
+    def test_enqueue_skips_active_problems(self):
+        """Test a problem is not queued twice until its job is done."""
+        self.assertIsNotNone(self.queue.enqueue("/src/P001.cpp", "P001", "C++"))
+        self.assertIsNone(self.queue.enqueue("/src/P001.cpp", "P001", "C++"))
+
+        job = self.queue.claim_next()
+        self.queue.mark_submitted(job["id"], 7)
+        self.assertIsNone(self.queue.enqueue("/src/P001.cpp", "P001", "C++"))
+
+        self.queue.mark_judged(7, "WA", 0)
+        self.assertIsNotNone(self.queue.enqueue("/src/P001.cpp", "P001", "C++"))
+
+    def test_untracked_submissions_expire(self):
+        """Test submissions without an ID stop blocking after the TTL."""
+        self.queue.enqueue("/src/P002.py", "P002", "Python3")
+        job = self.queue.claim_next()
+        self.queue.mark_submitted(job["id"], None)
+        self.assertIsNone(self.queue.enqueue("/src/P002.py", "P002", "Python3"))
+
+        original = submission_queue.UNTRACKED_TTL
+        submission_queue.UNTRACKED_TTL = -1
+        try:
+            self.assertIsNotNone(self.queue.enqueue("/src/P002.py", "P002", "Python3"))
+        finally:
+            submission_queue.UNTRACKED_TTL = original
+
+    def test_unjudged_submissions_expire(self):
+        """Test a submission whose verdict was never recorded stops blocking after the TTL."""
+        self.queue.enqueue("/src/P003.cpp", "P003", "C++")
+        job = self.queue.claim_next()
+        self.queue.mark_submitted(job["id"], 9)
+        self.assertIsNone(self.queue.enqueue("/src/P003.cpp", "P003", "C++"))
+
+        self.queue.db.execute("UPDATE jobs SET updated_at = ? WHERE id = ?",
+                              (time.time() - submission_queue.VERDICT_TTL - 1, job["id"]))
+        self.assertIsNotNone(self.queue.enqueue("/src/P003.cpp", "P003", "C++"))
+
+    def test_pid_check_does_not_signal(self):
+        """Test liveness checks never send a signal (os.kill terminates processes on Windows)."""
+        fake_psutil = mock.Mock(pid_exists=mock.Mock(return_value=True))
+        with mock.patch("os.kill") as kill, mock.patch.object(submission_queue, "psutil", fake_psutil):
+            self.assertTrue(submission_queue.pid_alive(1234))
+        kill.assert_not_called()
+        fake_psutil.pid_exists.assert_called_once_with(1234)
+
+    def test_queue_survives_reopening(self):
+        """Test jobs persist and dead claims are settled without being requeued."""
+        self.queue.enqueue("/src/P001.cpp", "P001", "C++")
+        self.queue.enqueue("/src/P002.cpp", "P002", "C++")
+        job = self.queue.claim_next()
+        self.queue._update("id = ?", (job["id"],), owner_pid=2 ** 22 + 1)
+        self.queue.close()
+
+        self.queue = SubmissionQueue(self.path)
+        self.assertEqual(self.queue.recover(), 1)
+        self.assertEqual([j["problem_code"] for j in self.queue.jobs("queued")], ["P002"])
+        self.assertEqual([j["problem_code"] for j in self.queue.jobs("submitted")], ["P001"])
+
+    def test_dead_claims_are_not_resubmitted(self):
+        """Test a job that may have reached the judge is untracked, not sent again."""
+        self.queue.enqueue("/src/P001.cpp", "P001", "C++")
+        job = self.queue.claim_next()
+        self.queue._update("id = ?", (job["id"],), owner_pid=2 ** 22 + 1)
+        self.queue.recover()
+
+        recovered = self.queue.jobs()[0]
+        self.assertEqual(recovered["state"], "submitted")
+        self.assertIsNone(recovered["submission_id"])
+        self.assertIsNone(self.queue.claim_next())
+        self.assertIsNone(self.queue.enqueue("/src/P001.cpp", "P001", "C++"))
+
+    def test_live_claims_are_not_recovered(self):
+        """Test a job held by a running process stays claimed."""
+        self.queue.enqueue("/src/P001.cpp", "P001", "C++")
+        self.queue.claim_next()
+        self.assertEqual(self.queue.recover(), 0)
+
+    def test_release_and_discard(self):
+        """Test released jobs go back in order and discard only drops queued jobs."""
+        first = self.queue.enqueue("/src/P001.cpp", "P001", "C++")
+        second = self.queue.enqueue("/src/P002.cpp", "P002", "C++")
+        job = self.queue.claim_next()
+        self.queue.release(job["id"])
+        self.assertEqual(self.queue.claim_next()["id"], first)
+
+        self.queue.discard([first, second])
+        self.assertEqual([j["id"] for j in self.queue.jobs()], [first])
+
+
+if __name__ == '__main__':
+    unittest.main()
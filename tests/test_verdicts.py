@@ -0,0 +1,92 @@
+"""Test module for background verdict tracking."""
+
+import unittest
+import sys
+import os
+import time
+from unittest import mock
+
+# Add the parent directory to the path to import the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from codefun_autosubmit.core.http import CodefunClient
+from codefun_autosubmit.core.verdicts import VerdictTracker, finish_tracker, is_pending
+from tests.stub_server import StubCodefun
+
+
+class TestVerdictTracker(unittest.TestCase):
+    """Test polling verdicts from a local stand-in server."""
+
+    def setUp(self):
+        self.stub = StubCodefun().start()
+        self.client = CodefunClient("user", "pass", base_url=self.stub.url, store=False)
+        self.seen = []
+        self.tracker = VerdictTracker(self.client, poll_interval=0.05, max_interval=0.1,
+                                      on_verdict=self.seen.append)
+
+    def tearDown(self):
+        self.tracker.stop()
+        self.client.close()
+        self.stub.stop()
+
+    def test_is_pending(self):
+        """Test which results count as not final."""
+        self.assertTrue(is_pending(None))
+        self.assertTrue(is_pending("Q"))
+        self.assertFalse(is_pending("AC"))
+
+    def test_tracks_until_judged(self):
+        """Test that verdicts are picked up as they arrive."""
+        first = self.client.submit("P00001", "C++", "a")
+        second = self.client.submit("P00002", "C++", "b")
+        self.stub.verdicts[first] = {"result": "AC", "score": 100}
+
+        self.tracker.track(first, "P00001")
+        self.tracker.track(second, "P00002")
+        self.assertFalse(self.tracker.wait(timeout=0.5))
+        self.assertEqual(self.tracker.pending_count(), 1)
+        self.assertEqual([entry["problem_code"] for entry in self.seen], ["P00001"])
+
+        self.stub.verdicts[second] = {"result": "WA", "score": 30}
+        self.assertTrue(self.tracker.wait(timeout=2))
+        results = {entry["problem_code"]: entry["result"] for entry in self.tracker.results()}
+        self.assertEqual(results, {"P00001": "AC", "P00002": "WA"})
+
+    def test_failing_callback_keeps_tracking(self):
+        """Test that an on_verdict error is reported and later verdicts still arrive."""
+        def on_verdict(entry):
+            self.seen.append(entry)
+            if entry["problem_code"] == "P00001":
+                raise ValueError("database is locked")
+
+        self.tracker.on_verdict = on_verdict
+        first = self.client.submit("P00001", "C++", "a")
+        second = self.client.submit("P00002", "C++", "b")
+        self.stub.verdicts[first] = {"result": "AC", "score": 100}
+        self.stub.verdicts[second] = {"result": "WA", "score": 30}
+        with mock.patch("builtins.print") as printed:
+            self.tracker.track(first, "P00001")
+            self.assertTrue(self.tracker.wait(timeout=2))
+            self.tracker.track(second, "P00002")
+            self.assertTrue(self.tracker.wait(timeout=2))
+            # The callback runs just after the verdict is stored
+            for _ in range(50):
+                if len(self.seen) == 2:
+                    break
+                time.sleep(0.02)
+        self.assertEqual([entry["problem_code"] for entry in self.seen], ["P00001", "P00002"])
+        self.assertIn("database is locked", str(printed.call_args_list))
+
+    def test_finish_tracker_interrupted(self):
+        """Test that Ctrl+C while waiting still prints the results and stops the tracker."""
+        self.tracker.track(self.client.submit("P00001", "C++", "a"), "P00001")
+        with mock.patch.object(self.tracker, "wait", side_effect=KeyboardInterrupt), \
+                mock.patch.object(self.tracker, "print_results") as print_results, \
+                mock.patch("builtins.print"):
+            finish_tracker(self.tracker)
+        print_results.assert_called_once()
+        self.assertTrue(self.tracker.stopped)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""Test module for the readiness wait engine."""
+
+import unittest
+import sys
+import os
+import time
+from unittest import mock
+
+# Add the parent directory to the path to import the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from selenium.common.exceptions import TimeoutException
+from codefun_autosubmit.core import browser, waits
+
+
+class FakeElement:
+    """Stand-in for a located WebElement."""
+
+    def __init__(self, text=""):
+        self.text = text
+
+
+class FakeDriver:
+    """Driver whose DOM is a dict of XPath -> element, appearing after a delay."""
+
+    def __init__(self, dom, delay=0.0):
+        self.dom = dom
+        self.ready_at = time.monotonic() + delay
+
+    def find_elements(self, by, xpath):
+        if time.monotonic() < self.ready_at or xpath not in self.dom:
+            return []
+        return [self.dom[xpath]]
+
+
+class TestWaits(unittest.TestCase):
+    """Test named conditions."""
+
+    def test_wait_for_returns_elements(self):
+        """Test that a condition returns as soon as its elements render."""
+        textarea = FakeElement()
+        driver = FakeDriver({
+            waits.PROBLEM_CODE_XPATH: FakeElement(),
+            waits.LANGUAGE_SELECT_XPATH: FakeElement(),
+            waits.SOURCE_XPATH: textarea,
+            waits.SUBMIT_BUTTON_XPATH: FakeElement(),
+        }, delay=0.2)
+
+        start = time.monotonic()
+        elements = waits.wait_for(driver, "submit_form")
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertIs(elements[2], textarea)
+
+    def test_wait_for_times_out(self):
+        """Test that a missing condition raises after its timeout."""
+        with self.assertRaises(TimeoutException):
+            waits.wait_for(FakeDriver({}), "login_form", timeout=0.2)
+
+    def test_code_needs_language_text(self):
+        """Test that submission code only counts once the language is rendered."""
+        dom = {waits.CODE_XPATH: FakeElement("code"),
+               waits.SUBMISSION_LANGUAGE_XPATH: FakeElement("")}
+        self.assertFalse(waits.code_rendered(FakeDriver(dom)))
+        dom[waits.SUBMISSION_LANGUAGE_XPATH].text = "C++"
+        self.assertTrue(waits.code_rendered(FakeDriver(dom)))
+
+    def test_wait_for_any(self):
+        """Test that the first holding condition is reported by name."""
+        name, _ = waits.wait_for_any(FakeDriver({}), ["submit_form", "logged_in"], timeout=1)
+        self.assertEqual(name, "logged_in")
+
+        driver = FakeDriver({waits.LOGIN_USER_XPATH: FakeElement()})
+        with self.assertRaises(TimeoutException):
+            waits.wait_for_any(driver, ["submit_form", "logged_in"], timeout=0.2)
+
+
+class TestPageHelpers(unittest.TestCase):
+    """Test page loading and login checks built on the conditions."""
+
+    def test_load_page_accepts_old_wait_time(self):
+        """Test the deprecated positional wait time still sets an implicit wait."""
+        driver = mock.Mock()
+        with self.assertWarns(DeprecationWarning):
+            self.assertIsNone(browser.load_page(driver, "https://codefun.vn/submit", 5))
+        driver.get.assert_called_once_with("https://codefun.vn/submit")
+        driver.implicitly_wait.assert_called_once_with(5)
+
+    def test_ensure_login_waits_for_late_login_form(self):
+        """Test a login form rendered after the page loaded is still used."""
+        driver = FakeDriver({waits.LOGIN_USER_XPATH: FakeElement(),
+                             waits.LOGIN_PASS_XPATH: FakeElement(),
+                             waits.SUBMIT_BUTTON_XPATH: FakeElement()}, delay=0.2)
+        with mock.patch.object(browser, "login_to_codefun", return_value="Error") as login:
+            self.assertEqual(browser.ensure_login(driver), "Error")
+        login.assert_called_once_with(driver)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""Test module for the solutions folder watcher."""
+
+import unittest
+import sys
+import os
+import tempfile
+import time
+
+# Add the parent directory to the path to import the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from codefun_autosubmit.core import watch
+from codefun_autosubmit.core.watch import FolderWatcher, solution_info
+
+
+class TestFolderWatcher(unittest.TestCase):
+    """Test change detection, debouncing and filtering."""
+
+    use_polling = True
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, "P00001.py")
+        self.write(self.path, "print(1)")
+        self.changes = []
+        self.watcher = FolderWatcher(self.folder.name, self.changes.append, debounce=0.3,
+                                     poll_interval=0.05, use_polling=self.use_polling).start()
+
+    def tearDown(self):
+        self.watcher.stop()
+        self.folder.cleanup()
+
+    def write(self, path, text):
+        with open(path, "w") as f:
+            f.write(text)
+        # Make sure the poller sees a new mtime even on coarse clocks
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    def settle(self, seconds=1.0):
+        time.sleep(seconds)
+
+    def test_rapid_saves_are_reported_once(self):
+        """Test several quick saves produce one change after they settle."""
+        for index in range(3):
+            self.write(self.path, f"print({index + 2})")
+            time.sleep(0.05)
+        self.settle()
+        self.assertEqual(self.changes, [self.path])
+
+    def test_unchanged_contents_are_ignored(self):
+        """Test saving the same contents again is not a change."""
+        self.write(self.path, "print(1)")
+        self.settle()
+        self.assertEqual(self.changes, [])
+
+    def test_new_and_ignored_files(self):
+        """Test new solutions are reported and other files are not."""
+        new_path = os.path.join(self.folder.name, "P00002.cpp")
+        self.write(new_path, "int main() {}")
+        self.write(os.path.join(self.folder.name, "notes.txt"), "todo")
+        self.write(os.path.join(self.folder.name, "pass.py"), "secret")
+        self.settle()
+        self.assertEqual(self.changes, [new_path])
+
+    def test_solution_info(self):
+        """Test problem codes and languages follow get_loop_list's rules."""
+        self.assertEqual(solution_info("/x/P00001.cpp"), ("P00001", "C++"))
+        self.assertIsNone(solution_info("/x/P00001.txt"))
+        self.assertIsNone(solution_info("/x/README"))
+
+
+@unittest.skipIf(watch.Observer is None, "watchdog is not installed")
+class TestFolderWatcherEvents(TestFolderWatcher):
+    """Run the same checks with file system events."""
+
+    use_polling = False
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Test module for the workspace index."""
+
+import unittest
+import sys
+import os
+import tempfile
+from unittest import mock
+
+# Add the parent directory to the path to import the package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from codefun_autosubmit.core.session import SessionStore
+from codefun_autosubmit.core.submission import SubmissionManager
+from codefun_autosubmit.core.workspace import WorkspaceIndex
+
+
+class TestWorkspaceIndex(unittest.TestCase):
+    """Test lookups, filters and cached folder listings."""
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.root = self.folder.name
+        self.store_path = os.path.join(self.root, ".cache", "workspace.json")
+        os.makedirs(os.path.dirname(self.store_path))
+        for name in ["P00001.cpp", "P00001.py", "P00002.pas", "pass.cpp", "notes.txt",
+                     "contest/P00003.cpp", "contest/P00001.cpp", "old/P00004.cpp", ".git/P00005.cpp"]:
+            self.write(name)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def write(self, name):
+        path = os.path.join(self.root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write("")
+
+    def age(self):
+        """Backdate every folder so its listing may be reused."""
+        for dirpath, _, _ in os.walk(self.root):
+            os.utime(dirpath, (1, 1))
+
+    def index(self, **kwargs):
+        kwargs.setdefault("store", SessionStore("workspace", path=self.store_path))
+        kwargs.setdefault("recursive", True)
+        return WorkspaceIndex(self.root, **kwargs)
+
+    def test_find(self):
+        """Test lookups prefer the given language and files nearer the root."""
+        index = self.index()
+        self.assertEqual(index.find("P00001", "Python3"), (os.path.join(self.root, "P00001.py"), "Python3"))
+        self.assertEqual(index.find("P00001", "Pascal"), (os.path.join(self.root, "P00001.cpp"), "C++"))
+        self.assertEqual(index.find("P00003")[0], os.path.join(self.root, "contest/P00003.cpp"))
+        self.assertIsNone(index.find("P00005"))
+        self.assertEqual(index.files("C++"),
+                         ["P00001.cpp", "P00002.pas", "contest/P00003.cpp", "old/P00004.cpp"])
+
+    def test_filters(self):
+        """Test include and exclude globs and non-recursive indexes."""
+        self.assertNotIn("P00004", self.index(exclude=["old"]))
+        self.assertEqual(self.index(include=["*.cpp"]).files(),
+                         ["P00001.cpp", "contest/P00003.cpp", "old/P00004.cpp"])
+        self.assertEqual(len(self.index(recursive=False)), 2)
+
+    def test_subfolders_need_opting_in(self):
+        """Test only the top folder is indexed unless WORKSPACE_RECURSIVE is set."""
+        with mock.patch.dict(os.environ, {"HOME": self.root, "APPDATA": self.root}):
+            os.environ.pop("WORKSPACE_RECURSIVE", None)
+            self.assertEqual(WorkspaceIndex(self.root, store=False).files(), ["P00001.cpp", "P00002.pas"])
+            os.environ["WORKSPACE_RECURSIVE"] = "1"
+            self.assertIn("P00003", WorkspaceIndex(self.root, store=False))
+
+    def test_unchanged_folders_are_not_listed(self):
+        """Test a later scan only lists folders whose entries changed."""
+        self.age()
+        self.assertEqual(self.index().scan(), 3)
+        self.assertEqual(self.index().scan(), 0)
+
+        self.write("contest/P00006.cpp")
+        os.utime(os.path.join(self.root, "contest"), (2, 2))
+        index = self.index()
+        self.assertEqual(index.scan(), 1)
+        self.assertIn("P00006", index)
+
+    def test_find_file(self):
+        """Test submit_by_id's lookup works with forward-slash paths."""
+        manager = SubmissionManager(backend="http", client=object())
+        with mock.patch.dict(os.environ, {"HOME": self.root, "APPDATA": self.root}), \
+                mock.patch("builtins.print"):
+            os.environ["WORKSPACE_RECURSIVE"] = "1"
+            self.assertEqual(manager.find_file("00003", "C++", self.root),
+                             (os.path.join(self.root, "contest/P00003.cpp"), "C++"))
+            with self.assertRaises(Exception):
+                manager.find_file("00009", "C++", self.root)
+
+
+if __name__ == '__main__':
+    unittest.main()